@@ -1,7 +1,7 @@
 """音声認識エンジンの抽象基底クラス（Template Method実装）"""
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, Callable, Protocol
+from typing import Optional, Dict, Any, List, Tuple, Callable, Protocol
 import numpy as np
 import logging
 
@@ -290,6 +290,24 @@ class BaseEngine(ABC):
         """
         pass
         
+    def transcribe_batch(
+        self, audio_chunks: List[np.ndarray], sample_rate: int
+    ) -> List[Tuple[str, float]]:
+        """
+        複数の音声チャンクを文字起こしする
+
+        デフォルト実装は transcribe() を順に呼び出す。
+        バッチ推論に対応するエンジンはオーバーライドする。
+
+        Args:
+            audio_chunks: 音声データ（numpy配列）のリスト
+            sample_rate: サンプリングレート（全チャンク共通）
+
+        Returns:
+            チャンク毎の(transcription_text, confidence_score)のリスト
+        """
+        return [self.transcribe(audio_data, sample_rate) for audio_data in audio_chunks]
+
     @abstractmethod
     def get_engine_name(self) -> str:
         """エンジン名を取得"""
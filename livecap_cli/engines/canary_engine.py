@@ -1,14 +1,18 @@
 """NVIDIA Canary 1B v2エンジンの実装 - Template Method版"""
 import os
+import shutil
 import sys
 import logging
+import threading
 import warnings
 import tempfile
+from math import gcd
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from io import StringIO
 import numpy as np
 import soundfile as sf
+from scipy.signal import resample_poly
 
 from .base_engine import BaseEngine
 from .model_memory_cache import ModelMemoryCache
@@ -23,14 +27,27 @@ from livecap_cli.utils import (
 )
 
 # NeMo framework - 共通モジュールから遅延インポート
-from .nemo_utils import check_nemo_availability, prepare_nemo_environment
+from .nemo_utils import (
+    check_nemo_availability,
+    prepare_nemo_environment,
+    suppress_nemo_logs,
+)
 
 logger = logging.getLogger(__name__)
 
+# 環境変数でstrong cacheが有効な場合は強参照でキャッシュ（モジュール読み込み時に1回だけ評価）
+_STRONG_CACHE = os.environ.get('LIVECAP_ENGINE_STRONG_CACHE', '').lower() in ('1', 'true', 'yes')
+
+# 作成済みのモデルディレクトリ（エンジン再作成時のmkdirシステムコールを省略）
+_PREPARED_MODEL_DIRS: set = set()
+
 
 class CanaryEngine(BaseEngine):
     """NVIDIA Canary 1B Flash音声認識エンジン - Template Method版"""
 
+    # NeMoのtranscribeがndarray入力に対応しているか（None=未確認）
+    _supports_array_input: Optional[bool] = None
+
     def __init__(
         self,
         device: Optional[str] = None,
@@ -55,14 +72,25 @@ class CanaryEngine(BaseEngine):
         self.language = language
         self.model_name = model_name
         self.beam_size = beam_size
+        self._model_basename = f"{model_name.replace('/', '--')}.nemo"
+
+        # Canaryモデルは16kHzを使用（チャンク毎のメソッド呼び出しを避けるため保持）
+        self._required_sr = 16000
 
         super().__init__(device, **kwargs)
         self.model = None
         self._initialized = False
 
+        # WAVフォールバック用の使い回す一時ファイル（初回使用時に作成）
+        self._scratch_dir: Optional[str] = None
+        self._scratch_lock = threading.Lock()
+
         # デバイスの自動検出と設定（共通関数を使用）
         self.torch_device = detect_device(device, "Canary")
 
+        # モデルキャッシュキー（モデル名とデバイスはインスタンス生成後に変わらない）
+        self._cache_key = f"canary_{self.model_name.replace('/', '_')}_{self.torch_device}"
+
         # ライブラリ事前ロードを開始
         LibraryPreloader.start_preloading('canary')
     
@@ -96,7 +124,7 @@ class CanaryEngine(BaseEngine):
 
     def _get_local_model_path(self, models_dir: Path) -> Path:
         """ローカルモデルパスを取得 (base_engine override for .nemo extension)"""
-        return models_dir / f"{self.model_name.replace('/', '--')}.nemo"
+        return models_dir / self._model_basename
 
     def _prepare_model_directory(self) -> Path:
         """
@@ -106,10 +134,12 @@ class CanaryEngine(BaseEngine):
 
         # ローカルモデルディレクトリの設定
         models_dir = get_models_dir()
-        models_dir.mkdir(exist_ok=True)
+        if models_dir not in _PREPARED_MODEL_DIRS:
+            models_dir.mkdir(exist_ok=True)
+            _PREPARED_MODEL_DIRS.add(models_dir)
 
         # モデルファイルのパス
-        local_model_path = models_dir / f"{self.model_name.replace('/', '--')}.nemo"
+        local_model_path = self._get_local_model_path(models_dir)
 
         self.report_progress(15, f"Model path: {local_model_path.name}")
         return local_model_path
@@ -132,28 +162,14 @@ class CanaryEngine(BaseEngine):
         import nemo.collections.asr as nemo_asr
         from nemo.utils import logging as nemo_logging
 
-        # NeMoの警告ログを抑制
-        nemo_logger = logging.getLogger('nemo_logger')
-        original_level = nemo_logger.level
-        nemo_logger.setLevel(logging.ERROR)
-
-        # 追加: Lhotseとデータローダーの警告を抑制
-        lhotse_logger = logging.getLogger('lhotse')
-        lhotse_original_level = lhotse_logger.level
-        lhotse_logger.setLevel(logging.ERROR)
-
-        # NeMo内部の特定警告を抑制
-        nemo_collections_logger = logging.getLogger('nemo.collections')
-        nemo_collections_original = nemo_collections_logger.level
-        nemo_collections_logger.setLevel(logging.ERROR)
-
         manager = model_manager or getattr(self, "model_manager", None)
         if manager is None:
             from livecap_cli.resources import get_model_manager
 
             manager = get_model_manager()
 
-        try:
+        # NeMoの警告ログを抑制
+        with suppress_nemo_logs():
             with unicode_safe_download_directory() as temp_dir:
                 logger.info(f"Using download temporary directory: {temp_dir}")
 
@@ -173,11 +189,6 @@ class CanaryEngine(BaseEngine):
                 del model
 
                 self.report_progress(70, "Model download complete")
-        finally:
-            # すべてのログレベルを元に戻す
-            nemo_logger.setLevel(original_level)
-            lhotse_logger.setLevel(lhotse_original_level)
-            nemo_collections_logger.setLevel(nemo_collections_original)
     
     def _load_model_from_path(self, model_path: Path) -> Any:
         """
@@ -185,8 +196,7 @@ class CanaryEngine(BaseEngine):
         """
         self.report_progress(75, f"Loading model file: {model_path.name}")
 
-        # キャッシュキーを生成
-        cache_key = f"canary_{self.model_name.replace('/', '_')}_{self.torch_device}"
+        cache_key = self._cache_key
 
         # キャッシュから取得を試みる
         cached_model = ModelMemoryCache.get(cache_key)
@@ -203,21 +213,7 @@ class CanaryEngine(BaseEngine):
         from nemo.utils import logging as nemo_logging
 
         # NeMoの警告ログを抑制
-        nemo_logger = logging.getLogger('nemo_logger')
-        original_level = nemo_logger.level
-        nemo_logger.setLevel(logging.ERROR)
-
-        # 追加: Lhotseとデータローダーの警告を抑制
-        lhotse_logger = logging.getLogger('lhotse')
-        lhotse_original_level = lhotse_logger.level
-        lhotse_logger.setLevel(logging.ERROR)
-
-        # NeMo内部の特定警告を抑制
-        nemo_collections_logger = logging.getLogger('nemo.collections')
-        nemo_collections_original = nemo_collections_logger.level
-        nemo_collections_logger.setLevel(logging.ERROR)
-
-        try:
+        with suppress_nemo_logs():
             self.report_progress(80, "Restoring NeMo model...")
 
             # ローカルファイルからロード
@@ -230,20 +226,12 @@ class CanaryEngine(BaseEngine):
             self.report_progress(85, "Model loaded successfully")
 
             # キャッシュに保存
-            # 環境変数でstrong cacheが有効な場合は強参照でキャッシュ
-            use_strong_cache = os.environ.get('LIVECAP_ENGINE_STRONG_CACHE', '').lower() in ('1', 'true', 'yes')
-            ModelMemoryCache.set(cache_key, model, strong=use_strong_cache)
-            logger.info(f"モデルをキャッシュに保存: {cache_key} (strong={use_strong_cache})")
+            ModelMemoryCache.set(cache_key, model, strong=_STRONG_CACHE)
+            logger.info(f"モデルをキャッシュに保存: {cache_key} (strong={_STRONG_CACHE})")
 
             self.report_progress(90, "Canary: Ready")
             return model
 
-        finally:
-            # すべてのログレベルを元に戻す
-            nemo_logger.setLevel(original_level)
-            lhotse_logger.setLevel(lhotse_original_level)
-            nemo_collections_logger.setLevel(nemo_collections_original)
-
     def _configure_model(self) -> None:
         """
         Step 5: モデルの設定（90-100%）
@@ -286,6 +274,46 @@ class CanaryEngine(BaseEngine):
         # Canaryは長時間音声も処理可能
         return self._transcribe_single_chunk(audio_data, sample_rate)
     
+    def transcribe_batch(
+        self, audio_chunks: List[np.ndarray], sample_rate: int
+    ) -> List[Tuple[str, float]]:
+        """
+        複数の音声チャンクを1回のtranscribe呼び出しでまとめて文字起こしする
+
+        Args:
+            audio_chunks: 音声データ（numpy配列）のリスト
+            sample_rate: サンプリングレート（全チャンク共通）
+
+        Returns:
+            チャンク毎の(transcription_text, confidence_score)のリスト
+        """
+        if not self._initialized or self.model is None:
+            raise RuntimeError("Engine not initialized. Call load_model() first.")
+
+        results: List[Tuple[str, float]] = [("", 1.0)] * len(audio_chunks)
+
+        # 短すぎるチャンクは空文字のまま、残りを1バッチにまとめる
+        indices = []
+        prepared = []
+        for i, audio_data in enumerate(audio_chunks):
+            samples = self._prepare_audio(audio_data, sample_rate)
+            if samples is not None:
+                indices.append(i)
+                prepared.append(samples)
+
+        if not prepared:
+            return results
+
+        try:
+            outputs = self._transcribe_prepared(prepared)
+            for i, output in zip(indices, outputs):
+                results[i] = (self._extract_text(output), 1.0)
+            return results
+
+        except Exception as e:
+            logger.error(f"Error during transcription: {e}")
+            raise
+
     def _transcribe_single_chunk(self, audio_data: np.ndarray, sample_rate: int) -> Tuple[str, float]:
         """
         単一の音声チャンクを文字起こしする（内部使用）
@@ -299,104 +327,159 @@ class CanaryEngine(BaseEngine):
         """
         if not self._initialized or self.model is None:
             raise RuntimeError("Engine not initialized. Call load_model() first.")
-            
-        # モデルが要求するサンプリングレートに変換
-        required_sr = self.get_required_sample_rate()
-        if sample_rate != required_sr:
-            import librosa
-            audio_data = librosa.resample(
-                audio_data, 
-                orig_sr=sample_rate, 
-                target_sr=required_sr
-            )
-            
-        # float32に変換し、正規化
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-            
-        # 音声データの正規化（-1.0 から 1.0の範囲）
-        if np.abs(audio_data).max() > 1.0:
-            audio_data = audio_data / np.abs(audio_data).max()
-            
-        # デバッグ: 音声データの情報
-        logger.debug(f"Audio data shape: {audio_data.shape}")
-        logger.debug(f"Audio duration: {len(audio_data) / self.get_required_sample_rate():.2f} seconds")
-        logger.debug(f"Audio max amplitude: {np.abs(audio_data).max():.4f}")
-        
-        # 音声が短すぎる場合の処理
-        min_duration = 0.1  # 最小0.1秒
-        min_samples = int(min_duration * self.get_required_sample_rate())
-        if len(audio_data) < min_samples:
-            logger.warning(f"Audio too short: {len(audio_data)} samples < {min_samples} samples")
+
+        audio_data = self._prepare_audio(audio_data, sample_rate)
+        if audio_data is None:
             return "", 1.0
-            
+
         try:
-            # Canaryのtranscribeメソッドはファイルパスを期待するため、
-            # 一時ファイルを作成して音声を保存
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                tmp_filename = tmp_file.name
-                
-                # 音声データを一時ファイルに保存
-                sf.write(tmp_filename, audio_data, self.get_required_sample_rate())
-                
-            try:
-                # プログレスバーを抑制
-                old_tqdm = os.environ.get('TQDM_DISABLE')
-                os.environ['TQDM_DISABLE'] = '1'
-                
-                # 標準出力を一時的にキャプチャ
-                old_stdout = sys.stdout
-                sys.stdout = StringIO()
-                
-                try:
-                    # 警告を抑制するための環境変数設定
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings("ignore", message="You are using a non-tarred dataset")
-                        warnings.filterwarnings("ignore", message="Function `_transcribe_output_processing` is deprecated")
-                        
-                        # Canaryのtranscribeメソッドを使用
-                        # 言語パラメータを直接指定
-                        outputs = self.model.transcribe(
-                            audio=[tmp_filename],
-                            batch_size=1,
-                            task='asr',  # Automatic Speech Recognition
-                            source_lang=self.language,  # 入力音声の言語
-                            target_lang=self.language,  # ASRの場合は同じ言語
-                            pnc='yes'  # Punctuation and Capitalization
-                        )
-                    
-                finally:
-                    # 標準出力を元に戻す
-                    sys.stdout = old_stdout
-                    
-                    # 環境変数を元に戻す
-                    if old_tqdm is None:
-                        if 'TQDM_DISABLE' in os.environ:
-                            del os.environ['TQDM_DISABLE']
-                    else:
-                        os.environ['TQDM_DISABLE'] = old_tqdm
-                
-                # 結果を取得
-                if outputs and len(outputs) > 0:
-                    text = outputs[0].text if hasattr(outputs[0], 'text') else str(outputs[0])
-                    logger.debug(f"Canary transcription: '{text}'")
-                else:
-                    text = ""
-                    
-                # 信頼度スコア（Canaryでは利用不可）
-                confidence = 1.0
-                
-                return text, confidence
-                
-            finally:
-                # 一時ファイルを削除
-                if os.path.exists(tmp_filename):
-                    os.unlink(tmp_filename)
-                
+            outputs = self._transcribe_prepared([audio_data])
+
+            # 結果を取得
+            if outputs and len(outputs) > 0:
+                text = self._extract_text(outputs[0])
+            else:
+                text = ""
+
+            # 信頼度スコア（Canaryでは利用不可）
+            confidence = 1.0
+
+            return text, confidence
+
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
             raise
-            
+
+    def _prepare_audio(self, audio_data: np.ndarray, sample_rate: int) -> Optional[np.ndarray]:
+        """
+        音声をモデル入力用に変換する（リサンプル・float32化・正規化）
+
+        Returns:
+            変換後の音声。短すぎる場合はNone
+        """
+        required_sr = self._required_sr
+
+        # 音声が短すぎる場合の処理（変換・正規化の前に判定する）
+        # リサンプル後の長さは ceil(n * required_sr / sample_rate) で求まる
+        min_duration = 0.1  # 最小0.1秒
+        min_samples = int(min_duration * required_sr)
+        num_samples = -(-len(audio_data) * required_sr // sample_rate)
+        if num_samples < min_samples:
+            logger.warning(f"Audio too short: {num_samples} samples < {min_samples} samples")
+            return None
+
+        # モデルが要求するサンプリングレートに変換
+        if sample_rate != required_sr:
+            # 整数比のポリフェーズリサンプリング（48kHz→16kHz は 1:3）
+            g = gcd(sample_rate, required_sr)
+            audio_data = resample_poly(audio_data, required_sr // g, sample_rate // g)
+
+        # float32に変換し、正規化（ピーク値は1回だけ計算して再利用）
+        samples = np.ascontiguousarray(audio_data, dtype=np.float32)
+        peak = float(np.abs(samples).max()) if samples.size else 0.0
+
+        # 音声データの正規化（-1.0 から 1.0の範囲）
+        if peak > 1.0:
+            if samples is audio_data:
+                # 呼び出し元のバッファは書き換えない
+                samples = samples / peak
+            else:
+                np.multiply(samples, 1.0 / peak, out=samples)
+            peak = 1.0
+
+        # デバッグ: 音声データの情報（DEBUG無効時は文字列整形を省略）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Audio data shape: {samples.shape}")
+            logger.debug(f"Audio duration: {len(samples) / required_sr:.2f} seconds")
+            logger.debug(f"Audio max amplitude: {peak:.4f}")
+
+        return samples
+
+    def _transcribe_prepared(self, audio_chunks: List[np.ndarray]) -> Any:
+        """変換済みの音声チャンクをCanaryで文字起こしする"""
+        # NeMo 2.x は ndarray を直接受け付けるため、WAVファイルの往復を省略する
+        if CanaryEngine._supports_array_input is not False:
+            try:
+                outputs = self._run_model_transcribe(audio_chunks)
+                CanaryEngine._supports_array_input = True
+                return outputs
+            except (TypeError, ValueError, AttributeError) as e:
+                if CanaryEngine._supports_array_input:
+                    raise
+                # 旧バージョンのNeMoはファイルパスのみ対応
+                logger.debug("ndarray input not supported, falling back to WAV file: %s", e)
+                CanaryEngine._supports_array_input = False
+
+        return self._transcribe_via_wav_file(audio_chunks)
+
+    @staticmethod
+    def _extract_text(output: Any) -> str:
+        """transcribeの出力要素（Hypothesisまたは文字列）からテキストを取り出す"""
+        text = output.text if hasattr(output, 'text') else str(output)
+        logger.debug("Canary transcription: '%s'", text)
+        return text
+
+    def _transcribe_via_wav_file(self, audio_chunks: List[np.ndarray]) -> Any:
+        """一時WAVファイル経由で文字起こしする（ndarray非対応のNeMo用）
+
+        呼び出し毎の作成・削除を避けるため、インスタンス専用の
+        一時ディレクトリ内の同じファイルを上書きして使い回す。
+        """
+        with self._scratch_lock:
+            if self._scratch_dir is None:
+                self._scratch_dir = tempfile.mkdtemp(prefix='livecap_canary_')
+
+            # 音声データを一時ファイルに保存（既存の内容は上書きされる）
+            scratch_paths = []
+            for i, audio_data in enumerate(audio_chunks):
+                scratch_path = os.path.join(self._scratch_dir, f'chunk_{i}.wav')
+                sf.write(scratch_path, audio_data, self._required_sr)
+                scratch_paths.append(scratch_path)
+
+            return self._run_model_transcribe(scratch_paths)
+
+    def _run_model_transcribe(self, audio: list) -> Any:
+        """プログレスバーと標準出力を抑制してCanaryのtranscribeを呼び出す
+
+        Args:
+            audio: ファイルパスまたはndarrayのリスト
+        """
+        # プログレスバーを抑制
+        old_tqdm = os.environ.get('TQDM_DISABLE')
+        os.environ['TQDM_DISABLE'] = '1'
+
+        # 標準出力を一時的にキャプチャ
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+
+        try:
+            # 警告を抑制するための環境変数設定
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", message="You are using a non-tarred dataset")
+                warnings.filterwarnings("ignore", message="Function `_transcribe_output_processing` is deprecated")
+
+                # Canaryのtranscribeメソッドを使用
+                # 言語パラメータを直接指定
+                return self.model.transcribe(
+                    audio=audio,
+                    batch_size=len(audio),
+                    task='asr',  # Automatic Speech Recognition
+                    source_lang=self.language,  # 入力音声の言語
+                    target_lang=self.language,  # ASRの場合は同じ言語
+                    pnc='yes'  # Punctuation and Capitalization
+                )
+
+        finally:
+            # 標準出力を元に戻す
+            sys.stdout = old_stdout
+
+            # 環境変数を元に戻す
+            if old_tqdm is None:
+                if 'TQDM_DISABLE' in os.environ:
+                    del os.environ['TQDM_DISABLE']
+            else:
+                os.environ['TQDM_DISABLE'] = old_tqdm
+
     def get_engine_name(self) -> str:
         """エンジン名を取得"""
         return "NVIDIA Canary 1B Flash"
@@ -408,11 +491,16 @@ class CanaryEngine(BaseEngine):
         
     def get_required_sample_rate(self) -> int:
         """エンジンが要求するサンプリングレートを取得"""
-        # Canaryモデルは16kHzを使用
-        return 16000
+        return self._required_sr
         
     def cleanup(self) -> None:
         """リソースのクリーンアップ"""
+        # 使い回していた一時WAVファイルを削除
+        with self._scratch_lock:
+            if self._scratch_dir is not None:
+                shutil.rmtree(self._scratch_dir, ignore_errors=True)
+                self._scratch_dir = None
+
         if self.model is not None:
             # GPUメモリを解放
             del self.model
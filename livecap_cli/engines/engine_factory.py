@@ -1,36 +1,186 @@
 """音声認識エンジンファクトリー"""
-from typing import Optional, Dict, Any
+from collections.abc import Mapping
+from typing import Optional, Dict, Any, Iterator
+from types import MappingProxyType
+import functools
+import importlib
 import logging
 
 from .base_engine import BaseEngine
-from livecap_cli.i18n import translate
+from livecap_cli.i18n import i18n, translate
 
 logger = logging.getLogger(__name__)
 
-# エンジンメタデータをインポート（新しい中央定義から）
-from .metadata import EngineMetadata
+
+def __getattr__(name: str) -> Any:
+    """EngineMetadata を初回アクセス時に遅延インポートする（PEP 562）
+
+    ``engine_factory.EngineMetadata`` としての既存の参照を維持しつつ、
+    ファクトリーのインポート時にはメタデータを読み込まない。
+    """
+    if name == "EngineMetadata":
+        from .metadata import EngineMetadata
+
+        globals()["EngineMetadata"] = EngineMetadata
+        return EngineMetadata
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _build_engines() -> Mapping[str, Dict[str, Any]]:
+    """EngineMetadataから後方互換用のENGINES辞書を構築（初回のみ、読み取り専用ビュー）"""
+    from .metadata import EngineMetadata
+
+    return MappingProxyType({
+        engine_id: {
+            "module": info.module,
+            "class_name": info.class_name,
+            "name": info.display_name,
+            "description": info.description,
+            "supported_languages": info.supported_languages,
+        }
+        for engine_id, info in EngineMetadata.get_all().items()
+    })
+
+
+@functools.lru_cache(maxsize=64)
+def _get_engine_class(engine_type: str) -> type:
+    """エンジンクラスを遅延インポートで取得（解決済みのクラスはキャッシュ）
+
+    classmethod には lru_cache を適用できないため、モジュール関数として定義する。
+    テストでメタデータを差し替えた場合は ``_get_engine_class.cache_clear()`` で無効化する。
+    """
+    from .metadata import EngineMetadata
+
+    try:
+        engine_info = EngineMetadata.get(engine_type)
+        if engine_info is None:
+            raise KeyError(engine_type)
+        module_name = engine_info.module
+        class_name = engine_info.class_name
+
+        # 動的インポート
+        module = importlib.import_module(module_name, package="livecap_cli.engines")
+        engine_class = getattr(module, class_name)
+
+        return engine_class
+
+    except (ImportError, AttributeError, KeyError) as e:
+        import traceback
+
+        error_details = traceback.format_exc()
+        logger.error(
+            "エンジンクラス '%s' の動的インポートに失敗しました: %s\n%s",
+            engine_type,
+            e,
+            error_details,
+        )
+        # エラーを再送出し、呼び出し元で処理できるようにする
+        raise ValueError(f"Failed to load engine class for '{engine_type}'. Check logs for details.") from e
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_engine_info(engine_type: str, i18n_generation: int) -> Optional[Dict[str, Any]]:
+    """翻訳済みのエンジン情報を構築（翻訳状態の世代毎にキャッシュ）
+
+    ``i18n_generation`` はキャッシュキーとしてのみ使用する。translator や
+    フォールバックが変更されると世代が進み、古い翻訳結果は参照されなくなる。
+    """
+    from .metadata import EngineMetadata
+
+    engine_info = EngineMetadata.get(engine_type)
+    if engine_info is None:
+        return None
+
+    prefix = f"engines.{engine_type}."
+    result = {
+        "name": translate(prefix + "name", default=engine_info.display_name),
+        "description": translate(prefix + "description", default=engine_info.description),
+        "supported_languages": engine_info.supported_languages,
+        "default_params": engine_info.default_params,
+    }
+    # available_model_sizes が設定されている場合のみ追加
+    if engine_info.available_model_sizes:
+        result["available_model_sizes"] = engine_info.available_model_sizes
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _baseline_params(engine_type: str) -> Mapping[str, Any]:
+    """create_engine() の呼び出し毎に変わらないパラメータを構築（エンジンタイプ毎に初回のみ）
+
+    default_params に Parakeet 用の engine_name を加えたものを読み取り専用で返す。
+    テストでメタデータを差し替えた場合は ``_baseline_params.cache_clear()`` で無効化する。
+
+    Raises:
+        KeyError: 未知のエンジンタイプの場合（例外はキャッシュされない）
+    """
+    from .metadata import EngineMetadata
+
+    metadata = EngineMetadata.get(engine_type)
+    if metadata is None:
+        raise KeyError(engine_type)
+
+    params = dict(metadata.default_params)
+    # Parakeetの場合、engine_nameパラメータを追加
+    if engine_type in ("parakeet", "parakeet_ja"):
+        params["engine_name"] = engine_type
+    return MappingProxyType(params)
+
+
+class _LazyEngineInfo(Mapping):
+    """name / description を参照時に翻訳する読み取り専用のエンジン情報
+
+    get_available_engines() の呼び出し元が実際に読むフィールドだけ
+    translate() を呼び出すための辞書互換ラッパー。
+    """
+
+    __slots__ = ("_engine_id", "_info")
+
+    _FIELDS = ("name", "description")
+
+    def __init__(self, engine_id: str, info: Any) -> None:
+        self._engine_id = engine_id
+        self._info = info
+
+    def __getitem__(self, key: str) -> str:
+        if key == "name":
+            return translate(f"engines.{self._engine_id}.name", default=self._info.display_name)
+        if key == "description":
+            return translate(f"engines.{self._engine_id}.description", default=self._info.description)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._engine_id!r})"
+
+
+@functools.lru_cache(maxsize=None)
+def _available_engines_view() -> Mapping[str, Mapping[str, str]]:
+    """get_available_engines() 用の読み取り専用ビューを構築（初回のみ）
+
+    各値は参照時に翻訳するため、翻訳状態が変わっても再構築は不要。
+    """
+    from .metadata import EngineMetadata
+
+    return MappingProxyType({
+        engine_id: _LazyEngineInfo(engine_id, info)
+        for engine_id, info in EngineMetadata.get_all().items()
+    })
 
 
 class EngineFactory:
     """音声認識エンジンを作成するファクトリークラス"""
 
-    # 利用可能なエンジン（EngineMetadataから構築）
-    _ENGINES = None  # キャッシュ
-
     @classmethod
     def _get_engines(cls):
-        """EngineMetadataからENGINES辞書を構築（キャッシュ付き）"""
-        if cls._ENGINES is None:
-            cls._ENGINES = {}
-            for engine_id, info in EngineMetadata.get_all().items():
-                cls._ENGINES[engine_id] = {
-                    "module": info.module,
-                    "class_name": info.class_name,
-                    "name": info.display_name,
-                    "description": info.description,
-                    "supported_languages": info.supported_languages,
-                }
-        return cls._ENGINES
+        """EngineMetadataから構築済みのENGINES辞書を返す"""
+        return _build_engines()
 
     @classmethod
     def ENGINES(cls):
@@ -40,30 +190,7 @@ class EngineFactory:
     @classmethod
     def _get_engine_class(cls, engine_type: str):
         """エンジンクラスを遅延インポートで取得"""
-        try:
-            engine_info = cls._get_engines()[engine_type]
-            module_name = engine_info["module"]
-            class_name = engine_info["class_name"]
-
-            # 動的インポート
-            import importlib
-            module = importlib.import_module(module_name, package="livecap_cli.engines")
-            engine_class = getattr(module, class_name)
-
-            return engine_class
-
-        except (ImportError, AttributeError, KeyError) as e:
-            import traceback
-
-            error_details = traceback.format_exc()
-            logger.error(
-                "エンジンクラス '%s' の動的インポートに失敗しました: %s\n%s",
-                engine_type,
-                e,
-                error_details,
-            )
-            # エラーを再送出し、呼び出し元で処理できるようにする
-            raise ValueError(f"Failed to load engine class for '{engine_type}'. Check logs for details.") from e
+        return _get_engine_class(engine_type)
 
     @classmethod
     def create_engine(
@@ -117,22 +244,19 @@ class EngineFactory:
                 "then specify the engine explicitly."
             )
 
-        # メタデータから情報を取得
-        metadata = EngineMetadata.get(engine_type)
-        if metadata is None:
+        # メタデータ由来の固定パラメータを取得（エンジンタイプ毎にキャッシュ済み）
+        try:
+            baseline = _baseline_params(engine_type)
+        except KeyError:
             available = list(cls._get_engines().keys())
             raise ValueError(
                 f"Unknown engine type: {engine_type}. "
                 f"Available engines: {available}"
             )
 
-        # default_params と engine_options をマージ
+        # 固定パラメータと engine_options をマージ
         # engine_options が優先される
-        params = {**metadata.default_params, **engine_options}
-
-        # Parakeetの場合、engine_nameパラメータを追加
-        if engine_type in ("parakeet", "parakeet_ja"):
-            params["engine_name"] = engine_type
+        params = {**baseline, **engine_options}
 
         # エンジンクラスを遅延インポート
         engine_class = cls._get_engine_class(engine_type)
@@ -141,26 +265,15 @@ class EngineFactory:
         return engine_class(device=device, **params)
 
     @classmethod
-    def get_available_engines(cls) -> Dict[str, Dict[str, str]]:
+    def get_available_engines(cls) -> Mapping[str, Mapping[str, str]]:
         """
         利用可能なエンジンの情報を取得
 
         Returns:
-            エンジン情報の辞書
+            エンジン情報の読み取り専用マッピング（呼び出し間で共有され、
+            各値の name / description は参照時に翻訳される）
         """
-        engines: Dict[str, Dict[str, str]] = {}
-        for engine_id, info in EngineMetadata.get_all().items():
-            engines[engine_id] = {
-                "name": translate(
-                    f"engines.{engine_id}.name",
-                    default=info.display_name,
-                ),
-                "description": translate(
-                    f"engines.{engine_id}.description",
-                    default=info.description,
-                ),
-            }
-        return engines
+        return _available_engines_view()
 
     @classmethod
     def get_engine_info(cls, engine_type: str) -> Optional[Dict[str, Any]]:
@@ -173,27 +286,9 @@ class EngineFactory:
         Returns:
             エンジン情報またはNone
         """
-        engine_info = EngineMetadata.get(engine_type)
-        if engine_info:
-            name = translate(
-                f"engines.{engine_type}.name",
-                default=engine_info.display_name,
-            )
-            description = translate(
-                f"engines.{engine_type}.description",
-                default=engine_info.description,
-            )
-            result = {
-                "name": name,
-                "description": description,
-                "supported_languages": engine_info.supported_languages,
-                "default_params": engine_info.default_params,
-            }
-            # available_model_sizes が設定されている場合のみ追加
-            if engine_info.available_model_sizes:
-                result["available_model_sizes"] = engine_info.available_model_sizes
-            return result
-        return None
+        info = _cached_engine_info(engine_type, i18n.generation)
+        # キャッシュを共有しているため、呼び出し元にはコピーを返す
+        return dict(info) if info is not None else None
 
     @classmethod
     def get_engines_for_language(cls, language_code: str) -> Dict[str, Dict[str, Any]]:
@@ -206,11 +301,13 @@ class EngineFactory:
         Returns:
             言語に対応したエンジン情報の辞書
         """
-        result: Dict[str, Dict[str, Any]] = {}
-
-        for engine_key in EngineMetadata.get_engines_for_language(language_code):
-            info = cls.get_engine_info(engine_key)
-            if info:
-                result[engine_key] = info
-
-        return result
+        from .metadata import EngineMetadata
+
+        # 逆引きは EngineMetadata のインデックス（BCP-47 → ISO 639-1 変換込み）を共用し、
+        # 翻訳済みの情報は世代毎のキャッシュから引く
+        generation = i18n.generation
+        # キャッシュを共有しているため、呼び出し元にはコピーを返す
+        return {
+            engine_key: dict(_cached_engine_info(engine_key, generation))
+            for engine_key in EngineMetadata.get_engines_for_language(language_code)
+        }
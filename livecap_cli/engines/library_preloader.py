@@ -1,40 +1,240 @@
 """重いライブラリの事前ロード管理"""
+import importlib
+import importlib.util
+import os
 import threading
 import logging
 import time
 import sys
-from typing import Dict, Optional, Set, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Any
 
 logger = logging.getLogger(__name__)
 
+# カーネルに先読みさせるバイナリファイルの拡張子
+_WARM_FILE_SUFFIXES = ('.so', '.pyd', '.dylib', '.dll', '.pt', '.bin')
+
+# posix_fadvise が使えない環境（Windows等）で読み込む先頭バイト数
+_WARM_FALLBACK_READ_BYTES = 1 << 20
+
+
+# ライブラリ毎のビット（ロード済み判定をビット演算1回で行う）
+_LIB_BITS: Dict[str, int] = {
+    'nemo': 1,
+    'transformers': 2,
+    'whisper_s2t': 4,
+    'sherpa_onnx': 8,
+    'matplotlib': 16,
+}
+
+# エンジンタイプ毎に必要なライブラリ
+_ENGINE_LIBRARIES: Dict[str, FrozenSet[str]] = {
+    'parakeet': frozenset({'matplotlib', 'nemo'}),
+    'parakeet_ja': frozenset({'matplotlib', 'nemo'}),
+    'canary': frozenset({'matplotlib', 'nemo'}),
+    'voxtral': frozenset({'transformers'}),
+    'whispers2t': frozenset({'whisper_s2t'}),  # Unified engine ID
+    'reazonspeech': frozenset({'sherpa_onnx'}),
+}
+
+# 他所で既にインポート済みかを判定するモジュール名
+# matplotlib はインポート済みでも Agg バックエンドの設定が必要なため含めない
+_LIB_MODULES: Dict[str, str] = {
+    'nemo': 'nemo.collections.asr',
+    'transformers': 'transformers',
+    'whisper_s2t': 'whisper_s2t',
+    'sherpa_onnx': 'sherpa_onnx',
+}
+
+# エンジンタイプ毎に必要なライブラリのビットマスク
+_ENGINE_MASKS: Dict[str, int] = {
+    engine_type: sum(_LIB_BITS[lib] for lib in libs)
+    for engine_type, libs in _ENGINE_LIBRARIES.items()
+}
+
+
+@dataclass(slots=True)
+class _PreloadState:
+    """事前ロードの可変状態（属性アクセスをスロット参照にするため dataclass で保持）"""
+
+    mask: int = 0  # ロード済みライブラリのビットマスク（_LIB_BITS）
+    # ライブラリ毎のロード権（最初にsetdefaultできたスレッドがロードを担当）
+    claims: Dict[str, threading.Event] = field(default_factory=dict)
+    thread: Optional[threading.Thread] = None
+
+
+_STATE = _PreloadState()
+
+
+def _warm_files(paths: Iterable[str], fallback_read_bytes: int = _WARM_FALLBACK_READ_BYTES) -> None:
+    """
+    ファイルをページキャッシュに先読みさせる（失敗したファイルは無視する）
+
+    Args:
+        paths: 先読みするファイルパス
+        fallback_read_bytes: posix_fadvise が使えない場合に読み込む先頭バイト数
+    """
+    fadvise = getattr(os, 'posix_fadvise', None)
+    for path in paths:
+        try:
+            if fadvise is not None:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            elif fallback_read_bytes > 0:
+                with open(path, 'rb') as f:
+                    f.read(fallback_read_bytes)
+        except OSError:
+            continue
+
+
+def _warm_package_files(package: str) -> None:
+    """
+    パッケージ内の拡張モジュール等をページキャッシュに先読みさせる
+
+    import 前に呼び出すことで、コールドキャッシュ時のランダムシークを
+    カーネルによる順次読み込みに置き換える。失敗しても無視する。
+
+    Args:
+        package: トップレベルパッケージ名（サブモジュールは不可）
+    """
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return
+    if spec is None or not spec.submodule_search_locations:
+        return
+
+    _warm_files(
+        os.path.join(root, name)
+        for package_root in spec.submodule_search_locations
+        for root, _, files in os.walk(package_root)
+        for name in files
+        if name.endswith(_WARM_FILE_SUFFIXES)
+    )
+
+
+def _install_lazy_module(name: str) -> None:
+    """
+    モジュールを LazyLoader 経由で sys.modules に登録する
+
+    ファイル解決とモジュールオブジェクトの作成のみを行い、モジュール本体の
+    実行は最初の属性アクセスまで遅延させる。既にインポート済みなら何もしない。
+
+    Note:
+        サブモジュールを指定した場合、親パッケージは通常通りインポートされる。
+        import 時に sys.modules を差し替えるパッケージ（transformers 等）には使用不可。
+
+    Args:
+        name: モジュール名（ドット区切り可）
+
+    Raises:
+        ImportError: モジュールが見つからない場合
+    """
+    if name in sys.modules:
+        return
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named '{name}'")
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    # 通常の import と同様に親パッケージの属性として登録
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+
+
+# LazyLoader で登録したモジュールの本体実行を直列化するロック
+# （Python 3.11 以前の LazyLoader は初回アクセスの同時実行に対して安全ではない）
+_lazy_exec_lock = threading.Lock()
+
+
+def import_eagerly(name: str) -> Any:
+    """
+    モジュールをインポートし、本体の実行まで完了させて返す
+
+    LazyLoader 経由で登録済み（未実行）のモジュールはここで本体を実行する。
+    実行に失敗した場合は通常の import と同様に sys.modules から取り除き、
+    元の ImportError 等をそのまま送出する（半端なモジュールを残さない）。
+
+    Args:
+        name: モジュール名（ドット区切り可）
+
+    Returns:
+        インポート済みのモジュール
+
+    Raises:
+        ImportError: モジュールが見つからない、またはインポートに失敗した場合
+    """
+    module = sys.modules.get(name)
+    if isinstance(module, importlib.util._LazyModule):
+        with _lazy_exec_lock:
+            if isinstance(module, importlib.util._LazyModule):
+                try:
+                    # 任意の属性アクセスで本体が実行される
+                    module.__name__
+                except BaseException:
+                    if sys.modules.get(name) is module:
+                        del sys.modules[name]
+                    parent, _, child = name.rpartition('.')
+                    if parent and getattr(sys.modules.get(parent), child, None) is module:
+                        delattr(sys.modules[parent], child)
+                    raise
+    return importlib.import_module(name)
+
 
 class LibraryPreloader:
     """
     重いライブラリの事前ロード
     
-    NeMo、Transformers、WhisperS2Tなどの重いライブラリを
-    バックグラウンドで事前にインポートすることで、
+    NeMo、Transformers、WhisperS2Tなどの重いライブラリのファイルを
+    バックグラウンドでページキャッシュに先読みしてからインポートしておくことで、
     実際の使用時のロード時間を短縮する。
+
+    enable_lazy_import() を有効にした場合は LazyLoader 経由で sys.modules に
+    登録するだけとし、モジュール本体の実行は import_eagerly() または最初の
+    属性アクセスまで遅延させる。
     """
     
-    # クラス変数
-    _preload_thread: Optional[threading.Thread] = None
-    _preloaded: Dict[str, bool] = {
-        'nemo': False,
-        'transformers': False,
-        'whisper_s2t': False,
-        'sherpa_onnx': False,
-        'matplotlib': False,
-    }
-    _preload_in_progress: Set[str] = set()
+    # クラス変数（ロード状態はモジュールレベルの _STATE で管理）
     _lock = threading.Lock()
     _enabled = True  # 事前ロード機能の有効/無効
+    _lazy_import = False  # LazyLoader による登録のみ行うか（オプトイン）
     
     @classmethod
     def enable(cls, enabled: bool = True):
         """事前ロード機能の有効/無効を設定"""
         cls._enabled = enabled
-        logger.debug(f"事前ロード機能: {'有効' if enabled else '無効'}")
+        logger.debug("事前ロード機能: %s", '有効' if enabled else '無効')
+
+    @classmethod
+    def enable_lazy_import(cls, enabled: bool = True):
+        """
+        事前ロードでモジュール本体を実行せず LazyLoader で登録するかを設定
+
+        有効にするとバックグラウンドのインポートを省けるが、インポートの失敗は
+        モジュール本体の実行時（import_eagerly() の呼び出し時）まで表面化しない。
+        """
+        cls._lazy_import = enabled
+        logger.debug("遅延インポート: %s", '有効' if enabled else '無効')
+
+    @classmethod
+    def _import_library(cls, name: str) -> None:
+        """事前ロード用のインポート（遅延インポート有効時は LazyLoader で登録のみ）"""
+        if cls._lazy_import:
+            _install_lazy_module(name)
+        else:
+            importlib.import_module(name)
     
     @classmethod
     def start_preloading(cls, engine_type: str, force: bool = False):
@@ -50,7 +250,7 @@ class LibraryPreloader:
             return
         
         # 既に実行中の場合はスキップ
-        if cls._preload_thread and cls._preload_thread.is_alive():
+        if _STATE.thread and _STATE.thread.is_alive():
             logger.debug("事前ロードスレッドは既に実行中です")
             return
         
@@ -58,20 +258,81 @@ class LibraryPreloader:
         required_libs = cls._get_required_libraries(engine_type)
         
         # 全て既にロード済みの場合はスキップ（forceフラグが無い限り）
-        if not force and all(cls._preloaded.get(lib, False) for lib in required_libs):
-            logger.debug(f"必要なライブラリは全てロード済み: {required_libs}")
+        required_mask = _ENGINE_MASKS.get(engine_type, 0)
+        if not force and (_STATE.mask & required_mask) == required_mask:
+            logger.debug("必要なライブラリは全てロード済み: %s", required_libs)
             return
+
+        if not force:
+            remaining = cls._pending_libraries(required_libs)
+            if not remaining:
+                logger.debug("必要なライブラリは全てインポート済み: %s", required_libs)
+                return
+            # matplotlib だけならスレッド生成のコストの方が大きいため同期実行
+            if remaining == {'matplotlib'}:
+                cls._preload_matplotlib()
+                return
         
         # バックグラウンドスレッドで事前ロード開始
-        cls._preload_thread = threading.Thread(
-            target=cls._preload_libraries,
-            args=(engine_type, required_libs),
+        # 実行中の確認とスレッドの生成をロック下で行い、同時呼び出しによる二重起動を防ぐ
+        # （ロードそのものはスレッド内でロック外に実行される）
+        with cls._lock:
+            if _STATE.thread and _STATE.thread.is_alive():
+                logger.debug("事前ロードスレッドは既に実行中です")
+                return
+            _STATE.thread = threading.Thread(
+                target=cls._preload_libraries,
+                args=(engine_type, required_libs),
+                daemon=True,
+                name="LibraryPreloader"
+            )
+            _STATE.thread.start()
+        logger.debug("事前ロード開始: %s (%s)", engine_type, required_libs)
+    
+    @classmethod
+    def warm_model_files(
+        cls,
+        model_dir: Path,
+        suffixes: Iterable[str] = ('.onnx',),
+    ) -> Optional[threading.Thread]:
+        """
+        モデルファイルをバックグラウンドでページキャッシュに先読みさせる
+
+        モデルのロード前に呼び出すことで、コールドキャッシュ時の初回ロードで
+        発生するディスク読み込みを、依存関係チェック等と並行して進める。
+        posix_fadvise が使えない環境（Windows等）では何もしない。
+
+        Args:
+            model_dir: モデルファイルのディレクトリ
+            suffixes: 先読みするファイルの拡張子
+
+        Returns:
+            先読みスレッド（先読みしない場合はNone）
+        """
+        if not cls._enabled or not hasattr(os, 'posix_fadvise'):
+            return None
+
+        suffixes = tuple(suffixes)
+        try:
+            paths = [
+                str(path) for path in Path(model_dir).iterdir()
+                if path.suffix in suffixes and path.is_file()
+            ]
+        except OSError:
+            return None
+        if not paths:
+            return None
+
+        thread = threading.Thread(
+            target=_warm_files,
+            args=(paths,),
             daemon=True,
-            name="LibraryPreloader"
+            name="LibraryPreloader-warm",
         )
-        cls._preload_thread.start()
-        logger.debug(f"事前ロード開始: {engine_type} ({required_libs})")
-    
+        thread.start()
+        logger.debug("モデルファイル先読み開始: %s (%d files)", model_dir, len(paths))
+        return thread
+
     @classmethod
     def _get_required_libraries(cls, engine_type: str) -> Set[str]:
         """
@@ -83,17 +344,33 @@ class LibraryPreloader:
         Returns:
             必要なライブラリのセット
         """
-        library_map = {
-            'parakeet': {'matplotlib', 'nemo'},
-            'parakeet_ja': {'matplotlib', 'nemo'},
-            'canary': {'matplotlib', 'nemo'},
-            'voxtral': {'transformers'},
-            'whispers2t': {'whisper_s2t'},  # Unified engine ID
-            'reazonspeech': {'sherpa_onnx'},
-        }
-        
-        return library_map.get(engine_type, set())
+        return set(_ENGINE_LIBRARIES.get(engine_type, ()))
     
+    @classmethod
+    def _pending_libraries(cls, required_libs: Set[str]) -> Set[str]:
+        """
+        まだロードされていないライブラリを取得
+
+        事前ロード以外の経路で既にインポートされているライブラリは
+        ロード済みとして記録し、対象から除外する。
+
+        Args:
+            required_libs: 必要なライブラリのセット
+
+        Returns:
+            ロードが必要なライブラリのセット
+        """
+        remaining = set()
+        for lib in required_libs:
+            if cls.is_preloaded(lib):
+                continue
+            module_name = _LIB_MODULES.get(lib)
+            if module_name is not None and module_name in sys.modules:
+                cls._mark_preloaded(lib)
+                continue
+            remaining.add(lib)
+        return remaining
+
     @classmethod
     def _preload_libraries(cls, engine_type: str, required_libs: Set[str]):
         """
@@ -103,53 +380,126 @@ class LibraryPreloader:
             engine_type: エンジンタイプ
             required_libs: ロードすべきライブラリのセット
         """
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
         try:
-            # matplotlib（NeMo依存）
-            if 'matplotlib' in required_libs and not cls._preloaded['matplotlib']:
-                cls._preload_matplotlib()
-            
-            # NeMo
-            if 'nemo' in required_libs and not cls._preloaded['nemo']:
-                cls._preload_nemo()
-            
-            # Transformers
-            if 'transformers' in required_libs and not cls._preloaded['transformers']:
-                cls._preload_transformers()
-            
-            # WhisperS2T
-            if 'whisper_s2t' in required_libs and not cls._preloaded['whisper_s2t']:
-                cls._preload_whispers2t()
-            
-            # Sherpa-ONNX
-            if 'sherpa_onnx' in required_libs and not cls._preloaded['sherpa_onnx']:
-                cls._preload_sherpa_onnx()
-            
-            elapsed = time.time() - start_time
-            logger.debug(f"事前ロード完了: {engine_type} ({elapsed:.2f}秒)")
-            
+            # 独立したライブラリは並列にインポートし、待ち時間を合計から最大値に短縮する
+            tasks = cls._build_preload_tasks(required_libs)
+            if tasks:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(tasks), 4),
+                    thread_name_prefix="LibraryPreloader",
+                ) as executor:
+                    futures = {executor.submit(task): name for name, task in tasks.items()}
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                        except Exception as e:
+                            logger.debug("事前ロード中のエラー（無視）: %s: %s", futures[future], e)
+
+            elapsed = time.perf_counter() - start_time
+            logger.debug("事前ロード完了: %s (%.2f秒)", engine_type, elapsed)
+
         except Exception as e:
-            logger.debug(f"事前ロード中のエラー（無視）: {e}")
-    
+            logger.debug("事前ロード中のエラー（無視）: %s", e)
+
+    @classmethod
+    def _build_preload_tasks(cls, required_libs: Set[str]) -> Dict[str, Callable[[], None]]:
+        """
+        並列実行する事前ロードタスクを構築
+
+        NeMo は matplotlib のバックエンドが Agg に設定された後で
+        インポートする必要があるため、同じタスク内で順に実行する。
+
+        Args:
+            required_libs: ロードすべきライブラリのセット
+
+        Returns:
+            タスク名から実行関数へのマッピング
+        """
+        preloaders = {
+            'matplotlib': cls._preload_matplotlib,
+            'nemo': cls._preload_nemo,
+            'transformers': cls._preload_transformers,
+            'whisper_s2t': cls._preload_whispers2t,
+            'sherpa_onnx': cls._preload_sherpa_onnx,
+        }
+        pending = [
+            lib for lib in preloaders
+            if lib in required_libs and not cls.is_preloaded(lib)
+        ]
+
+        tasks: Dict[str, Callable[[], None]] = {}
+        if 'nemo' in pending and 'matplotlib' in pending:
+            pending.remove('matplotlib')
+            pending.remove('nemo')
+            tasks['nemo'] = cls._chain(preloaders['matplotlib'], preloaders['nemo'])
+        for lib in pending:
+            tasks[lib] = preloaders[lib]
+        return tasks
+
+    @staticmethod
+    def _chain(*steps: Callable[[], None]) -> Callable[[], None]:
+        """複数の事前ロード関数を順に実行する関数を返す"""
+        def run():
+            for step in steps:
+                step()
+        return run
+
+    @classmethod
+    def _claim(cls, library: str) -> Optional[threading.Event]:
+        """
+        ライブラリのロード権を取得
+
+        dict.setdefault はGIL下でアトミックなため、最初に登録できた
+        スレッドだけがロードを担当する。他のスレッドは完了まで待機する。
+
+        Args:
+            library: ライブラリ名
+
+        Returns:
+            ロードを担当する場合は完了通知用のEvent、それ以外はNone
+        """
+        event = threading.Event()
+        claimed = _STATE.claims.setdefault(library, event)
+        if claimed is event:
+            return event
+        claimed.wait()
+        return None
+
+    @classmethod
+    def _release(cls, library: str, event: threading.Event):
+        """
+        ロード権を解放して待機中のスレッドを再開
+
+        失敗した場合は次回再試行できるようロード権を削除する。
+        """
+        if not cls.is_preloaded(library) and _STATE.claims.get(library) is event:
+            _STATE.claims.pop(library, None)
+        event.set()
+
+    @classmethod
+    def _mark_preloaded(cls, library: str):
+        """ライブラリをロード済みとして記録（並列ロード時の更新競合を防ぐためロック下で更新）"""
+        with cls._lock:
+            _STATE.mask |= _LIB_BITS[library]
+
     @classmethod
     def _preload_matplotlib(cls):
         """matplotlibを事前ロード"""
-        with cls._lock:
-            if 'matplotlib' in cls._preload_in_progress:
-                return
-            cls._preload_in_progress.add('matplotlib')
+        claim = cls._claim('matplotlib')
+        if claim is None:
+            return
         
         try:
             import matplotlib
             matplotlib.use('Agg')  # 非対話的バックエンド
-            cls._preloaded['matplotlib'] = True
+            cls._mark_preloaded('matplotlib')
             logger.debug("matplotlib事前ロード完了")
         except Exception as e:
-            logger.debug(f"matplotlib事前ロード失敗: {e}")
+            logger.debug("matplotlib事前ロード失敗: %s", e)
         finally:
-            with cls._lock:
-                cls._preload_in_progress.discard('matplotlib')
+            cls._release('matplotlib', claim)
     
     @classmethod
     def _preload_nemo(cls):
@@ -165,85 +515,77 @@ class LibraryPreloader:
             logger.debug("PyInstaller環境のためNeMo事前ロードをスキップ")
             return
 
-        with cls._lock:
-            if 'nemo' in cls._preload_in_progress:
-                return
-            cls._preload_in_progress.add('nemo')
+        claim = cls._claim('nemo')
+        if claim is None:
+            return
 
         try:
             # NeMoのインポート
-            import nemo.collections.asr
-            cls._preloaded['nemo'] = True
+            _warm_package_files('nemo')
+            cls._import_library('nemo.collections.asr')
+            cls._mark_preloaded('nemo')
             logger.debug("NeMo事前ロード完了")
         except Exception as e:
-            logger.debug(f"NeMo事前ロード失敗: {e}")
+            logger.debug("NeMo事前ロード失敗: %s", e)
         finally:
-            with cls._lock:
-                cls._preload_in_progress.discard('nemo')
+            cls._release('nemo', claim)
     
     @classmethod
     def _preload_transformers(cls):
         """Transformersを事前ロード"""
-        with cls._lock:
-            if 'transformers' in cls._preload_in_progress:
-                return
-            cls._preload_in_progress.add('transformers')
+        claim = cls._claim('transformers')
+        if claim is None:
+            return
         
         try:
-            # 基本的なインポート
+            # transformers は import 時に自身を _LazyModule に差し替えるため
+            # LazyLoader は使えないが、トップレベルの import 自体が遅延ロードになっている。
+            # Voxtral のモデルクラスは解決すると実体の import が走るため、ここでは触らない
+            _warm_package_files('transformers')
             import transformers
             
-            # Voxtral用の特定モデルをインポート（可能な場合）
-            try:
-                from transformers import VoxtralForConditionalGeneration, AutoProcessor
-                logger.debug("Voxtralモデルクラス事前ロード完了")
-            except ImportError:
-                # 古いバージョンの場合は無視
-                pass
-            
-            cls._preloaded['transformers'] = True
+            cls._mark_preloaded('transformers')
             logger.debug("Transformers事前ロード完了")
         except Exception as e:
-            logger.debug(f"Transformers事前ロード失敗: {e}")
+            logger.debug("Transformers事前ロード失敗: %s", e)
         finally:
-            with cls._lock:
-                cls._preload_in_progress.discard('transformers')
+            cls._release('transformers', claim)
     
     @classmethod
     def _preload_whispers2t(cls):
         """WhisperS2Tを事前ロード"""
-        with cls._lock:
-            if 'whisper_s2t' in cls._preload_in_progress:
-                return
-            cls._preload_in_progress.add('whisper_s2t')
+        claim = cls._claim('whisper_s2t')
+        if claim is None:
+            return
         
         try:
-            import whisper_s2t
-            cls._preloaded['whisper_s2t'] = True
+            # whisper_s2t 本体はPythonのみ、推論バックエンドは ctranslate2
+            _warm_package_files('ctranslate2')
+            _warm_package_files('whisper_s2t')
+            cls._import_library('whisper_s2t')
+            cls._mark_preloaded('whisper_s2t')
             logger.debug("WhisperS2T事前ロード完了")
         except Exception as e:
-            logger.debug(f"WhisperS2T事前ロード失敗: {e}")
+            logger.debug("WhisperS2T事前ロード失敗: %s", e)
         finally:
-            with cls._lock:
-                cls._preload_in_progress.discard('whisper_s2t')
+            cls._release('whisper_s2t', claim)
     
     @classmethod
     def _preload_sherpa_onnx(cls):
         """Sherpa-ONNXを事前ロード"""
-        with cls._lock:
-            if 'sherpa_onnx' in cls._preload_in_progress:
-                return
-            cls._preload_in_progress.add('sherpa_onnx')
+        claim = cls._claim('sherpa_onnx')
+        if claim is None:
+            return
         
         try:
-            import sherpa_onnx
-            cls._preloaded['sherpa_onnx'] = True
+            _warm_package_files('sherpa_onnx')
+            cls._import_library('sherpa_onnx')
+            cls._mark_preloaded('sherpa_onnx')
             logger.debug("Sherpa-ONNX事前ロード完了")
         except Exception as e:
-            logger.debug(f"Sherpa-ONNX事前ロード失敗: {e}")
+            logger.debug("Sherpa-ONNX事前ロード失敗: %s", e)
         finally:
-            with cls._lock:
-                cls._preload_in_progress.discard('sherpa_onnx')
+            cls._release('sherpa_onnx', claim)
     
     @classmethod
     def is_preloaded(cls, library: str) -> bool:
@@ -256,7 +598,8 @@ class LibraryPreloader:
         Returns:
             ロード済みの場合True
         """
-        return cls._preloaded.get(library, False)
+        bit = _LIB_BITS.get(library, 0)
+        return bool(_STATE.mask & bit)
     
     @classmethod
     def wait_for_preload(cls, timeout: float = 10.0) -> bool:
@@ -269,11 +612,12 @@ class LibraryPreloader:
         Returns:
             完了した場合True、タイムアウトした場合False
         """
-        if not cls._preload_thread:
+        thread = _STATE.thread
+        if not thread:
             return True
         
-        cls._preload_thread.join(timeout=timeout)
-        return not cls._preload_thread.is_alive()
+        thread.join(timeout=timeout)
+        return not thread.is_alive()
     
     @classmethod
     def get_stats(cls) -> Dict[str, Any]:
@@ -286,16 +630,18 @@ class LibraryPreloader:
         with cls._lock:
             return {
                 'enabled': cls._enabled,
-                'preloaded': dict(cls._preloaded),
-                'in_progress': list(cls._preload_in_progress),
-                'thread_alive': cls._preload_thread.is_alive() if cls._preload_thread else False
+                'preloaded': {
+                    lib: bool(_STATE.mask & bit) for lib, bit in _LIB_BITS.items()
+                },
+                'in_progress': [lib for lib, event in _STATE.claims.items() if not event.is_set()],
+                'thread_alive': _STATE.thread.is_alive() if _STATE.thread else False
             }
     
     @classmethod
     def reset(cls):
         """事前ロード状態をリセット"""
         with cls._lock:
-            cls._preloaded = {key: False for key in cls._preloaded}
-            cls._preload_in_progress.clear()
-            cls._preload_thread = None
+            _STATE.mask = 0
+            _STATE.claims = {}
+            _STATE.thread = None
             logger.debug("事前ロード状態をリセット")
\ No newline at end of file
@@ -5,7 +5,9 @@
 このモジュールは、ASRエンジンのメタデータを一元管理します。
 """
 
-from typing import Dict, Any, List, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 
 import langcodes
@@ -30,6 +32,26 @@ class EngineInfo:
     available_model_sizes: Optional[List[str]] = None  # 選択可能なモデルサイズ一覧
 
 
+@functools.lru_cache(maxsize=256)
+def _to_iso639_1(code: str) -> str:
+    """EngineMetadata.to_iso639_1 の本体（言語コードの種類は少ないため結果をキャッシュ）"""
+    return langcodes.Language.get(code).language
+
+
+@functools.lru_cache(maxsize=1)
+def _engine_ids_by_language() -> Mapping[str, Tuple[str, ...]]:
+    """言語コード → 対応エンジンIDのタプル の逆引きインデックスを構築（初回のみ）
+
+    エンジンIDは EngineMetadata._ENGINES の定義順に並ぶ。
+    テストでメタデータを差し替えた場合は ``_engine_ids_by_language.cache_clear()`` で無効化する。
+    """
+    index: Dict[str, List[str]] = {}
+    for engine_id, info in EngineMetadata._ENGINES.items():
+        for language in dict.fromkeys(info.supported_languages):
+            index.setdefault(language, []).append(engine_id)
+    return MappingProxyType({language: tuple(ids) for language, ids in index.items()})
+
+
 class EngineMetadata:
     """
     エンジンメタデータの中央管理
@@ -229,11 +251,8 @@ class EngineMetadata:
         # BCP-47 → ISO 639-1 変換（自己完結）
         iso_code = cls.to_iso639_1(lang_code)
 
-        result = []
-        for engine_id, info in cls._ENGINES.items():
-            if iso_code in info.supported_languages:
-                result.append(engine_id)
-        return result
+        # 全エンジンの対応言語リストを走査せず、逆引きインデックスを1回引く
+        return list(_engine_ids_by_language().get(iso_code, ()))
 
     @classmethod
     def get_module_info(cls, engine_id: str) -> tuple[Optional[str], Optional[str]]:
@@ -279,4 +298,4 @@ class EngineMetadata:
             >>> EngineMetadata.to_iso639_1("auto")  # パススルー
             'auto'
         """
-        return langcodes.Language.get(code).language
+        return _to_iso639_1(code)
@@ -20,6 +20,7 @@ class ModelMemoryCache:
     _strong_refs: Dict[str, Any] = {}  # 強参照（オプション）
     _lock = threading.Lock()  # スレッドセーフ
     _access_count: Dict[str, int] = {}  # アクセス頻度追跡
+    _ref_counts: Dict[str, int] = {}  # モデルを使用中のエンジン数
     _cache_size_limit = 2  # 強参照の最大数
     _hit_count = 0  # キャッシュヒット数
     _miss_count = 0  # キャッシュミス数
@@ -93,6 +94,56 @@ class ModelMemoryCache:
 
             # アクセスカウントを初期化
             cls._access_count[cache_key] = 1
+
+    @classmethod
+    def acquire(cls, cache_key: str) -> None:
+        """
+        エンジンがモデルの使用を開始したことを通知
+
+        参照カウントは acquire した呼び出し元だけを数える（get/set では増えない）。
+        acquire したエンジンはクリーンアップ時に必ず release を呼ぶこと。
+
+        Args:
+            cache_key: キャッシュキー
+        """
+        with cls._lock:
+            cls._ref_counts[cache_key] = cls._ref_counts.get(cache_key, 0) + 1
+
+    @classmethod
+    def release(cls, cache_key: str) -> bool:
+        """
+        エンジンがモデルの使用を終えたことを通知
+
+        acquire で増えた参照カウントを 1 つ減らす。
+        キャッシュ自体は保持したままなので、後続のエンジンは再ロードせずに取得できる。
+
+        Args:
+            cache_key: キャッシュキー
+
+        Returns:
+            他に使用中のエンジンが残っていない場合True
+        """
+        with cls._lock:
+            remaining = cls._ref_counts.get(cache_key, 0) - 1
+            if remaining > 0:
+                cls._ref_counts[cache_key] = remaining
+                return False
+            cls._ref_counts.pop(cache_key, None)
+            return True
+
+    @classmethod
+    def ref_count(cls, cache_key: str) -> int:
+        """
+        モデルを使用中のエンジン数を取得
+
+        Args:
+            cache_key: キャッシュキー
+
+        Returns:
+            参照カウント（未使用の場合は0）
+        """
+        with cls._lock:
+            return cls._ref_counts.get(cache_key, 0)
     
     @classmethod
     def _add_strong_ref(cls, cache_key: str, model: Any):
@@ -132,11 +183,13 @@ class ModelMemoryCache:
                 cls._cache.pop(cache_key, None)
                 cls._strong_refs.pop(cache_key, None)
                 cls._access_count.pop(cache_key, None)
+                cls._ref_counts.pop(cache_key, None)
                 logger.info(f"キャッシュクリア: {cache_key}")
             else:
                 cls._cache.clear()
                 cls._strong_refs.clear()
                 cls._access_count.clear()
+                cls._ref_counts.clear()
                 logger.info("全キャッシュをクリア")
     
     @classmethod
@@ -161,6 +214,7 @@ class ModelMemoryCache:
                 'strong_refs': len(cls._strong_refs),
                 'total_access': sum(cls._access_count.values()),
                 'access_count': dict(cls._access_count),
+                'ref_counts': dict(cls._ref_counts),
                 'cache_keys': list(cls._cache.keys()) + list(cls._strong_refs.keys())
             }
     
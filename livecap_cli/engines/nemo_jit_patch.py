@@ -10,8 +10,8 @@ def patch_nemo_jit():
     if not (getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')):
         return
         
-    # JITコンパイルを無効化
-    os.environ['PYTORCH_JIT'] = '0'
+    # JITコンパイルを無効化（nemo_utils のインポート時に設定済みなら書き込まない）
+    os.environ.setdefault('PYTORCH_JIT', '0')
     
     # torch.jit.scriptをパッチして、単に元の関数を返すようにする
     try:
@@ -25,6 +25,10 @@ import importlib.util
 import os
 import sys
 import logging
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator
+
+from .library_preloader import import_eagerly
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,18 @@ logger = logging.getLogger(__name__)
 NEMO_AVAILABLE = None  # 初期状態は未確認
 _NEMO_ENVIRONMENT_PREPARED = False  # 環境準備済みフラグ
 
+# ロード時に警告を抑制するロガー（NeMo本体、Lhotse/データローダー、NeMo内部）
+_NEMO_NOISY_LOGGERS = tuple(
+    logging.getLogger(name) for name in ('nemo_logger', 'lhotse', 'nemo.collections')
+)
+
+# PyInstaller 環境では torch._dynamo と TorchScript を無効化する。
+# os.environ への書き込み（setenv）は他スレッドの getenv と競合し得るため、
+# バックグラウンドでのモデルロード中ではなくモジュールのインポート時に一度だけ行う
+if getattr(sys, 'frozen', False):
+    os.environ.setdefault('TORCHDYNAMO_DISABLE', '1')
+    os.environ.setdefault('PYTORCH_JIT', '0')
+
 
 def check_nemo_availability() -> bool:
     """NeMo の利用可能性をチェック
@@ -71,7 +87,9 @@ def check_nemo_availability() -> bool:
         # PyInstaller 互換性のための JIT パッチを適用
         from . import nemo_jit_patch
 
-        import nemo.collections.asr
+        # 事前ロードで LazyLoader 登録のみされている場合も本体を実行し、
+        # 壊れたインストールを実際の ImportError として検出する
+        import_eagerly('nemo.collections.asr')
         NEMO_AVAILABLE = True
         logger.info("NVIDIA NeMo が正常にインポートされました")
     except (ImportError, AttributeError) as e:
@@ -91,7 +109,6 @@ def prepare_nemo_environment() -> None:
     NeMo を実際にインポートする前に呼び出す。以下の設定を行う:
     - matplotlib バックエンドを非対話的に設定
     - PyInstaller 互換性のための JIT パッチを適用
-    - PyInstaller 環境での追加設定（torch._dynamo, TorchScript 無効化）
     - PyInstaller 環境での datasets サブモジュール事前インポート（循環インポート回避, #216）
     - PyInstaller 環境での librosa サブモジュール事前インポート（循環インポート回避, #219）
 
@@ -114,14 +131,8 @@ def prepare_nemo_environment() -> None:
     except ImportError:
         logger.debug("nemo_jit_patch モジュールが見つかりません")
 
-    # PyInstaller 環境での追加設定
+    # PyInstaller 環境での追加設定（環境変数はモジュールのインポート時に設定済み）
     if getattr(sys, 'frozen', False):
-        # torch._dynamo を無効化
-        os.environ['TORCHDYNAMO_DISABLE'] = '1'
-        # TorchScript を無効化
-        os.environ['PYTORCH_JIT'] = '0'
-        logger.debug("PyInstaller 環境用の設定を適用しました")
-
         # datasets サブモジュールを NeMo より先にインポート（循環インポート回避）
         # NeMo は内部で datasets をインポートするが、PyInstaller の frozen importer では
         # datasets/__init__.py が完全に初期化される前に datasets.utils にアクセスしようとして
@@ -156,3 +167,36 @@ def prepare_nemo_environment() -> None:
 
     _NEMO_ENVIRONMENT_PREPARED = True
     logger.debug("NeMo 環境準備が完了しました")
+
+
+@contextmanager
+def suppress_nemo_logs(level: int = logging.ERROR) -> Iterator[None]:
+    """NeMo 関連ロガーのレベルを一時的に引き上げる
+
+    モデルのダウンロード・復元時の大量の警告を抑制し、
+    終了時に元のログレベルへ戻す。
+
+    Args:
+        level: 抑制中に設定するログレベル
+    """
+    original_levels = [(nemo_logger, nemo_logger.level) for nemo_logger in _NEMO_NOISY_LOGGERS]
+    for nemo_logger, _ in original_levels:
+        nemo_logger.setLevel(level)
+    try:
+        yield
+    finally:
+        for nemo_logger, original_level in original_levels:
+            nemo_logger.setLevel(original_level)
+
+
+def inference_mode() -> ContextManager[None]:
+    """推論用の autograd 無効化コンテキストを返す
+
+    torch.inference_mode() は no_grad() と異なりバージョンカウンタや
+    ビューの追跡も行わない。torch が無い場合は何もしないコンテキストを返す。
+    """
+    try:
+        import torch
+    except ImportError:
+        return nullcontext()
+    return torch.inference_mode()
@@ -1,19 +1,23 @@
 """NVIDIA Parakeet TDT 0.6B v3エンジンの実装"""
+import importlib.util
+import inspect
 import os
 import shutil
 import sys
 import logging
+import threading
+from concurrent.futures import Future
+from contextlib import nullcontext
 from io import StringIO
+from math import gcd
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Callable, ContextManager, Optional, Dict, Any, List, Tuple
 import numpy as np
-import platform
 import warnings
-import tempfile
-import soundfile as sf
+from scipy.signal import resample_poly
 
 # Windows互換性のための設定
-if platform.system() == 'Windows':
+if sys.platform == 'win32':
     # NeMoがSIGKILLを使用しようとするのを防ぐ
     import signal
     if not hasattr(signal, 'SIGKILL'):
@@ -39,10 +43,19 @@ from livecap_cli.utils import (
 )
 
 # NeMo framework - 共通モジュールから遅延インポート
-from .nemo_utils import check_nemo_availability, prepare_nemo_environment
+from .nemo_utils import (
+    check_nemo_availability,
+    inference_mode,
+    prepare_nemo_environment,
+    suppress_nemo_logs,
+)
 
 logger = logging.getLogger(__name__)
 
+# 強参照キャッシュ（Parakeet はデフォルトで有効、LIVECAP_ENGINE_STRONG_CACHE=0 で無効化）
+# 弱参照のみだとエンジン再作成時にモデルが回収され、restore_from() をやり直すことになる
+_STRONG_CACHE = os.environ.get('LIVECAP_ENGINE_STRONG_CACHE', '1').lower() not in ('0', 'false', 'no')
+
 
 class ParakeetEngine(BaseEngine):
     """NVIDIA Parakeet TDT/CTC モデルを使用した音声認識エンジン
@@ -51,6 +64,12 @@ class ParakeetEngine(BaseEngine):
     日本語版: nvidia/parakeet-tdt_ctc-0.6b-ja (CTC)
     """
 
+    # NeMoのtranscribeがndarray入力に対応しているか（None=未確認）
+    _supports_array_input: Optional[bool] = None
+
+    # NeMoモデルが要求するサンプリングレート
+    _REQUIRED_SR = 16000
+
     # モデル名マッピング（定数）
     MODEL_MAPPING = {
         'parakeet': 'nvidia/parakeet-tdt-0.6b-v2',      # 英語モデル
@@ -85,12 +104,47 @@ class ParakeetEngine(BaseEngine):
             self.model_name = model_name
         self.decoding_strategy = decoding_strategy
 
+        # Category B パラメータ（kwargs から取得）
+        # CUDA かつ bf16 対応GPUでモデル全体を bfloat16 で推論する
+        # （実機の NeMo モデルでの精度・動作検証が済むまでデフォルト無効）
+        self.use_bf16 = kwargs.get('use_bf16', False)
+        # ロード完了時にダミー推論を行い、初回呼び出しの初期化コストを先に払う
+        self.warmup = kwargs.get('warmup', True)
+
         super().__init__(device, **kwargs)
         self.model = None
+        self._required_sr = self._REQUIRED_SR
+
+        # WAVファイル経由の文字起こしで使い回す一時ディレクトリ（初回使用時に作成）
+        self._scratch_dir: Optional[str] = None
+        self._scratch_lock = threading.Lock()
+
+        # バックグラウンドで進行中のモデル先行ダウンロード（None=未開始）
+        self._prefetch_future: Optional[Future] = None
+
+        # モデルの重みを bfloat16 に変換済みか（推論時に autocast を掛ける）
+        self._bf16_active = False
+
+        # ModelMemoryCache でモデルの使用を登録済みか（cleanup で release する）
+        self._holds_cached_model = False
+
+        # transcribeにverbose=Falseを渡せるか（None=未確認、モデル設定時にリセット）
+        self._quiet_transcribe: Optional[bool] = None
+
+        # transcribeの戻り値の形式に特化したテキスト抽出関数（None=未確認、モデル設定時にリセット）
+        self._text_extractor: Optional[Callable[[Any], List[str]]] = None
 
         # デバイスの自動検出と設定（共通関数を使用）
         self.torch_device = detect_device(device, "Parakeet")
 
+        # モデルキャッシュのキー（エンジン名・モデル名・デバイス・dtypeで一意）
+        # bf16 変換はキャッシュ上のモデルをその場で変換するため、float32 のモデルと共有しない
+        # インターンしてキャッシュ辞書の検索を同一オブジェクト比較で済ませる
+        dtype_suffix = "_bf16" if self.use_bf16 and self.torch_device == "cuda" else ""
+        self._cache_key = sys.intern(
+            f"parakeet_{self.engine_name}_{self.model_name.replace('/', '_')}_{self.torch_device}{dtype_suffix}"
+        )
+
         # ライブラリ事前ロードを開始（Canaryと同様）
         LibraryPreloader.start_preloading(self.engine_name)
 
@@ -99,8 +153,15 @@ class ParakeetEngine(BaseEngine):
         Step 1: 依存関係の確認（0-10%）
         NeMoの利用可能性をチェック
         """
+        # モデル未取得ならダウンロードを先に開始し、NeMoのインポートと並行させる
+        # （NeMoが存在しない環境では無駄なダウンロードをしない）
+        if importlib.util.find_spec("nemo") is not None:
+            self._start_prefetch(self._get_local_model_path(get_models_dir()))
+
         # NeMoの利用可能性をチェック（初回のみインポートが試行される）
         if not check_nemo_availability():
+            # 進行中のダウンロードは結果を受け取らない（デーモンスレッドのため終了を妨げない）
+            self._prefetch_future = None
             raise ImportError(
                 "NVIDIA NeMo is not installed. Please run: pip install nemo_toolkit[asr]"
             )
@@ -123,6 +184,14 @@ class ParakeetEngine(BaseEngine):
             logger.info(f"ローカルファイルが存在: {model_path}")
             return
 
+        # 先行ダウンロードした .nemo をそのままコピーする（NeMoでの再シリアライズ不要）
+        downloaded = self._wait_for_prefetch(model_path, model_manager)
+        if downloaded is not None:
+            model_path.parent.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Copying prefetched model to: {model_path.resolve()}")
+            shutil.copy2(downloaded, model_path)
+            return
+
         # NeMo 環境準備（PyInstaller 互換性のため）
         prepare_nemo_environment()
 
@@ -130,18 +199,14 @@ class ParakeetEngine(BaseEngine):
         import nemo.collections.asr as nemo_asr
         from nemo.utils import logging as nemo_logging
 
-        # NeMoの警告ログを抑制
-        nemo_logger = logging.getLogger('nemo_logger')
-        original_level = nemo_logger.level
-        nemo_logger.setLevel(logging.ERROR)
-
         manager = model_manager or getattr(self, "model_manager", None)
         if manager is None:
             from livecap_cli.resources import get_model_manager
 
             manager = get_model_manager()
 
-        try:
+        # NeMoの警告ログを抑制
+        with suppress_nemo_logs():
             with unicode_safe_download_directory() as temp_dir:
                 logger.info(f"Using download temporary directory: {temp_dir}")
                 with manager.huggingface_cache():
@@ -171,17 +236,68 @@ class ParakeetEngine(BaseEngine):
                             logger.error(f"Model not found at {wrong_path} either.")
                             
                     del model
-        finally:
-            nemo_logger.setLevel(original_level)
+
+    def _start_prefetch(self, model_path: Path, model_manager=None) -> None:
+        """モデルファイルの先行ダウンロードをバックグラウンドで開始"""
+        if self._prefetch_future is not None or model_path.exists():
+            return
+
+        # ThreadPoolExecutor のワーカーはインタプリタ終了時に join されるため、
+        # 初期化が失敗しても終了がダウンロード完了まで待たされないようデーモンスレッドで実行する
+        future: Future = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self._prefetch_model(model_manager))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="ParakeetPrefetch", daemon=True).start()
+        self._prefetch_future = future
+
+    def _wait_for_prefetch(self, model_path: Path, model_manager=None) -> Optional[Path]:
+        """先行ダウンロードの完了を待ち、取得した .nemo ファイルのパスを返す
+
+        失敗した場合は None を返し、呼び出し側は from_pretrained にフォールバックする。
+        """
+        self._start_prefetch(model_path, model_manager)
+        future, self._prefetch_future = self._prefetch_future, None
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Model prefetch failed, falling back to NeMo download: {e}")
+            return None
+
+    def _prefetch_model(self, model_manager=None) -> Optional[Path]:
+        """Hugging Faceから .nemo ファイルのみをダウンロード（ワーカースレッドで実行）"""
+        import huggingface_hub as hf
+
+        manager = model_manager or getattr(self, "model_manager", None)
+        if manager is None:
+            from livecap_cli.resources import get_model_manager
+
+            manager = get_model_manager()
+
+        # 環境変数を書き換えるコンテキストはメインスレッドと競合するため、
+        # キャッシュディレクトリは引数で明示する
+        cache_dir = manager.cache_root / "huggingface"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        downloaded_dir = hf.snapshot_download(
+            self.model_name, allow_patterns=["*.nemo"], cache_dir=str(cache_dir)
+        )
+        return next(Path(downloaded_dir).glob("*.nemo"), None)
 
     def _load_model_from_path(self, model_path: Path) -> Any:
         """
         Step 4: モデルファイルからロード（70-90%）
         """
-        # キャッシュキーを生成
-        cache_key = f"parakeet_{self.engine_name}_{self.model_name.replace('/', '_')}_{self.torch_device}"
-
         # キャッシュから取得を試みる
+        cache_key = self._cache_key
         cached_model = ModelMemoryCache.get(cache_key)
         if cached_model is not None:
             logger.info(f"キャッシュからモデルを取得: {cache_key}")
@@ -195,11 +311,7 @@ class ParakeetEngine(BaseEngine):
         from nemo.utils import logging as nemo_logging
 
         # NeMoの警告ログを抑制
-        nemo_logger = logging.getLogger('nemo_logger')
-        original_level = nemo_logger.level
-        nemo_logger.setLevel(logging.ERROR)
-
-        try:
+        with suppress_nemo_logs():
             # ローカルファイルからロード
             logger.info(f"ローカルファイルからモデルをロード: {model_path}")
             # ASRModelを使用（適切な具象クラスが自動的に選択される）
@@ -209,17 +321,12 @@ class ParakeetEngine(BaseEngine):
             )
 
             # キャッシュに保存
-            # 環境変数でstrong cacheが有効な場合は強参照でキャッシュ
-            use_strong_cache = os.environ.get('LIVECAP_ENGINE_STRONG_CACHE', '').lower() in ('1', 'true', 'yes')
-            ModelMemoryCache.set(cache_key, model, strong=use_strong_cache)
-            logger.info(f"モデルをキャッシュに保存: {cache_key} (strong={use_strong_cache})")
+            # 環境変数で無効化されていない限り強参照でキャッシュ
+            ModelMemoryCache.set(cache_key, model, strong=_STRONG_CACHE)
+            logger.info(f"モデルをキャッシュに保存: {cache_key} (strong={_STRONG_CACHE})")
 
             return model
 
-        finally:
-            # NeMoのログレベルを元に戻す
-            nemo_logger.setLevel(original_level)
-
     def _configure_model(self) -> None:
         """
         Step 5: モデルの設定（90-100%）
@@ -230,6 +337,19 @@ class ParakeetEngine(BaseEngine):
         # 評価モードに設定
         self.model.eval()
 
+        if not self._holds_cached_model:
+            ModelMemoryCache.acquire(self._cache_key)
+            self._holds_cached_model = True
+
+        self._quiet_transcribe = None
+        self._text_extractor = None
+
+        # bf16 対応GPUではモデルの重みを bfloat16 に変換
+        # （重みを事前に変換しておくことで、推論毎の autocast による重みのキャストを避ける）
+        self._bf16_active = False
+        if self.use_bf16 and self.torch_device == "cuda":
+            self._convert_to_bf16()
+
         # デコーディング戦略の設定
         if hasattr(self.model, 'change_decoding_strategy'):
             try:
@@ -249,8 +369,42 @@ class ParakeetEngine(BaseEngine):
                     logger.warning(f"Could not set decoding strategy: {e}")
                     # デコーディング戦略の設定に失敗してもモデルは使用可能
 
+        if self.warmup:
+            self._warmup()
+
         logger.info(f"{self.engine_name} model initialization complete")
 
+    def _warmup(self) -> None:
+        """1秒の無音でダミー推論を行う（失敗しても無視）
+
+        cuDNN のアルゴリズム選択や CUDA キャッシングアロケータの確保など、
+        初回推論でのみ発生するコストをモデルロード中に済ませる。
+        """
+        try:
+            # 戻り値の形式もここで判定し、テキスト抽出関数を確定させる
+            self._result_texts(self._transcribe_prepared([np.zeros(self._required_sr, dtype=np.float32)]))
+            logger.debug(f"{self.engine_name} warmup inference complete")
+        except Exception as e:
+            # bf16 の dtype 不一致など、実際の推論でも起きる問題の可能性があるため警告で出す
+            logger.warning(f"{self.engine_name} warmup inference failed (ignored): {e}")
+
+    def _convert_to_bf16(self) -> None:
+        """モデルを bfloat16 に変換する（非対応環境や失敗時は float32 のまま）"""
+        try:
+            import torch
+            if not torch.cuda.is_bf16_supported():
+                logger.debug("bf16 is not supported on this GPU, keeping float32")
+                return
+            self.model = self.model.to(torch.bfloat16)
+            # 特徴量抽出（STFT・メルフィルタバンク）は float32 のまま実行する
+            preprocessor = getattr(self.model, 'preprocessor', None)
+            if preprocessor is not None:
+                preprocessor.float()
+            self._bf16_active = True
+            logger.info(f"{self.engine_name} model converted to bfloat16")
+        except Exception as e:
+            logger.warning(f"Could not convert model to bfloat16: {e}")
+
     def load_model(self) -> None:
         """モデルをロードする（Windowsパス問題のワークアラウンド付き）"""
         # model_managerへのアクセス（遅延初期化）
@@ -293,6 +447,46 @@ class ParakeetEngine(BaseEngine):
         # Parakeetは長時間音声も処理可能
         return self._transcribe_single_chunk(audio_data, sample_rate)
     
+    def transcribe_batch(
+        self, audio_chunks: List[np.ndarray], sample_rate: int
+    ) -> List[Tuple[str, float]]:
+        """
+        複数の音声チャンクを1回のtranscribe呼び出しでまとめて文字起こしする
+
+        Args:
+            audio_chunks: 音声データ（numpy配列）のリスト
+            sample_rate: サンプリングレート（全チャンク共通）
+
+        Returns:
+            チャンク毎の(transcription_text, confidence_score)のリスト
+        """
+        if not self._initialized or self.model is None:
+            raise RuntimeError("Engine not initialized. Call load_model() first.")
+
+        results: List[Tuple[str, float]] = [("", 1.0)] * len(audio_chunks)
+
+        # 短すぎるチャンクは空文字のまま、残りを1バッチにまとめる
+        indices = []
+        prepared = []
+        for i, audio_data in enumerate(audio_chunks):
+            samples = self._prepare_audio(audio_data, sample_rate)
+            if samples is not None:
+                indices.append(i)
+                prepared.append(samples)
+
+        if not prepared:
+            return results
+
+        try:
+            texts = self._result_texts(self._transcribe_prepared(prepared))
+            for i, text in zip(indices, texts):
+                results[i] = (text, 1.0)
+            return results
+
+        except Exception as e:
+            logger.error(f"Error during transcription: {e}")
+            raise
+
     def _transcribe_single_chunk(self, audio_data: np.ndarray, sample_rate: int) -> Tuple[str, float]:
         """
         単一の音声チャンクを文字起こしする（内部使用）
@@ -306,136 +500,298 @@ class ParakeetEngine(BaseEngine):
         """
         if not self._initialized or self.model is None:
             raise RuntimeError("Engine not initialized. Call load_model() first.")
-            
-        # モデルが要求するサンプリングレートに変換
-        required_sr = self.get_required_sample_rate()
-        if sample_rate != required_sr:
-            import librosa
-            audio_data = librosa.resample(
-                audio_data, 
-                orig_sr=sample_rate, 
-                target_sr=required_sr
-            )
-            
-        # float32に変換し、正規化
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-            
-        # 音声データの正規化（-1.0 から 1.0の範囲）
-        if np.abs(audio_data).max() > 1.0:
-            audio_data = audio_data / np.abs(audio_data).max()
-            
-        # デバッグ: 音声データの情報
-        logger.debug(f"Audio data shape: {audio_data.shape}")
-        logger.debug(f"Audio duration: {len(audio_data) / self.get_required_sample_rate():.2f} seconds")
-        logger.debug(f"Audio max amplitude: {np.abs(audio_data).max():.4f}")
-        
-        # 音声が短すぎる場合の処理
-        min_duration = 0.1  # 最小0.1秒
-        min_samples = int(min_duration * self.get_required_sample_rate())
-        if len(audio_data) < min_samples:
-            logger.warning(f"Audio too short: {len(audio_data)} samples < {min_samples} samples")
+
+        audio_data = self._prepare_audio(audio_data, sample_rate)
+        if audio_data is None:
             return "", 1.0
             
         try:
-            # NeMoのtranscribeメソッドはファイルパスのリストを期待するため、
-            # 一時ファイルを作成して音声を保存
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                tmp_filename = tmp_file.name
-                
-                # 音声データを一時ファイルに保存
-                # モデルが要求するサンプリングレートで保存
-                sf.write(tmp_filename, audio_data, self.get_required_sample_rate())
-                
-            try:
-                # プログレスバーを抑制
-                old_tqdm = os.environ.get('TQDM_DISABLE')
-                os.environ['TQDM_DISABLE'] = '1'
-                
-                # 標準出力を一時的にキャプチャ
-                old_stdout = sys.stdout
-                sys.stdout = StringIO()
-                
-                try:
-                    # NeMoのtranscribeメソッドを使用（ファイルパスのリストを渡す）
-                    # TDTモデルでは'audio'パラメータを使用
-                    transcriptions = self.model.transcribe(
-                        audio=[tmp_filename],
-                        batch_size=1
-                    )
-                finally:
-                    # 標準出力を元に戻す
-                    sys.stdout = old_stdout
-                    
-                    # 環境変数を元に戻す
-                    if old_tqdm is None:
-                        if 'TQDM_DISABLE' in os.environ:
-                            del os.environ['TQDM_DISABLE']
-                    else:
-                        os.environ['TQDM_DISABLE'] = old_tqdm
-                
-                # 結果を取得
-                # デバッグ: 結果の型と内容を確認
-                logger.debug(f"Transcription result type: {type(transcriptions)}")
-                logger.debug(f"Transcription result: {transcriptions}")
-                
-                # NeMo TDTモデルはタプルまたはリストを返すことがある
-                if isinstance(transcriptions, tuple):
-                    # タプルの場合、最初の要素が文字起こし結果
-                    if len(transcriptions) > 0 and isinstance(transcriptions[0], list):
-                        result = transcriptions[0][0] if len(transcriptions[0]) > 0 else ""
-                    else:
-                        result = transcriptions[0] if len(transcriptions) > 0 else ""
-                elif isinstance(transcriptions, list) and len(transcriptions) > 0:
-                    # 最初の結果を取得（単一ファイルなので1つだけ）
-                    result = transcriptions[0] if transcriptions[0] else ""
-                elif isinstance(transcriptions, str):
-                    result = transcriptions
-                else:
-                    result = ""
-                    logger.warning(f"Unexpected transcription result type: {type(transcriptions)}")
-                
-                # Hypothesisオブジェクトから文字列を取得
-                if hasattr(result, 'text'):
-                    # Hypothesisオブジェクトの場合、.textプロパティを使用
-                    text = result.text if result.text else ""
-                elif hasattr(result, 'pred_text'):
-                    # 別のプロパティ名の可能性
-                    text = result.pred_text if result.pred_text else ""
-                elif isinstance(result, str):
-                    # すでに文字列の場合
-                    text = result
-                else:
-                    # その他の場合は文字列に変換
-                    text = str(result) if result else ""
-                
-                # 文字列であることを確認してからstrip()を呼び出す
-                if isinstance(text, str):
-                    text = text.strip()
-                else:
-                    logger.warning(f"Unexpected text type: {type(text)}, converting to string")
-                    text = str(text).strip() if text else ""
-                
-                logger.debug(f"Parakeet transcription: '{text}'")
-                    
+            transcriptions = self._transcribe_prepared([audio_data])
+
+            # 結果を取得
+            # デバッグ: 結果の型と内容を確認（DEBUG無効時は文字列化を省略）
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("Transcription result type: %s", type(transcriptions))
+                logger.debug("Transcription result: %s", transcriptions)
+
+            # 最初の結果を取得（単一チャンクなので1つだけ）
+            texts = self._result_texts(transcriptions)
+            text = texts[0] if texts else ""
+
+            if debug_enabled:
+                logger.debug("Parakeet transcription: '%s'", text)
+
                 # 空の結果をチェック
-                if not text or text == "":
+                if not text:
                     logger.debug("Parakeet returned empty transcription")
-                    
-                # 信頼度スコア（TDTでは利用不可）
-                confidence = 1.0
-                
-                return text, confidence
-                
-            finally:
-                # 一時ファイルを削除
-                if os.path.exists(tmp_filename):
-                    os.unlink(tmp_filename)
-                
+
+            # 信頼度スコア（TDTでは利用不可）
+            confidence = 1.0
+
+            return text, confidence
+
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
             raise
-            
+
+    def _prepare_audio(self, audio_data: np.ndarray, sample_rate: int) -> Optional[np.ndarray]:
+        """
+        音声をモデル入力用に変換する（リサンプル・float32化・正規化）
+
+        Returns:
+            変換後の音声。短すぎる場合はNone
+        """
+        # 音声が短すぎる場合は変換前に除外する（入力サンプリングレートで最小0.1秒）
+        min_samples = sample_rate // 10
+        if len(audio_data) < min_samples:
+            logger.warning(f"Audio too short: {len(audio_data)} samples < {min_samples} samples")
+            return None
+
+        # int16 PCM は変換とスケーリングを1パスで行う（値域が既知のためピーク走査は不要）
+        bounded = audio_data.dtype == np.int16
+        if bounded:
+            audio_data = audio_data.astype(np.float32)
+            audio_data *= 1.0 / 32768.0
+
+        # モデルが要求するサンプリングレートに変換
+        required_sr = self._required_sr
+        if sample_rate != required_sr:
+            # 整数比のポリフェーズリサンプリング（48kHz→16kHz は 1:3）
+            g = gcd(sample_rate, required_sr)
+            audio_data = resample_poly(audio_data, required_sr // g, sample_rate // g)
+
+        # float32に変換（既にfloat32ならコピーしない）
+        samples = np.asarray(audio_data, dtype=np.float32)
+
+        if not bounded:
+            # 音声データの正規化（-1.0 から 1.0の範囲、ピーク値は1回だけ計算）
+            peak = float(np.abs(samples).max()) if samples.size else 0.0
+            if peak > 1.0:
+                if samples is audio_data:
+                    # 呼び出し元のバッファは書き換えない
+                    samples = samples / peak
+                else:
+                    np.multiply(samples, 1.0 / peak, out=samples)
+
+        # デバッグ: 音声データの情報（DEBUG無効時は文字列整形を省略）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Audio data shape: {samples.shape}")
+            logger.debug(f"Audio duration: {len(samples) / required_sr:.2f} seconds")
+            if samples.size:
+                logger.debug(f"Audio max amplitude: {float(np.abs(samples).max()):.4f}")
+
+        return samples
+
+    def _transcribe_prepared(self, audio_chunks: List[np.ndarray]) -> Any:
+        """変換済みの音声チャンクをParakeetで文字起こしする"""
+        # NeMo 2.x は ndarray を直接受け付けるため、WAVファイルの往復を省略する
+        if ParakeetEngine._supports_array_input is not False:
+            try:
+                transcriptions = self._run_model_transcribe(audio_chunks)
+                ParakeetEngine._supports_array_input = True
+                return transcriptions
+            except (TypeError, ValueError, AttributeError) as e:
+                if ParakeetEngine._supports_array_input:
+                    raise
+                # 旧バージョンのNeMoはファイルパスのみ対応
+                logger.debug(f"ndarray input not supported, falling back to WAV file: {e}")
+                ParakeetEngine._supports_array_input = False
+
+        return self._transcribe_via_wav_file(audio_chunks)
+
+    def _transcribe_via_wav_file(self, audio_chunks: List[np.ndarray]) -> Any:
+        """一時WAVファイル経由で文字起こしする（ndarray非対応のNeMo用）
+
+        呼び出し毎の作成・削除を避けるため、インスタンス専用の
+        一時ディレクトリ内の同じファイルを上書きして使い回す。
+        """
+        # WAV経由はndarray非対応の旧NeMoでのみ使うため、libsndfileのロードはここまで遅延させる
+        import soundfile as sf
+        import tempfile
+
+        with self._scratch_lock:
+            if self._scratch_dir is None:
+                self._scratch_dir = tempfile.mkdtemp(prefix='livecap_parakeet_')
+
+            # 音声データを一時ファイルに保存（既存の内容は上書きされる）
+            # モデルが要求するサンプリングレートで、16bit PCMに量子化して保存
+            # （正規化済みのため範囲外の値は無く、float32の半分のサイズで済む）
+            scratch_paths = []
+            for i, audio_data in enumerate(audio_chunks):
+                scratch_path = os.path.join(self._scratch_dir, f'chunk_{i}.wav')
+                sf.write(scratch_path, audio_data, self._required_sr, subtype='PCM_16')
+                scratch_paths.append(scratch_path)
+
+            return self._run_model_transcribe(scratch_paths)
+
+    def _run_model_transcribe(self, audio: list) -> Any:
+        """プログレスバーを抑制してParakeetのtranscribeを呼び出す
+
+        Args:
+            audio: ファイルパスまたはndarrayのリスト
+        """
+        if self._quiet_transcribe is None:
+            self._quiet_transcribe = self._supports_verbose_flag()
+
+        # CTC/TDT の経路によらず autograd の記録を確実に無効化する
+        with inference_mode(), self._bf16_autocast():
+            if self._quiet_transcribe:
+                # verbose=False ならプロセス全体の状態を変更せずにプログレスバーを抑制できる
+                # TDTモデルでは'audio'パラメータを使用
+                return self.model.transcribe(
+                    audio=audio,
+                    batch_size=len(audio),
+                    verbose=False
+                )
+            return self._run_model_transcribe_legacy(audio)
+
+    def _bf16_autocast(self) -> ContextManager[Any]:
+        """bf16 変換済みのモデル用に autocast を返す（それ以外は何もしないコンテキスト）
+
+        float32 のまま出力される前処理の特徴量を、bfloat16 の重みを持つ
+        エンコーダ・デコーダの演算に合わせてキャストする。重みは変換済みのため
+        autocast による重みのキャストは発生しない。
+        """
+        if not self._bf16_active:
+            return nullcontext()
+        import torch
+        return torch.autocast(device_type='cuda', dtype=torch.bfloat16)
+
+    def _supports_verbose_flag(self) -> bool:
+        """モデルのtranscribeがverbose引数を受け付けるかを判定する"""
+        try:
+            parameters = inspect.signature(self.model.transcribe).parameters
+        except (TypeError, ValueError):
+            return False
+        return 'verbose' in parameters or any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+        )
+
+    def _run_model_transcribe_legacy(self, audio: list) -> Any:
+        """環境変数と標準出力の差し替えでプログレスバーを抑制する（verbose非対応のNeMo用）
+
+        プロセス全体の状態を一時的に変更するため、スレッドセーフではない。
+        """
+        # プログレスバーを抑制
+        old_tqdm = os.environ.get('TQDM_DISABLE')
+        os.environ['TQDM_DISABLE'] = '1'
+
+        # 標準出力を一時的にキャプチャ
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+
+        try:
+            # NeMoのtranscribeメソッドを使用
+            # TDTモデルでは'audio'パラメータを使用
+            return self.model.transcribe(
+                audio=audio,
+                batch_size=len(audio)
+            )
+        finally:
+            # 標準出力を元に戻す
+            sys.stdout = old_stdout
+
+            # 環境変数を元に戻す
+            if old_tqdm is None:
+                if 'TQDM_DISABLE' in os.environ:
+                    del os.environ['TQDM_DISABLE']
+            else:
+                os.environ['TQDM_DISABLE'] = old_tqdm
+
+    def _result_texts(self, transcriptions: Any) -> List[str]:
+        """transcribeの戻り値から入力順のテキストリストを取り出す
+
+        戻り値の形式はモデル毎に固定のため、初回に形式を判定して
+        特化した抽出関数を使い回す。
+        """
+        extractor = self._text_extractor
+        if extractor is None:
+            extractor = self._select_text_extractor(transcriptions)
+        return extractor(transcriptions)
+
+    def _select_text_extractor(self, transcriptions: Any) -> Callable[[Any], List[str]]:
+        """戻り値の形式に応じたテキスト抽出関数を選択する（判定できた場合は記録）"""
+        results = transcriptions
+        if isinstance(results, tuple) and results and isinstance(results[0], list):
+            results = results[0]
+            fast = self._texts_from_hypothesis_tuple
+        else:
+            fast = self._texts_from_hypotheses
+
+        if not isinstance(results, list) or not results:
+            # 判定できない形式・空の結果は汎用の抽出を使う（記録しない）
+            return self._texts_generic
+
+        if all(isinstance(getattr(r, 'text', None), str) for r in results):
+            extractor = fast
+        elif fast is self._texts_from_hypotheses and all(isinstance(r, str) for r in results):
+            extractor = self._texts_from_strings
+        else:
+            extractor = self._texts_generic
+
+        self._text_extractor = extractor
+        return extractor
+
+    @staticmethod
+    def _texts_from_hypotheses(transcriptions: List[Any]) -> List[str]:
+        """list[Hypothesis] からテキストを取り出す（TDT/CTC）"""
+        return [(h.text or "").strip() for h in transcriptions]
+
+    @staticmethod
+    def _texts_from_hypothesis_tuple(transcriptions: Tuple[List[Any], Any]) -> List[str]:
+        """(list[Hypothesis], ...) からテキストを取り出す（旧RNNT API）"""
+        return [(h.text or "").strip() for h in transcriptions[0]]
+
+    @staticmethod
+    def _texts_from_strings(transcriptions: List[str]) -> List[str]:
+        """list[str] からテキストを取り出す"""
+        return [t.strip() for t in transcriptions]
+
+    @classmethod
+    def _texts_generic(cls, transcriptions: Any) -> List[str]:
+        """形式を都度判定してテキストを取り出す"""
+        return [cls._extract_text(r) for r in cls._unpack_transcriptions(transcriptions)]
+
+    @staticmethod
+    def _unpack_transcriptions(transcriptions: Any) -> list:
+        """transcribeの戻り値を入力順の結果リストに正規化する"""
+        # NeMo TDTモデルはタプルまたはリストを返すことがある
+        if isinstance(transcriptions, tuple):
+            # タプルの場合、最初の要素が文字起こし結果
+            if len(transcriptions) > 0 and isinstance(transcriptions[0], list):
+                return list(transcriptions[0])
+            return list(transcriptions)
+        if isinstance(transcriptions, list):
+            return transcriptions
+        if isinstance(transcriptions, str):
+            return [transcriptions]
+        logger.warning(f"Unexpected transcription result type: {type(transcriptions)}")
+        return []
+
+    @staticmethod
+    def _extract_text(result: Any) -> str:
+        """transcribeの結果要素（Hypothesisまたは文字列）からテキストを取り出す"""
+        # Hypothesisオブジェクトから文字列を取得
+        if hasattr(result, 'text'):
+            # Hypothesisオブジェクトの場合、.textプロパティを使用
+            text = result.text if result.text else ""
+        elif hasattr(result, 'pred_text'):
+            # 別のプロパティ名の可能性
+            text = result.pred_text if result.pred_text else ""
+        elif isinstance(result, str):
+            # すでに文字列の場合
+            text = result
+        else:
+            # その他の場合は文字列に変換
+            text = str(result) if result else ""
+
+        # 文字列であることを確認してからstrip()を呼び出す
+        if isinstance(text, str):
+            return text.strip()
+        logger.warning(f"Unexpected text type: {type(text)}, converting to string")
+        return str(text).strip() if text else ""
+
     def get_engine_name(self) -> str:
         """エンジン名を取得"""
         if self.engine_name == 'parakeet_ja':
@@ -451,16 +807,28 @@ class ParakeetEngine(BaseEngine):
     def get_required_sample_rate(self) -> int:
         """エンジンが要求するサンプリングレートを取得"""
         # NeMoモデルは通常16kHzを使用
-        return 16000
+        return self._required_sr
         
     def cleanup(self) -> None:
         """リソースのクリーンアップ"""
+        # 使い回していた一時WAVファイルを削除
+        with self._scratch_lock:
+            if self._scratch_dir is not None:
+                shutil.rmtree(self._scratch_dir, ignore_errors=True)
+                self._scratch_dir = None
+
         if self.model is not None:
             # GPUメモリを解放
             del self.model
             self.model = None
-            
-            if self.torch_device == "cuda":
+
+        if self._holds_cached_model:
+            self._holds_cached_model = False
+            last_model = ModelMemoryCache.release(self._cache_key)
+
+            # empty_cache() は同期を伴い、キャッシングアロケータの再利用も妨げるため、
+            # 同じモデルを使用中のエンジンが無くなった時だけ呼び出す
+            if last_model and self.torch_device == "cuda":
                 # 遅延インポート: 必要な時のみtorchをインポート
                 try:
                     import torch
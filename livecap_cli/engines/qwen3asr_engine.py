@@ -406,9 +406,11 @@ class Qwen3ASREngine(BaseEngine):
                 return text, confidence
 
             finally:
-                # 一時ファイルを削除
-                if os.path.exists(tmp_filename):
+                # 一時ファイルを削除（存在確認を挟まず1回のシステムコールで済ませる）
+                try:
                     os.unlink(tmp_filename)
+                except FileNotFoundError:
+                    pass
 
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
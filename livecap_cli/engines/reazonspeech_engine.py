@@ -111,6 +111,10 @@ class ReazonSpeechEngine(BaseEngine):
                     logger.info("ReazonSpeech model moved successfully.")
                 except Exception as e:
                     logger.error(f"Failed to move ReazonSpeech model: {e}")
+
+        # ONNX モデルファイルの先読みを依存関係チェックと並行して開始
+        if model_path.is_dir():
+            LibraryPreloader.warm_model_files(model_path)
         
         # 親クラスの標準ロード処理を実行
         super().load_model()
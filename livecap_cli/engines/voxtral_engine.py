@@ -8,13 +8,21 @@ This installs:
 - transformers>=4.57.0 (for VoxtralForConditionalGeneration)
 - mistral-common[audio]>=1.8.1 (for audio processing)
 """
+import importlib.util
 import os
 import logging
+import re
+import threading
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 import numpy as np
 import tempfile
 import soundfile as sf
+from scipy.signal import resample_poly
 
 from .base_engine import BaseEngine
 from .model_memory_cache import ModelMemoryCache
@@ -28,18 +36,106 @@ logger = logging.getLogger(__name__)
 # Transformersの遅延インポート
 TRANSFORMERS_AVAILABLE = None
 
+# check_transformers_availability で解決したVoxtral用クラス（None=未解決または非対応バージョン）
+_VOXTRAL_CLS = None
+_PROCESSOR_CLS = None
+
+# mistral-commonのバージョン（None=未確認）
+_MISTRAL_COMMON_VERSION: Optional[str] = None
+
+
+@dataclass
+class _VoxtralBundle:
+    """ModelMemoryCache に保持するモデルとプロセッサの組
+
+    タプルは弱参照できず常に強参照でキャッシュされるため、1つのオブジェクトにまとめる。
+    """
+    model: Any
+    processor: Any
+
+
+class _RepetitionStoppingCriteria:
+    """2〜max_ngram トークンの同じ並びが末尾 span トークンを埋め尽くした行の生成を打ち切る
+
+    transformers の StoppingCriteria と同じ呼び出し規約で、generate の
+    stopping_criteria に渡す。反復に陥った場合に max_new_tokens まで
+    デコードし続けるのを防ぐ。
+    単一トークンの連続（数字の繰り返しや「ははは」等、実際の発話でも起こる）では打ち切らない。
+    """
+
+    def __init__(self, span: int, max_ngram: int = 4):
+        self.span = span
+        self.max_ngram = max_ngram
+
+    def __call__(self, input_ids: Any, scores: Any, **kwargs) -> Any:
+        # プロンプト（音声トークンを含む）は span より長いため、末尾は常に span トークン分ある
+        tail = input_ids[:, -self.span:]
+        periodic = None
+        for n in range(2, self.max_ngram + 1):
+            # 周期 n で繰り返しているか（n トークンずらした並びと一致するか）
+            match = (tail[:, n:] == tail[:, :-n]).all(-1)
+            periodic = match if periodic is None else periodic | match
+        single_token_run = (tail == tail[:, -1:]).all(-1)
+        return periodic & ~single_token_run
+
+
+# ワーカープロセス間でモデルの重みを共有する（LIVECAP_VOXTRAL_SHARED=1 で有効化）
+_SHARED_MODEL = os.environ.get('LIVECAP_VOXTRAL_SHARED', '').lower() in ('1', 'true', 'yes')
+
+# ndarray入力時にプロセッサがメモリ上のバッファへ書き出す形式
+# （format 未指定だと ValueError となり、一時ファイル経由にフォールバックしてしまう）
+_ARRAY_AUDIO_FORMAT = "wav"
+
+# 句読点直前の空白（デコード結果の後処理用）
+_PUNCT_SPACE_RE = re.compile(r" ([.,?!])")
+
+# cleanup 時に empty_cache() を呼ぶ、未使用の予約済みGPUメモリの下限（MB）
+# 環境変数 LIVECAP_CUDA_EMPTY_CACHE_THRESHOLD_MB で上書き可能
+_DEFAULT_EMPTY_CACHE_THRESHOLD_MB = 256
+
+
+@lru_cache(maxsize=None)
+def _resample_factors(src_sr: int, dst_sr: int) -> Tuple[int, int]:
+    """resample_poly に渡す (up, down) をサンプリングレートの組み合わせ毎に1回だけ計算"""
+    g = gcd(src_sr, dst_sr)
+    return dst_sr // g, src_sr // g
+
+
+def _get_empty_cache_threshold() -> int:
+    """環境変数から empty_cache() の閾値（バイト）を取得（安全なパース）"""
+    env_value = os.environ.get("LIVECAP_CUDA_EMPTY_CACHE_THRESHOLD_MB")
+    if env_value is None:
+        return _DEFAULT_EMPTY_CACHE_THRESHOLD_MB * 1024 * 1024
+
+    try:
+        threshold_mb = float(env_value)
+    except ValueError:
+        logger.warning(
+            "Invalid LIVECAP_CUDA_EMPTY_CACHE_THRESHOLD_MB value '%s', using default %dMB",
+            env_value,
+            _DEFAULT_EMPTY_CACHE_THRESHOLD_MB,
+        )
+        return _DEFAULT_EMPTY_CACHE_THRESHOLD_MB * 1024 * 1024
+
+    return int(max(threshold_mb, 0.0) * 1024 * 1024)
+
+# 対応する重み量子化の種類（None=量子化なし）
+_QUANTIZATION_MODES = (None, "int8", "nf4", "fp8")
+
 
 def check_transformers_availability():
     """Transformersの利用可能性をチェック（遅延実行）"""
-    global TRANSFORMERS_AVAILABLE
+    global TRANSFORMERS_AVAILABLE, _VOXTRAL_CLS, _PROCESSOR_CLS
     if TRANSFORMERS_AVAILABLE is not None:
         return TRANSFORMERS_AVAILABLE
 
     try:
         import transformers
-        # Voxtral用のクラスをチェック
+        # Voxtral用のクラスをチェック（以降の呼び出しでは再インポートしない）
         try:
             from transformers import VoxtralForConditionalGeneration, AutoProcessor
+            _VOXTRAL_CLS = VoxtralForConditionalGeneration
+            _PROCESSOR_CLS = AutoProcessor
         except ImportError:
             # VoxtralForConditionalGenerationが見つからない場合
             logger.warning("VoxtralForConditionalGeneration not found in current transformers version")
@@ -57,9 +153,31 @@ def check_transformers_availability():
     return TRANSFORMERS_AVAILABLE
 
 
+def check_mistral_common_availability() -> bool:
+    """mistral-commonの利用可能性をチェック（バージョンは初回のみ取得）"""
+    global _MISTRAL_COMMON_VERSION
+    if _MISTRAL_COMMON_VERSION is not None:
+        return True
+
+    try:
+        import mistral_common
+    except ImportError:
+        return False
+
+    _MISTRAL_COMMON_VERSION = getattr(mistral_common, '__version__', 'unknown')
+    logger.info(f"mistral-common version: {_MISTRAL_COMMON_VERSION}")
+    return True
+
+
 class VoxtralEngine(BaseEngine):
     """MistralAI Voxtral Mini 3Bを使用した音声認識エンジン - Template Method版"""
 
+    # apply_transcription_requestがndarray入力に対応しているか（None=未確認）
+    _supports_array_input: Optional[bool] = None
+
+    # forward をコンパイル済みのモデル（キャッシュ共有されたモデルの二重コンパイル防止）
+    _compiled_models = weakref.WeakSet()
+
     def __init__(
         self,
         device: Optional[str] = None,
@@ -91,15 +209,53 @@ class VoxtralEngine(BaseEngine):
         self.do_sample = do_sample
         self.max_new_tokens = max_new_tokens
 
+        # Category B パラメータ（kwargs から取得）
+        # CUDA 使用時に forward を torch.compile する（ロード時にコンパイル時間がかかるため既定は無効）
+        self.torch_compile = kwargs.get('torch_compile', False)
+        # 同じ2〜4トークンの並びの繰り返しが末尾のこのトークン数を埋めたら生成を打ち切る
+        # （0=無効。実際の発話を途中で切らないよう、有効にする場合は 32 程度の大きな値を推奨）
+        self.repetition_stop_tokens = kwargs.get('repetition_stop_tokens', 0)
+        # CUDA 使用時の重み量子化（None, "int8", "nf4", "fp8"、bitsandbytes / torchao が必要）
+        self.quantization = kwargs.get('quantization')
+        if self.quantization not in _QUANTIZATION_MODES:
+            raise ValueError(
+                f"Unsupported quantization: {self.quantization!r} "
+                f"(expected one of {sorted(m for m in _QUANTIZATION_MODES if m)})"
+            )
+
         super().__init__(device, **kwargs)
         self.model = None
         self.processor = None
 
+        # float32変換・正規化で使い回すスクラッチバッファ（必要に応じて拡張）
+        self._scratch = np.empty(0, dtype=np.float32)
+        self._scratch_lock = threading.Lock()
+
+        # キャッシュ中のモデルとプロセッサの組（None=未ロード）
+        self._bundle: Optional[_VoxtralBundle] = None
+
+        # generate に渡す生成設定（None=未構築、モデル設定時に構築）
+        self._gen_kwargs: Optional[Dict[str, Any]] = None
+
+        # 音声特徴量のdtype（None=変換しない、モデル設定時に決定）
+        self._input_dtype = None
+
+        # 入力のH2D転送用CUDAストリーム（None=既定ストリームで同期転送）
+        self._copy_stream = None
+
+        # モデルが要求するサンプリングレート（チャンク毎に問い合わせないよう1回だけ取得）
+        self._required_sr = self.get_required_sample_rate()
+
         # デバイスの自動検出と設定（共通関数を使用）
         self.torch_device = detect_device(device, "Voxtral")
 
+        # 量子化はCUDA専用（bitsandbytes / torchao のカーネルがGPU前提のため）
+        if self.quantization and self.torch_device != "cuda":
+            logger.warning(f"Voxtral quantization '{self.quantization}' requires CUDA; loading unquantized weights")
+            self.quantization = None
+
         # GPU RAM警告
-        if self.torch_device == "cuda":
+        if self.torch_device == "cuda" and not self.quantization:
             logger.info("Voxtral requires ~9.5GB GPU RAM. Ensure sufficient memory is available.")
 
         # ライブラリ事前ロードを開始
@@ -137,10 +293,8 @@ class VoxtralEngine(BaseEngine):
 
         self.report_progress(6, "Checking Voxtral classes...")
 
-        # VoxtralForConditionalGenerationのチェック
-        try:
-            from transformers import VoxtralForConditionalGeneration, AutoProcessor
-        except ImportError:
+        # VoxtralForConditionalGenerationのチェック（check_transformers_availabilityで解決済み）
+        if _VOXTRAL_CLS is None:
             # 古いバージョンのtransformersの場合
             logger.error(
                 "VoxtralForConditionalGeneration not found. "
@@ -154,11 +308,7 @@ class VoxtralEngine(BaseEngine):
         self.report_progress(8, "Checking mistral-common...")
 
         # mistral-commonの依存関係チェック
-        try:
-            import mistral_common
-            version = getattr(mistral_common, '__version__', 'unknown')
-            logger.info(f"mistral-common version: {version}")
-        except ImportError:
+        if not check_mistral_common_availability():
             logger.error(
                 "mistral-common is not installed. "
                 "Please install: pip install livecap-cli[engines-voxtral]"
@@ -194,12 +344,12 @@ class VoxtralEngine(BaseEngine):
 
             manager = get_model_manager()
 
-        # ここで初めてTransformersモジュールをインポート
-        from transformers import VoxtralForConditionalGeneration, AutoProcessor
+        # _check_dependencies で解決済みのクラスを使う
+        VoxtralForConditionalGeneration, AutoProcessor = _VOXTRAL_CLS, _PROCESSOR_CLS
         import torch
 
         # dtype設定（GPU/CPU最適化）
-        torch_dtype = torch.float16 if self.torch_device == "cuda" else torch.float32
+        torch_dtype = self._select_dtype(torch)
 
         try:
             self.report_progress(30, "Starting model download...")
@@ -218,6 +368,13 @@ class VoxtralEngine(BaseEngine):
                     cache_dir=str(transformers_cache)
                 )
 
+                # プロセッサをロードする前にモデルを保存・解放し、ピークメモリを抑える
+                self.report_progress(45, "Saving model locally...")
+                logger.info(f"モデルをローカルに保存: {model_path}")
+                model.save_pretrained(str(model_path))
+                del model
+                self._release_memory(torch)
+
                 self.report_progress(50, "Downloading processor...")
 
                 processor = AutoProcessor.from_pretrained(
@@ -225,13 +382,8 @@ class VoxtralEngine(BaseEngine):
                     cache_dir=str(transformers_cache)
                 )
 
-            self.report_progress(60, "Saving model locally...")
-
-            logger.info(f"モデルをローカルに保存: {model_path}")
-            model.save_pretrained(str(model_path))
+            self.report_progress(60, "Saving processor locally...")
             processor.save_pretrained(str(model_path))
-
-            del model
             del processor
 
             self.report_progress(70, "Model download complete")
@@ -240,6 +392,14 @@ class VoxtralEngine(BaseEngine):
             logger.error(f"モデルダウンロードエラー: {e}")
             raise
     
+    def _release_memory(self, torch) -> None:
+        """解放済みオブジェクトを回収し、CUDA使用時はキャッシュをドライバに返す"""
+        import gc
+
+        gc.collect()
+        if self.torch_device == "cuda":
+            torch.cuda.empty_cache()
+
     def _load_model_from_path(self, model_path: Path) -> Any:
         """
         Step 4: モデルファイルからロード（70-90%）
@@ -247,43 +407,69 @@ class VoxtralEngine(BaseEngine):
         self.report_progress(75, f"Loading model file: {model_path.name}")
 
         # キャッシュキーを生成
-        cache_key = f"voxtral_{self.model_name.replace('/', '_')}_{self.torch_device}"
+        cache_key = f"voxtral_{self.model_name.replace('/', '_')}_{self.torch_device}_{self.quantization}"
 
         # キャッシュから取得を試みる
         cached_result = ModelMemoryCache.get(cache_key)
         if cached_result is not None:
             self.report_progress(90, "Loading from cache: Voxtral")
             logger.info(f"キャッシュからモデルを取得: {cache_key}")
-            # タプルとして返す（model, processor）
             return cached_result
 
-        # Transformersモジュールをインポート
-        from transformers import VoxtralForConditionalGeneration, AutoProcessor
+        # _check_dependencies で解決済みのクラスを使う
+        VoxtralForConditionalGeneration, AutoProcessor = _VOXTRAL_CLS, _PROCESSOR_CLS
         import torch
 
         # dtype設定（GPU/CPU最適化）
-        torch_dtype = torch.float16 if self.torch_device == "cuda" else torch.float32
+        torch_dtype = self._select_dtype(torch)
 
         try:
             self.report_progress(80, "Restoring Voxtral model...")
 
             # ローカルファイルからロード
             logger.info(f"ローカルファイルからモデルをロード: {model_path}")
-            model = VoxtralForConditionalGeneration.from_pretrained(
-                str(model_path),
+            quantization_kwargs = self._quantization_kwargs(torch)
+            # device_map で重みをシャード毎に直接デバイスへ配置する
+            # （CPUに全体を読み込んでから .to() する二重保持を避ける）
+            load_kwargs = dict(
                 torch_dtype=torch_dtype,
                 low_cpu_mem_usage=True,
-                use_safetensors=True
-            ).to(self.torch_device)
+                use_safetensors=True,
+                device_map=self.torch_device,
+            )
+            load_kwargs.update(quantization_kwargs)
+            attn_implementation = self._select_attn_implementation(torch)
+            try:
+                model = VoxtralForConditionalGeneration.from_pretrained(
+                    str(model_path), attn_implementation=attn_implementation, **load_kwargs
+                )
+            except (ImportError, ValueError) as e:
+                if attn_implementation != "flash_attention_2":
+                    raise
+                # flash-attn のビルドとGPU/transformersの組み合わせが合わない場合
+                logger.warning(f"FlashAttention-2 unavailable, falling back to SDPA: {e}")
+                model = VoxtralForConditionalGeneration.from_pretrained(
+                    str(model_path), attn_implementation="sdpa", **load_kwargs
+                )
+            # デコードでインクリメンタルなKVキャッシュを使う
+            model.config.use_cache = True
 
             self.report_progress(85, "Loading processor...")
 
             processor = AutoProcessor.from_pretrained(str(model_path))
 
-            # タプルとしてキャッシュに保存
-            # 環境変数でstrong cacheが有効な場合は強参照でキャッシュ
-            result = (model, processor)
-            use_strong_cache = os.environ.get('LIVECAP_ENGINE_STRONG_CACHE', '').lower() in ('1', 'true', 'yes')
+            # 共有モード: CPUの重みを共有メモリに移し、fork / torch.multiprocessing で
+            # 起動したワーカーがコピーせずに同じ重みを参照できるようにする
+            # （CUDAテンソルは torch.multiprocessing 経由でIPCハンドルとして共有される）
+            shared = _SHARED_MODEL and not quantization_kwargs
+            if shared and self.torch_device == "cpu":
+                model.share_memory()
+                logger.info("Voxtral weights moved to shared memory")
+
+            # モデルとプロセッサを1つのオブジェクトとしてキャッシュに保存
+            # 環境変数でstrong cacheが有効な場合、または共有モードでは強参照でキャッシュ
+            result = _VoxtralBundle(model, processor)
+            use_strong_cache = shared or os.environ.get('LIVECAP_ENGINE_STRONG_CACHE', '').lower() in ('1', 'true', 'yes')
             ModelMemoryCache.set(cache_key, result, strong=use_strong_cache)
             logger.info(f"モデルをキャッシュに保存: {cache_key} (strong={use_strong_cache})")
 
@@ -294,32 +480,124 @@ class VoxtralEngine(BaseEngine):
             logger.error(f"モデルロードエラー: {e}")
             raise
     
+    def _select_dtype(self, torch) -> Any:
+        """推論に使うdtypeを選択
+
+        bf16 対応GPU（Ampere以降）では学習時と同じ bfloat16 を使う。
+        float16 と同じ2バイトで、指数部が float32 と同じためオーバーフローしにくい。
+        """
+        if self.torch_device != "cuda":
+            return torch.float32
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16
+
+    def _select_attn_implementation(self, torch) -> str:
+        """アテンション実装を選択
+
+        Ampere以降のGPUで flash-attn がインストールされていれば FlashAttention-2、
+        それ以外は PyTorch 組み込みの SDPA を使い、スコア行列の実体化を避ける。
+        """
+        if (
+            self.torch_device == "cuda"
+            and torch.cuda.get_device_capability()[0] >= 8
+            and importlib.util.find_spec("flash_attn") is not None
+        ):
+            return "flash_attention_2"
+        return "sdpa"
+
+    def _quantization_kwargs(self, torch) -> Dict[str, Any]:
+        """from_pretrained に渡す量子化設定を作成（量子化なしの場合は空）"""
+        if not self.quantization:
+            return {}
+
+        if self.quantization == "fp8":
+            # FP8 weight-only（Ada / Hopper 世代向け）
+            from transformers import TorchAoConfig
+
+            config = TorchAoConfig("float8_weight_only")
+        else:
+            from transformers import BitsAndBytesConfig
+
+            if self.quantization == "int8":
+                config = BitsAndBytesConfig(load_in_8bit=True, llm_int8_threshold=6.0)
+            else:
+                config = BitsAndBytesConfig(
+                    load_in_4bit=True,
+                    bnb_4bit_quant_type="nf4",
+                    bnb_4bit_compute_dtype=self._select_dtype(torch),
+                )
+
+        logger.info(f"Loading Voxtral with {self.quantization} weight quantization")
+        return {"quantization_config": config, "device_map": "auto"}
+
     def _configure_model(self) -> None:
         """
         Step 5: モデルの設定（90-100%）
         """
         self.report_progress(92, "Setting model to evaluation mode...")
 
-        # self.modelは_load_model_from_pathでタプルとして設定されている
+        # self.modelは_load_model_from_pathで_VoxtralBundleとして設定されている
         if self.model is None:
             raise RuntimeError("Model not loaded")
 
-        # モデルとプロセッサを分離（タプルの場合）
-        if isinstance(self.model, tuple):
-            self.model, self.processor = self.model
-        else:
-            # 互換性のため単一モデルの場合も処理
-            # processorは別途ロードが必要
-            from transformers import AutoProcessor
-            self.processor = AutoProcessor.from_pretrained(self.model_name)
+        # モデルとプロセッサを分離
+        # バンドルはエンジンが保持している間だけ弱参照キャッシュから取得できる
+        self._bundle = self.model
+        self.model = self._bundle.model
+        self.processor = self._bundle.processor
 
         # 評価モードに設定
         self.model.eval()
 
+        # 生成設定を構築しておき、文字起こし毎に作り直さない
+        self._gen_kwargs = self._build_generation_kwargs()
+
+        # 音声特徴量をモデルの重みと同じdtypeで渡す（CPUはfloat32のまま）
+        self._input_dtype = getattr(self.model, "dtype", None) if self.torch_device == "cuda" else None
+
+        if self.torch_device == "cuda" and self._copy_stream is None:
+            import torch
+
+            self._copy_stream = torch.cuda.Stream()
+
+        if self.torch_compile and self.torch_device == "cuda" and not self.quantization:
+            self.report_progress(95, "Compiling Voxtral decoder...")
+            self._compile_model()
+
         self._initialized = True
         self.report_progress(100, "Voxtral model configuration complete")
         logger.info("モデルの設定が完了しました。")
     
+    def _compile_model(self) -> None:
+        """forward を torch.compile し、ダミー推論でコンパイルを済ませる
+
+        generate() は Python の制御フローを含むため、コンパイル対象は forward のみ。
+        静的KVキャッシュにしてデコードステップをCUDA Graphで捕捉できるようにする。
+        """
+        import torch
+
+        # キャッシュ共有されたモデルを二重にコンパイルしない
+        if self.model not in VoxtralEngine._compiled_models:
+            try:
+                self.model.forward = torch.compile(self.model.forward, mode="reduce-overhead", fullgraph=False)
+                self.model.generation_config.cache_implementation = "static"
+                VoxtralEngine._compiled_models.add(self.model)
+            except Exception as e:
+                logger.warning(f"torch.compile failed, using eager mode: {e}")
+                return
+
+        # 初回の文字起こしではなくロード時にコンパイルを発生させる
+        try:
+            inputs = self._to_device(self._build_inputs(
+                np.zeros(self._required_sr, dtype=np.float32),
+                self._required_sr,
+            ))
+            with torch.inference_mode():
+                self.model.generate(**inputs, max_new_tokens=4)
+        except Exception as e:
+            logger.debug(f"Voxtral compile warmup failed: {e}")
+
     # ===============================
     # 既存のインターフェース実装
     # ===============================
@@ -356,82 +634,23 @@ class VoxtralEngine(BaseEngine):
         if not self._initialized or self.model is None:
             raise RuntimeError("Engine not initialized. Call load_model() first.")
             
-        # モデルが要求するサンプリングレートに変換
-        required_sr = self.get_required_sample_rate()
-        if sample_rate != required_sr:
-            import librosa
-            audio_data = librosa.resample(
-                audio_data, 
-                orig_sr=sample_rate, 
-                target_sr=required_sr
-            )
-            
-        # float32に変換し、正規化
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-            
-        # 音声データの正規化（-1.0 から 1.0の範囲）
-        if np.abs(audio_data).max() > 1.0:
-            audio_data = audio_data / np.abs(audio_data).max()
-            
-        # デバッグ: 音声データの情報
-        logger.debug(f"Audio data shape: {audio_data.shape}")
-        logger.debug(f"Audio duration: {len(audio_data) / self.get_required_sample_rate():.2f} seconds")
-        logger.debug(f"Audio max amplitude: {np.abs(audio_data).max():.4f}")
-        
-        # 音声が短すぎる場合の処理
-        min_duration = 0.1  # 最小0.1秒
-        min_samples = int(min_duration * self.get_required_sample_rate())
-        if len(audio_data) < min_samples:
-            logger.warning(f"Audio too short: {len(audio_data)} samples < {min_samples} samples")
-            return "", 1.0
-            
-        try:
-            import torch
-            
-            # Unicode対策: models/tempディレクトリを使用
-            temp_path = get_temp_dir() / f"voxtral_temp_{os.getpid()}.wav"
+        required_sr = self._required_sr
+
+        # スクラッチバッファはプロセッサが特徴量を計算し終えるまで使用中
+        with self._scratch_lock:
+            audio_data = self._prepare_audio(audio_data, sample_rate)
+            if audio_data is None:
+                return "", 1.0
+
             try:
-                sf.write(str(temp_path), audio_data, sample_rate)
+                # 音声はメモリ上のまま渡す（非対応のバージョンのみWAVファイル経由）
+                inputs = self._to_device(self._build_inputs(audio_data, required_sr))
+            except Exception as e:
+                logger.error(f"Error during transcription: {e}")
+                raise
 
-                # apply_transcription_request を使用
-                inputs = self.processor.apply_transcription_request(
-                    language=self.language,
-                    audio=str(temp_path),
-                    model_id=self.model_name
-                ).to(self.torch_device)
-
-                # 生成設定（転写用の設定）
-                generation_config = {
-                    "max_new_tokens": self.max_new_tokens,
-                }
-
-                # temperatureとdo_sampleは転写時には使用しない（do_sample=Falseの場合、temperatureは無視される）
-                if self.do_sample:
-                    generation_config["do_sample"] = True
-                    generation_config["temperature"] = self.temperature
-                
-                # 自動言語検出を有効にして転写
-                with torch.no_grad():
-                    predicted_ids = self.model.generate(
-                        **inputs,
-                        **generation_config
-                    )
-                
-                # デコード - 入力部分を除外して出力のみをデコード
-                transcription = self.processor.batch_decode(
-                    predicted_ids[:, inputs.input_ids.shape[1]:], 
-                    skip_special_tokens=True,
-                    clean_up_tokenization_spaces=True
-                )[0]
-                
-            finally:
-                # 一時ファイルを削除
-                if temp_path.exists():
-                    temp_path.unlink()
-            
-            # 文字列のクリーンアップ
-            transcription = transcription.strip()
+        try:
+            transcription = self._generate_texts(inputs)[0]
 
             logger.debug(f"Voxtral transcription: '{transcription}'")
                     
@@ -447,7 +666,325 @@ class VoxtralEngine(BaseEngine):
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
             raise
-            
+
+    def transcribe_batch(
+        self, audio_chunks: List[np.ndarray], sample_rate: int
+    ) -> List[Tuple[str, float]]:
+        """
+        複数の音声チャンクを1回のgenerate呼び出しでまとめて文字起こしする
+
+        Args:
+            audio_chunks: 音声データ（numpy配列）のリスト
+            sample_rate: サンプリングレート（全チャンク共通）
+
+        Returns:
+            チャンク毎の(transcription_text, confidence_score)のリスト
+        """
+        if not self._initialized or self.model is None:
+            raise RuntimeError("Engine not initialized. Call load_model() first.")
+
+        required_sr = self._required_sr
+        results: List[Tuple[str, float]] = [("", 1.0)] * len(audio_chunks)
+
+        # 短すぎるチャンクは空文字のまま、残りを1バッチにまとめる
+        indices = []
+        prepared = []
+        with self._scratch_lock:
+            for i, audio_data in enumerate(audio_chunks):
+                samples = self._prepare_audio(audio_data, sample_rate)
+                if samples is None:
+                    continue
+                # スクラッチバッファは次のチャンクで上書きされるため退避する
+                if np.shares_memory(samples, self._scratch):
+                    samples = samples.copy()
+                indices.append(i)
+                prepared.append(samples)
+
+        if not prepared:
+            return results
+
+        inputs = None
+        if len(prepared) > 1 and VoxtralEngine._supports_array_input is not False:
+            try:
+                inputs = self.processor.apply_transcription_request(
+                    language=self.language,
+                    audio=prepared,
+                    model_id=self.model_name,
+                    sampling_rate=required_sr,
+                    format=_ARRAY_AUDIO_FORMAT,
+                )
+            except (TypeError, ValueError, AttributeError) as e:
+                logger.debug(f"Batched processor input not supported, transcribing one by one: {e}")
+
+        if inputs is None:
+            # ndarrayのバッチ入力に非対応の場合はチャンク毎に処理
+            for i, samples in zip(indices, prepared):
+                results[i] = self._transcribe_single_chunk(samples, required_sr)
+            return results
+
+        try:
+            texts = self._generate_texts(self._to_device(inputs))
+            for i, text in zip(indices, texts):
+                results[i] = (text, 1.0)
+            return results
+
+        except Exception as e:
+            logger.error(f"Error during transcription: {e}")
+            raise
+
+    def transcribe_stream(self, audio_data: np.ndarray, sample_rate: int) -> Iterator[str]:
+        """
+        音声データを文字起こしし、生成されたテキストを逐次返す
+
+        generate() の完了を待たずに、デコードできた部分から順に返すため、
+        字幕の途中経過を表示できる。
+
+        Args:
+            audio_data: 音声データ（numpy配列）
+            sample_rate: サンプリングレート
+
+        Yields:
+            新たに確定したテキスト片
+        """
+        if not self._initialized or self.model is None:
+            raise RuntimeError("Engine not initialized. Call load_model() first.")
+
+        from transformers import TextIteratorStreamer
+
+        required_sr = self._required_sr
+        with self._scratch_lock:
+            prepared = self._prepare_audio(audio_data, sample_rate)
+            if prepared is None:
+                return
+            inputs = self._to_device(self._build_inputs(prepared, required_sr))
+
+        streamer = TextIteratorStreamer(
+            self.processor.tokenizer, skip_prompt=True, skip_special_tokens=True
+        )
+        errors: List[BaseException] = []
+        worker = threading.Thread(
+            target=self._generate_into_streamer,
+            args=(inputs, streamer, errors),
+            name="VoxtralStream",
+            daemon=True,
+        )
+        worker.start()
+        try:
+            for text in streamer:
+                if text:
+                    yield text
+        finally:
+            worker.join()
+
+        if errors:
+            logger.error(f"Error during transcription: {errors[0]}")
+            raise errors[0]
+
+    def _generate_into_streamer(self, inputs: Any, streamer: Any, errors: List[BaseException]) -> None:
+        """ワーカースレッドで generate を実行し、トークンを streamer に流す"""
+        import torch
+
+        try:
+            # inference_mode はスレッドローカルなため、このスレッド内で有効にする
+            with torch.inference_mode():
+                self.model.generate(**inputs, **self._generation_kwargs(), streamer=streamer)
+        except BaseException as e:
+            errors.append(e)
+            # 読み出し側が終了待ちで止まらないよう終端を送る
+            streamer.end()
+
+    def _generation_kwargs(self) -> Dict[str, Any]:
+        """generate に渡す生成設定（モデル設定時に1回だけ構築）"""
+        if self._gen_kwargs is None:
+            self._gen_kwargs = self._build_generation_kwargs()
+        return self._gen_kwargs
+
+    def _build_generation_kwargs(self) -> Dict[str, Any]:
+        """生成設定を構築"""
+        # 生成設定（転写用の設定）
+        generation_config = {
+            "max_new_tokens": self.max_new_tokens,
+        }
+
+        # temperatureとdo_sampleは転写時には使用しない（do_sample=Falseの場合、temperatureは無視される）
+        if self.do_sample:
+            generation_config["do_sample"] = True
+            generation_config["temperature"] = self.temperature
+
+        if self.repetition_stop_tokens:
+            generation_config["stopping_criteria"] = [
+                _RepetitionStoppingCriteria(self.repetition_stop_tokens)
+            ]
+
+        # pad_token_id 未指定だと generate が呼び出し毎に eos_token_id で補完して警告を出す
+        tokenizer = getattr(self.processor, "tokenizer", None)
+        pad_token_id = getattr(tokenizer, "pad_token_id", None)
+        if pad_token_id is not None:
+            generation_config["pad_token_id"] = pad_token_id
+
+        return generation_config
+
+    def _generate_texts(self, inputs: Any) -> List[str]:
+        """転送済みの入力から生成し、バッチの各行の文字起こしを返す"""
+        import torch
+
+        # 自動言語検出を有効にして転写
+        # 出力はデコードするだけなので、no_grad より軽い inference_mode を使う
+        # （バージョンカウンタ等の autograd 管理もデコードステップ毎に省く）
+        with torch.inference_mode():
+            predicted_ids = self.model.generate(
+                **inputs,
+                **self._generation_kwargs()
+            )
+
+        # デコード - 入力部分（パディング込みで全行同じ長さ）を除外して出力のみをデコード
+        # clean_up_tokenization_spaces はトークン毎に複数の正規表現置換を行うため使わず、
+        # 句読点前の空白除去だけを事前コンパイル済みの正規表現で1回行う
+        transcriptions = self.processor.batch_decode(
+            predicted_ids[:, inputs.input_ids.shape[1]:],
+            skip_special_tokens=True,
+            clean_up_tokenization_spaces=False
+        )
+
+        # 文字列のクリーンアップ
+        return [_PUNCT_SPACE_RE.sub(r"\1", text).strip() for text in transcriptions]
+
+    def _prepare_audio(self, audio_data: np.ndarray, sample_rate: int) -> Optional[np.ndarray]:
+        """
+        音声をプロセッサ入力用に変換する（リサンプル・float32化・正規化）
+
+        変換が必要な場合はスクラッチバッファに書き出すため、_scratch_lock を
+        保持したまま呼び出し、戻り値の使用が終わるまで保持し続けること。
+
+        Returns:
+            変換後の音声。短すぎる場合はNone
+        """
+        # モデルが要求するサンプリングレートに変換
+        required_sr = self._required_sr
+        owned = False
+        # ライブキャプチャでは入力が既に16kHzのことが多く、その場合は何もしない
+        if sample_rate != required_sr:
+            audio_data = self._resample(audio_data, sample_rate)
+            # リサンプル結果は新しい配列のため、その場で書き換えてよい
+            owned = True
+
+        # float32に変換（既に連続したfloat32ならコピーしない）
+        if audio_data.dtype != np.float32 or not audio_data.flags.c_contiguous:
+            samples = self._scratch_view(audio_data.shape)
+            np.copyto(samples, audio_data, casting='unsafe')
+            owned = True
+        else:
+            samples = audio_data
+
+        # 音声データの正規化（-1.0 から 1.0の範囲、ピーク値は1回だけ計算して再利用）
+        peak = float(np.abs(samples).max()) if samples.size else 0.0
+        if peak > 1.0:
+            if not owned:
+                # 呼び出し元のバッファは書き換えない
+                out = self._scratch_view(samples.shape)
+                np.multiply(samples, 1.0 / peak, out=out)
+                samples = out
+            else:
+                np.multiply(samples, 1.0 / peak, out=samples)
+            peak = 1.0
+
+        # デバッグ: 音声データの情報
+        logger.debug(f"Audio data shape: {samples.shape}")
+        logger.debug(f"Audio duration: {len(samples) / required_sr:.2f} seconds")
+        logger.debug(f"Audio max amplitude: {peak:.4f}")
+
+        # 音声が短すぎる場合の処理
+        min_duration = 0.1  # 最小0.1秒
+        min_samples = int(min_duration * required_sr)
+        if len(samples) < min_samples:
+            logger.warning(f"Audio too short: {len(samples)} samples < {min_samples} samples")
+            return None
+
+        return samples
+
+    def _resample(self, audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+        """モデルが要求するサンプリングレートに変換（CPU上のポリフェーズフィルタ）
+
+        結果はCPU側の前処理（processor）で使うため、GPUを経由すると
+        H2D/D2H転送と同期が増えるだけなので常にCPUで変換する。
+        """
+        up, down = _resample_factors(sample_rate, self._required_sr)
+        return resample_poly(audio_data, up, down).astype(np.float32, copy=False)
+
+    def _scratch_view(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """指定形状のfloat32スクラッチ領域を返す（不足時のみ再確保）"""
+        size = int(np.prod(shape))
+        if self._scratch.size < size:
+            self._scratch = np.empty(size, dtype=np.float32)
+        return self._scratch[:size].reshape(shape)
+
+    def _to_device(self, inputs: Any) -> Any:
+        """プロセッサの出力を推論デバイスへ転送（浮動小数点の特徴量はモデルのdtypeに変換）
+
+        CUDA ではページロックしたテンソルを専用ストリームで非同期に転送し、
+        既定ストリーム側のカーネル投入と重ねる。
+        """
+        to_kwargs = {"dtype": self._input_dtype} if self._input_dtype is not None else {}
+        if self._copy_stream is None:
+            return inputs.to(self.torch_device, **to_kwargs)
+
+        import torch
+
+        for key, value in list(inputs.items()):
+            if isinstance(value, torch.Tensor) and not value.is_cuda:
+                inputs[key] = value.pin_memory()
+
+        with torch.cuda.stream(self._copy_stream):
+            inputs = inputs.to(self.torch_device, non_blocking=True, **to_kwargs)
+
+        current = torch.cuda.current_stream()
+        current.wait_stream(self._copy_stream)
+        # 転送先のメモリが既定ストリームでの使用中に再利用されないようにする
+        for value in inputs.values():
+            if isinstance(value, torch.Tensor):
+                value.record_stream(current)
+        return inputs
+
+    def _build_inputs(self, audio_data: np.ndarray, sample_rate: int) -> Any:
+        """apply_transcription_requestで生成用の入力を作成する"""
+        if VoxtralEngine._supports_array_input is not False:
+            try:
+                inputs = self.processor.apply_transcription_request(
+                    language=self.language,
+                    audio=audio_data,
+                    model_id=self.model_name,
+                    sampling_rate=sample_rate,
+                    format=_ARRAY_AUDIO_FORMAT,
+                )
+                VoxtralEngine._supports_array_input = True
+                return inputs
+            except (TypeError, ValueError, AttributeError) as e:
+                if VoxtralEngine._supports_array_input:
+                    # ndarray入力が動作済みなら、ここでの失敗は入力自体の問題
+                    raise
+                # 旧バージョンのプロセッサはファイルパスのみ対応
+                logger.debug(f"ndarray input not supported, falling back to WAV file: {e}")
+                VoxtralEngine._supports_array_input = False
+
+        return self._build_inputs_via_wav_file(audio_data, sample_rate)
+
+    def _build_inputs_via_wav_file(self, audio_data: np.ndarray, sample_rate: int) -> Any:
+        """一時WAVファイル経由で入力を作成する（ndarray非対応のプロセッサ用）"""
+        # Unicode対策: models/tempディレクトリを使用
+        temp_path = get_temp_dir() / f"voxtral_temp_{os.getpid()}.wav"
+        try:
+            sf.write(str(temp_path), audio_data, sample_rate)
+
+            return self.processor.apply_transcription_request(
+                language=self.language,
+                audio=str(temp_path),
+                model_id=self.model_name
+            )
+        finally:
+            # 一時ファイルを削除
+            if temp_path.exists():
+                temp_path.unlink()
+
     def get_engine_name(self) -> str:
         """エンジン名を取得"""
         return "MistralAI Voxtral Mini 3B"
@@ -462,8 +999,13 @@ class VoxtralEngine(BaseEngine):
         # Voxtralは16kHzを使用
         return 16000
         
-    def cleanup(self) -> None:
-        """リソースのクリーンアップ"""
+    def cleanup(self, aggressive: bool = False) -> None:
+        """リソースのクリーンアップ
+
+        Args:
+            aggressive: True の場合、未使用の予約済みGPUメモリ量に関わらず
+                torch.cuda.empty_cache() でドライバに返却する（終了時向け）
+        """
         if self.model is not None:
             # GPUメモリを解放
             del self.model
@@ -472,12 +1014,23 @@ class VoxtralEngine(BaseEngine):
         if self.processor is not None:
             del self.processor
             self.processor = None
-            
+
+        # 他のエンジンが参照していなければキャッシュからも解放される
+        self._bundle = None
+        self._copy_stream = None
+
+        self._scratch = np.empty(0, dtype=np.float32)
+
         if self.torch_device == "cuda":
             # 遅延インポート: 必要な時のみtorchをインポート
             try:
                 import torch
-                torch.cuda.empty_cache()
+
+                # empty_cache() はデバイス同期を伴い、キャッシングアロケータの再利用も妨げるため、
+                # モデル解放で空いた予約領域が閾値を超える時だけ呼び出す
+                unused = torch.cuda.memory_reserved() - torch.cuda.memory_allocated()
+                if aggressive or unused > _get_empty_cache_threshold():
+                    torch.cuda.empty_cache()
             except ImportError:
                 # torchがインポートできない場合は何もしない
                 pass
@@ -25,3 +25,7 @@ WHISPER_LANGUAGES = (
 
 # Frozen set for O(1) lookup during language validation
 WHISPER_LANGUAGES_SET = frozenset(WHISPER_LANGUAGES)
+
+# Language code -> position in WHISPER_LANGUAGES (Whisper's language token order)
+# Lets callers validate and index per-language tables with a single dict lookup
+WHISPER_LANGUAGE_INDEX = {code: i for i, code in enumerate(WHISPER_LANGUAGES)}
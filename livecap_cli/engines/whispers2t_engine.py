@@ -1,16 +1,24 @@
 """WhisperS2Tエンジンの実装 (Template Method版)"""
+import asyncio
+import atexit
+import functools
 import os
 import logging
+import shutil
+import sys
 import tempfile
+import threading
 import time
+from contextlib import ExitStack
+from math import gcd
 import soundfile as sf
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Callable, Dict, Any, List, Tuple
 import numpy as np
 
 from .base_engine import BaseEngine
 from .model_memory_cache import ModelMemoryCache
-from .library_preloader import LibraryPreloader
+from .library_preloader import LibraryPreloader, import_eagerly
 from .whisper_languages import WHISPER_LANGUAGES, WHISPER_LANGUAGES_SET
 from .metadata import EngineMetadata
 
@@ -38,6 +46,13 @@ VALID_COMPUTE_TYPES = frozenset({"auto", "int8", "int8_float16", "float16", "flo
 # 128メルバンクが必要なモデル（v3ベース）
 MODELS_REQUIRING_128_MELS = frozenset({"large-v3", "large-v3-turbo", "distil-large-v3"})
 
+# GPUで compute_type=auto の場合に int8_float16 を使うモデル
+# （重みの帯域が支配的な大型モデルで、INT8 Tensor Core により WER をほぼ変えずに高速化）
+MODELS_PREFERRING_INT8_FLOAT16 = frozenset({"large-v3", "large-v3-turbo", "distil-large-v3"})
+
+# 単一チャンク用作業バッファのサンプル数（16kHzで30秒。これを超える音声は都度確保する）
+AUDIO_ARENA_SAMPLES = 30 * 16000
+
 # CPU速度推定値
 CPU_SPEED_ESTIMATES = {
     'base': '3-5x real-time',
@@ -45,10 +60,123 @@ CPU_SPEED_ESTIMATES = {
     'large-v3-turbo': '~0.5x real-time',
 }
 
+# whisper_s2t モジュール（None=未インポート、_import_whisper_s2t で1回だけ解決）
+whisper_s2t = None
+
+# WAVファイル経由の場合に一時ファイルを置く tmpfs（Linuxのみ）
+_SHM_DIR = Path("/dev/shm")
+
+
+def _import_whisper_s2t():
+    """whisper_s2t をインポートしてモジュールグローバルに保持する"""
+    global whisper_s2t
+    if whisper_s2t is None:
+        # 事前ロードで LazyLoader 登録のみされている場合も、ここで本体の実行を完了させる
+        whisper_s2t = import_eagerly('whisper_s2t')
+    return whisper_s2t
+
+
+@functools.lru_cache(maxsize=None)
+def _select_tmp_dir() -> Path:
+    """一時WAVファイル用のディレクトリを選択（書き込み可能なら tmpfs を優先）
+
+    tmpfs 上には他のユーザーと共有されない、プロセス専用のディレクトリ（mode 0o700）を
+    1回だけ作成し、プロセス終了時に削除する。
+    """
+    if sys.platform.startswith("linux") and os.access(_SHM_DIR, os.W_OK):
+        try:
+            tmp_dir = Path(tempfile.mkdtemp(prefix=f"livecap_whispers2t_{os.getpid()}_", dir=_SHM_DIR))
+        except OSError as e:
+            logger.debug(f"tmpfs temp directory unavailable: {e}")
+        else:
+            atexit.register(shutil.rmtree, tmp_dir, ignore_errors=True)
+            return tmp_dir
+    return get_temp_dir("whispers2t")
+
+
+@functools.lru_cache(maxsize=8)
+def _resample_factors(src_sr: int, dst_sr: int) -> Tuple[int, int]:
+    """resample_poly に渡す (up, down) をサンプリングレートの組み合わせ毎に1回だけ計算"""
+    g = gcd(src_sr, dst_sr)
+    return dst_sr // g, src_sr // g
+
+
+@functools.lru_cache(maxsize=None)
+def _load_resampler() -> Tuple[Optional[Callable], Optional[Callable]]:
+    """(soxr.resample, None) または (None, scipy の resample_poly) を1回だけインポートして返す"""
+    try:
+        from soxr import resample
+        return resample, None
+    except ImportError:
+        from scipy.signal import resample_poly
+        return None, resample_poly
+
+
+@functools.lru_cache(maxsize=8)
+def _lowpass_filter(up: int, down: int) -> np.ndarray:
+    """resample_poly の既定と同じ低域通過FIRフィルタを (up, down) 毎に1回だけ設計"""
+    from scipy.signal import firwin
+
+    max_rate = max(up, down)
+    h = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+    h.setflags(write=False)
+    return h
+
+
+def _arena_view(arena: Optional[np.ndarray], audio: np.ndarray) -> Optional[np.ndarray]:
+    """作業バッファに収まる1次元音声なら、その長さのビューを返す"""
+    if arena is None or audio.ndim != 1 or audio.size > arena.size:
+        return None
+    return arena[:audio.size]
+
+
+def _resample(audio_data: np.ndarray, src_sr: int, dst_sr: int) -> Tuple[np.ndarray, bool]:
+    """音声をリサンプルしてfloat32で返す
+
+    soxr（librosa の依存として導入済み）が使えれば SIMD 実装の polyphase フィルタを使い、
+    呼び出し毎のフィルタ設計を省く。無ければ scipy の resample_poly にフォールバックし、
+    入力のピークから求めた正規化ゲインをフィルタ係数に織り込んで、
+    リサンプルと正規化を1回の畳み込みで行う。
+
+    Returns:
+        (リサンプル後の音声, 正規化済みか)
+    """
+    soxr_resample, resample_poly = _load_resampler()
+    if soxr_resample is not None:
+        # soxr は float32/float64/int16/int32 のみ受け付け、整数入力は整数で返す（再量子化される）ため、
+        # それ以外の dtype と整数は float32 にしてから渡す
+        if audio_data.dtype not in (np.float32, np.float64):
+            audio_data = audio_data.astype(np.float32)
+        return soxr_resample(audio_data, src_sr, dst_sr, quality='HQ').astype(np.float32, copy=False), False
+
+    up, down = _resample_factors(src_sr, dst_sr)
+    h = _lowpass_filter(up, down)
+    if audio_data.size:
+        hi = float(audio_data.max())
+        lo = float(audio_data.min())
+        peak = hi if hi > -lo else -lo
+        if peak > 1.0:
+            h = h / peak
+    return resample_poly(audio_data, up, down, window=h).astype(np.float32), True
+
 
 class WhisperS2TEngine(BaseEngine):
     """WhisperS2T音声認識エンジン (Template Method版)"""
 
+    # transcribe / transcribe_with_vad がndarray入力に対応しているか（None=未確認）
+    _supports_array_input: Optional[bool] = None
+
+    # GPUがINT8 Tensor Core（Turing以降, compute capability 7.5+）を持つか（None=未確認）
+    _has_int8_tensor_cores: Optional[bool] = None
+
+    # CPUフォールバックモデルのロードを直列化（事前ロードと実際のフォールバックの二重ロード防止）
+    _cpu_fallback_lock = threading.Lock()
+
+    # プロセス全体の cuDNN 設定を適用済みか（環境変数 / torch.backends）
+    # エンジン生成毎に書き換えると、他のエンジンが使用中の cuDNN ハンドルに影響するため1回だけ行う
+    _cudnn_env_configured = False
+    _torch_cudnn_configured = False
+
     def __init__(
         self,
         device: Optional[str] = None,
@@ -102,8 +230,10 @@ class WhisperS2TEngine(BaseEngine):
         self.use_vad = use_vad
 
         # cuDNN設定（GPU使用時の安定性向上）
-        os.environ['CUDNN_DETERMINISTIC'] = '1'
-        os.environ['CUDNN_BENCHMARK'] = '0'
+        if not WhisperS2TEngine._cudnn_env_configured:
+            os.environ['CUDNN_DETERMINISTIC'] = '1'
+            os.environ['CUDNN_BENCHMARK'] = '0'
+            WhisperS2TEngine._cudnn_env_configured = True
 
         # デバイスの自動検出と設定（共通関数を使用）
         self.device = detect_device(device, "WhisperS2T")
@@ -123,12 +253,47 @@ class WhisperS2TEngine(BaseEngine):
         # 事前ロード開始
         LibraryPreloader.start_preloading('whispers2t')
 
-        # 固定の一時ディレクトリを設定
-        self._tmp_dir = get_temp_dir("whispers2t")
+        # 単一チャンク用の transcribe 引数（呼び出し毎にリストを作り直さない）
+        self._single_transcribe_kwargs = self._build_transcribe_kwargs(1)
+
+        # 固定の一時ディレクトリを設定（ブロックデバイスを経由しない tmpfs を優先）
+        self._tmp_dir = _select_tmp_dir()
+
+        # 単一チャンク用の float32 作業バッファ（スレッド毎に初回使用時に確保）
+        self._audio_arena = threading.local()
+
+        # 一時ディレクトリで O_TMPFILE が使えるか（None=未確認）
+        self._supports_tmpfile: Optional[bool] = None
+
+        # このエンジンが参照カウントを保持している ModelMemoryCache のキー
+        self._cache_keys: List[str] = []
+        # _cache_keys / _cpu_fallback_model の更新と cleanup の取り出しを直列化
+        # （事前ロードスレッドと競合するため。登録処理の入れ子で再取得するので RLock）
+        self._cache_keys_lock = threading.RLock()
+
+        # 取得済みのCPUフォールバックモデル（取得毎に参照カウントを増やさない）
+        self._cpu_fallback_model: Optional[Any] = None
 
         # プロファイリング設定（kwargs から取得、デフォルト False）
         self._enable_profiling = kwargs.get('profile', False)
 
+        # 単一チャンクの文字起こし処理を選択（無効時は計測の分岐を一切通らない）
+        self._transcribe_single_chunk = (
+            self._transcribe_single_chunk_profiled
+            if self._enable_profiling
+            else self._transcribe_single_chunk_plain
+        )
+
+        # GPU使用時にcuDNNエラー用のCPUモデルをバックグラウンドで事前ロードする
+        # （kwargs から取得、デフォルト False: CPUモデル分のメモリを常に消費するため）
+        self._preload_cpu_fallback = kwargs.get('preload_cpu_fallback', False)
+        # 実行中の事前ロードスレッドと、cleanup からの中止通知
+        self._preload_thread: Optional[threading.Thread] = None
+        self._preload_cancelled = threading.Event()
+
+        # GPU使用時にロード完了前にダミー推論を1回行う（kwargs から取得、デフォルト True）
+        self._warmup = kwargs.get('warmup', True)
+
         # 初期化完了メッセージ
         if self.device == 'cuda':
             logger.info(f"✅ WhisperS2T {model_size} engine initialized (GPU mode: {self.compute_type})")
@@ -139,8 +304,25 @@ class WhisperS2TEngine(BaseEngine):
         """compute_typeを解決（autoの場合はデバイスに応じて最適化）"""
         if compute_type != "auto":
             return compute_type  # ユーザー指定を尊重
-        # auto: CPU→int8（1.5倍高速）、GPU→float16
-        return "int8" if self.device == "cpu" else "float16"
+        # auto: CPU→int8（1.5倍高速）
+        if self.device == "cpu":
+            return "int8"
+        # GPU: 大型モデルはINT8 Tensor Core があれば int8_float16、それ以外は float16
+        if self.model_size in MODELS_PREFERRING_INT8_FLOAT16 and self._detect_int8_tensor_cores():
+            return "int8_float16"
+        return "float16"
+
+    @classmethod
+    def _detect_int8_tensor_cores(cls) -> bool:
+        """GPUがINT8 Tensor Coreを持つかを判定（結果はクラスで共有）"""
+        if cls._has_int8_tensor_cores is None:
+            try:
+                import torch
+                cls._has_int8_tensor_cores = torch.cuda.get_device_capability() >= (7, 5)
+            except Exception as e:
+                logger.debug(f"Could not query CUDA compute capability: {e}")
+                cls._has_int8_tensor_cores = False
+        return cls._has_int8_tensor_cores
 
     def _get_n_mels(self) -> int:
         """モデルサイズに応じた n_mels 値を取得"""
@@ -190,16 +372,17 @@ class WhisperS2TEngine(BaseEngine):
         LibraryPreloader.wait_for_preload(timeout=2.0)
 
         try:
-            import whisper_s2t
+            _import_whisper_s2t()
         except ImportError:
             raise ImportError("WhisperS2T is not installed. Please run: pip install whisper-s2t")
 
-        if self.device == 'cuda':
+        if self.device == 'cuda' and not WhisperS2TEngine._torch_cudnn_configured:
             try:
                 import torch
                 torch.backends.cudnn.enabled = True
                 torch.backends.cudnn.benchmark = False
                 torch.backends.cudnn.deterministic = True
+                WhisperS2TEngine._torch_cudnn_configured = True
             except ImportError:
                 pass
 
@@ -225,7 +408,7 @@ class WhisperS2TEngine(BaseEngine):
     
     def _load_model_from_path(self, model_path: Path) -> Any:
         """モデルをファイルからロード (Step 4: 70-90%)"""
-        import whisper_s2t
+        whisper_s2t = _import_whisper_s2t()
 
         # キャッシュキーを生成
         cache_key = f"whispers2t_{self.model_size}_{self.device}_{self.compute_type}"
@@ -233,6 +416,7 @@ class WhisperS2TEngine(BaseEngine):
 
         if cached_model is not None:
             logger.info(f"メモリキャッシュからモデルを取得: {cache_key}")
+            self._acquire_cached_model(cache_key)
             self.report_progress(90, "Loading from memory cache")
             return cached_model
 
@@ -260,6 +444,7 @@ class WhisperS2TEngine(BaseEngine):
 
             # キャッシュに保存
             ModelMemoryCache.set(cache_key, model, strong=True)
+            self._acquire_cached_model(cache_key)
 
             if self.device == 'cuda':
                 logger.info(f"✅ WhisperS2T {self.model_size} loaded on GPU (n_mels={n_mels})")
@@ -277,15 +462,7 @@ class WhisperS2TEngine(BaseEngine):
                 self.device = 'cpu'
                 self.compute_type = 'int8'  # CPU fallback でも int8 を使用
 
-                model = whisper_s2t.load_model(
-                    model_identifier=model_identifier,
-                    backend='CTranslate2',
-                    device='cpu',
-                    compute_type='int8',
-                    n_mels=n_mels,
-                )
-
-                ModelMemoryCache.set(f"whispers2t_{self.model_size}_cpu_int8", model, strong=True)
+                model = self._get_cpu_fallback_model()
                 self.report_progress(90, "WhisperS2T: Ready (CPU mode)")
                 return model
             else:
@@ -299,32 +476,129 @@ class WhisperS2TEngine(BaseEngine):
 
         self.report_progress(95, "WhisperS2T: Applying final settings...")
 
+        if self._preload_cpu_fallback and self.device == 'cuda':
+            self._preload_cancelled = threading.Event()
+            self._preload_thread = threading.Thread(
+                target=self._preload_cpu_fallback_model,
+                args=(self._preload_cancelled,),
+                name="whispers2t-cpu-fallback",
+                daemon=True,
+            )
+            self._preload_thread.start()
+
+        if self._warmup and self.device == 'cuda':
+            self.report_progress(97, "WhisperS2T: Warming up GPU kernels...")
+            self._run_warmup()
+
         logger.info(f"WhisperS2T {self.model_size} initialized")
 
         self.report_progress(100, "WhisperS2T: Initialization complete")
     
-    def transcribe(self, audio_data: np.ndarray, sample_rate: int) -> Tuple[str, float]:
+    def _run_warmup(self) -> None:
+        """ダミー音声で1回推論し、cuDNN・CTranslate2 の初回準備をロード時に済ませる"""
+        dummy = np.zeros(16000, dtype=np.float32)
+        try:
+            # VADは無音区間を除外して推論自体を省くため、VADなしの transcribe で実行する
+            self.model.transcribe([dummy], **self._single_transcribe_kwargs)
+        except Exception as e:
+            logger.debug(f"WhisperS2T warmup skipped: {e}")
+
+    def transcribe(
+        self, audio_data: np.ndarray, sample_rate: int, *, trusted: bool = False
+    ) -> Tuple[str, float]:
         """
         音声データを文字起こしする
 
         Args:
             audio_data: 音声データ（numpy配列）
             sample_rate: サンプリングレート
+            trusted: 音声が既に -1.0〜1.0 の範囲に収まっていることを呼び出し側が保証する場合
+                True（ピーク値の走査と正規化を省略する）
 
         Returns:
             (transcription_text, confidence_score)のタプル
         """
         # WhisperS2Tは長時間音声も処理可能
         # 環境変数切替は不要（固定ディレクトリを使用）
-        return self._transcribe_single_chunk(audio_data, sample_rate)
-    
-    def _transcribe_single_chunk(self, audio_data: np.ndarray, sample_rate: int) -> Tuple[str, float]:
+        return self._transcribe_single_chunk(audio_data, sample_rate, trusted=trusted)
+
+    async def transcribe_async(
+        self, audio_data: np.ndarray, sample_rate: int, *, trusted: bool = False
+    ) -> Tuple[str, float]:
+        """
+        非同期文字起こし
+
+        同期メソッドを asyncio.to_thread でラップ。CTranslate2 は推論中に GIL を
+        解放するため、イベントループを塞がずに複数の呼び出しを並行させられる。
+
+        Args:
+            audio_data: 音声データ（numpy配列）
+            sample_rate: サンプリングレート
+            trusted: transcribe と同じ
+
+        Returns:
+            (transcription_text, confidence_score)のタプル
+        """
+        return await asyncio.to_thread(
+            self._transcribe_single_chunk, audio_data, sample_rate, trusted=trusted
+        )
+
+    def transcribe_batch(
+        self, audio_chunks: List[np.ndarray], sample_rate: int, *, trusted: bool = False
+    ) -> List[Tuple[str, float]]:
+        """
+        複数の音声チャンクを1回のWhisperS2T呼び出しでまとめて文字起こしする
+
+        CTranslate2 のエンコーダ・デコーダは batch_size 件までまとめて推論するため、
+        チャンク毎に呼び出すよりGPUの利用効率が高い。
+
+        Args:
+            audio_chunks: 音声データ（numpy配列）のリスト
+            sample_rate: サンプリングレート（全チャンク共通）
+            trusted: 全チャンクが -1.0〜1.0 の範囲に収まっていることを保証する場合True
+
+        Returns:
+            チャンク毎の(transcription_text, confidence_score)のリスト
+        """
+        if not self._initialized or self.model is None:
+            raise RuntimeError("Engine not initialized. Call load_model() first.")
+
+        results: List[Tuple[str, float]] = [("", 1.0)] * len(audio_chunks)
+
+        # 短すぎるチャンクは空文字のまま、残りを1バッチにまとめる
+        indices = []
+        prepared = []
+        for i, audio_data in enumerate(audio_chunks):
+            samples = self._prepare_audio(audio_data, sample_rate, trusted=trusted)
+            if samples is not None:
+                indices.append(i)
+                prepared.append(samples)
+
+        if not prepared:
+            return results
+
+        try:
+            outputs = self._transcribe_with_fallback(prepared)
+            for i, output in zip(indices, outputs):
+                results[i] = self._extract_result(output)
+            return results
+
+        except Exception as e:
+            logger.error(f"Error during transcription: {e}")
+            raise
+
+    def _transcribe_single_chunk_plain(
+        self, audio_data: np.ndarray, sample_rate: int, trusted: bool = False
+    ) -> Tuple[str, float]:
         """
         単一の音声チャンクを文字起こしする（内部使用）
 
+        __init__ でプロファイリング無効時の _transcribe_single_chunk として選択される。
+
         Args:
             audio_data: 音声データ（numpy配列）
             sample_rate: サンプリングレート
+            trusted: 正規化済みであることが保証されているか
 
         Returns:
             (transcription_text, confidence_score)のタプル
@@ -332,158 +606,337 @@ class WhisperS2TEngine(BaseEngine):
         if not self._initialized or self.model is None:
             raise RuntimeError("Engine not initialized. Call load_model() first.")
 
+        audio_data = self._prepare_audio(
+            audio_data, sample_rate, trusted=trusted, arena=self._get_audio_arena()
+        )
+        if audio_data is None:
+            return "", 1.0
+
+        try:
+            # WhisperS2Tで文字起こし
+            outputs = self._transcribe_with_fallback([audio_data])
+
+            # 結果を取得
+            if not outputs:
+                return "", 1.0
+
+            return self._extract_result(outputs[0])
+
+        except Exception as e:
+            logger.error(f"Error during transcription: {e}")
+            raise
+
+    def _transcribe_single_chunk_profiled(
+        self, audio_data: np.ndarray, sample_rate: int, trusted: bool = False
+    ) -> Tuple[str, float]:
+        """_transcribe_single_chunk_plain に処理時間の計測を加えたもの（profile=True 時に選択）"""
+        if not self._initialized or self.model is None:
+            raise RuntimeError("Engine not initialized. Call load_model() first.")
+
         # プロファイリング開始
-        if self._enable_profiling:
-            profile_times = {}
-            total_start = time.perf_counter()
-            
+        profile_times: Dict[str, float] = {}
+        total_start = time.perf_counter()
+
+        audio_data = self._prepare_audio(
+            audio_data, sample_rate, profile_times, trusted=trusted, arena=self._get_audio_arena()
+        )
+        if audio_data is None:
+            return "", 1.0
+
+        try:
+            inference_start = time.perf_counter()
+
+            # WhisperS2Tで文字起こし
+            outputs = self._transcribe_with_fallback([audio_data])
+
+            profile_times['inference'] = (time.perf_counter() - inference_start) * 1000
+
+            # 結果を取得
+            if not outputs:
+                return "", 1.0
+
+            result = self._extract_result(outputs[0])
+
+            # プロファイリング結果を出力
+            self._log_profiling_results(profile_times, total_start, audio_data)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error during transcription: {e}")
+            raise
+
+    def _prepare_audio(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        profile_times: Optional[Dict[str, float]] = None,
+        trusted: bool = False,
+        arena: Optional[np.ndarray] = None,
+    ) -> Optional[np.ndarray]:
+        """16kHzへの変換と正規化を行う
+
+        trusted=True かつ 16kHz の入力では、ピーク値の走査と正規化を省略する
+        （リサンプル結果は振幅が変わり得るため、リサンプルした場合は通常どおり正規化する）。
+        arena を渡した場合、float32 への変換や正規化でのコピーはその先頭に書き込み、
+        返り値はそのビューになる（次の呼び出しで上書きされる）。
+
+        Returns:
+            変換後の音声。短すぎる場合はNone
+        """
         # 16kHzに変換
         required_sr = 16000
+        # 呼び出し元の配列ではなく、ここで作った配列か（その場で書き換えてよいか）
+        owned = False
+        # リサンプル時に正規化も済ませたか
+        normalized = False
         if sample_rate != required_sr:
-            if self._enable_profiling:
+            if profile_times is not None:
                 resample_start = time.perf_counter()
 
-            from scipy.signal import resample_poly
-            from math import gcd
+            audio_data, normalized = _resample(audio_data, sample_rate, required_sr)
+            owned = True
 
-            g = gcd(sample_rate, required_sr)
-            audio_data = resample_poly(audio_data, required_sr // g, sample_rate // g).astype(np.float32)
-
-            if self._enable_profiling:
+            if profile_times is not None:
                 profile_times['resample'] = (time.perf_counter() - resample_start) * 1000
-            
-        # 正規化
+
+        # 正規化（ピーク値は1回だけ計算し、変換済みの配列はその場でスケーリング）
         if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-        if np.abs(audio_data).max() > 1.0:
-            audio_data = audio_data / np.abs(audio_data).max()
-            
-        
+            buf = None if owned else _arena_view(arena, audio_data)
+            if buf is not None:
+                np.copyto(buf, audio_data, casting='unsafe')
+                audio_data = buf
+            else:
+                audio_data = audio_data.astype(np.float32)
+            owned = True
+        peak = 0.0
+        if audio_data.size and not normalized and not (trusted and sample_rate == required_sr):
+            # np.abs の一時配列を作らず、最大値と最小値の縮約だけでピークを求める
+            hi = float(audio_data.max())
+            lo = float(audio_data.min())
+            peak = hi if hi > -lo else -lo
+        if peak > 1.0:
+            if owned:
+                np.multiply(audio_data, 1.0 / peak, out=audio_data)
+            else:
+                # 呼び出し元のバッファは書き換えない
+                buf = _arena_view(arena, audio_data)
+                if buf is not None:
+                    audio_data = np.multiply(audio_data, np.float32(1.0 / peak), out=buf)
+                else:
+                    audio_data = audio_data * np.float32(1.0 / peak)
+
         # 音声が短すぎる場合の処理
         min_samples = int(0.1 * 16000)  # 最小0.1秒
         if len(audio_data) < min_samples:
-            return "", 1.0
-            
+            return None
+
+        return audio_data
+
+    def _get_audio_arena(self) -> np.ndarray:
+        """呼び出しスレッド用の作業バッファを返す（transcribe_async の並行呼び出しで共有しない）"""
+        arena = getattr(self._audio_arena, 'buffer', None)
+        if arena is None:
+            arena = np.empty(AUDIO_ARENA_SAMPLES, dtype=np.float32)
+            self._audio_arena.buffer = arena
+        return arena
+
+    @staticmethod
+    def _extract_result(output: Any) -> Tuple[str, float]:
+        """1ファイル分のWhisperS2Tの出力からテキストと信頼度を取り出す"""
+        if isinstance(output, list):
+            if not output:
+                return "", 1.0
+            result = output[0]
+        else:
+            result = output
+
+        if isinstance(result, dict):
+            text = result.get('text', '').strip()
+
+            # 信頼度スコアの計算
+            confidence = 1.0
+            segments = result.get('segments')
+            if isinstance(segments, list) and segments:
+                # セグメント毎の avg_logprob を1回の走査で配列化して平均する
+                logprobs = np.fromiter(
+                    (
+                        segment['avg_logprob'] for segment in segments
+                        if isinstance(segment, dict) and 'avg_logprob' in segment
+                    ),
+                    dtype=np.float64,
+                )
+                if logprobs.size:
+                    confidence = float(np.exp(logprobs.mean()))
+            return text, confidence
+
+        if isinstance(result, str):
+            return result.strip(), 1.0
+
+        return (str(result) if result else ""), 1.0
+
+    def _transcribe_with_fallback(self, audio_chunks: List[np.ndarray]) -> Any:
+        """変換済みの音声を文字起こしする（cuDNNエラー時はCPUモデルで再試行）"""
         try:
-            # 言語コードは __init__ で変換済み（_asr_language を使用）
-            whisper_language = self._asr_language
+            return self._transcribe_prepared(audio_chunks)
+        except RuntimeError as e:
+            if "cuDNN" not in str(e) or self.device != 'cuda':
+                raise
 
-            # 一時ファイルを作成
-            if self._enable_profiling:
-                io_start = time.perf_counter()
+            logger.warning(f"cuDNN error, retrying with CPU: {e}")
 
-            with tempfile.NamedTemporaryFile(dir=self._tmp_dir, suffix='.wav', delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-                sf.write(tmp_path, audio_data, 16000)
+            cpu_model = self._get_cpu_fallback_model()
 
-            if self._enable_profiling:
-                profile_times['wav_write'] = (time.perf_counter() - io_start) * 1000
+            # 変換済みの音声をそのまま再利用する（再度のリサンプルは不要）
+            # self.model は差し替えず引数で渡す（transcribe_async の並行呼び出しに影響させない）
+            return self._transcribe_prepared(audio_chunks, cpu_model)
 
-            try:
-                if self._enable_profiling:
-                    inference_start = time.perf_counter()
-
-                # WhisperS2Tで文字起こし
-                if self.use_vad:
-                    outputs = self.model.transcribe_with_vad(
-                        [tmp_path],
-                        lang_codes=[whisper_language],
-                        tasks=["transcribe"],
-                        initial_prompts=[None],
-                        batch_size=self.batch_size
-                    )
-                else:
-                    outputs = self.model.transcribe(
-                        [tmp_path],
-                        lang_codes=[whisper_language],
-                        tasks=["transcribe"],
-                        initial_prompts=[None],
-                        batch_size=self.batch_size
-                    )
-
-                if self._enable_profiling:
-                    profile_times['inference'] = (time.perf_counter() - inference_start) * 1000
-            finally:
-                # 一時ファイルを削除
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-            
-            # 結果を取得
-            if outputs and len(outputs) > 0:
-                if isinstance(outputs[0], list) and len(outputs[0]) > 0:
-                    result = outputs[0][0]
-                else:
-                    result = outputs[0]
-                
-                if isinstance(result, dict):
-                    text = result.get('text', '').strip()
-                    
-                    # 信頼度スコアの計算
-                    confidence = 1.0
-                    if 'segments' in result and isinstance(result['segments'], list) and len(result['segments']) > 0:
-                        total_logprob = 0
-                        segment_count = 0
-                        for segment in result['segments']:
-                            if isinstance(segment, dict) and 'avg_logprob' in segment:
-                                total_logprob += segment['avg_logprob']
-                                segment_count += 1
-                        
-                        if segment_count > 0:
-                            avg_logprob = total_logprob / segment_count
-                            confidence = np.exp(avg_logprob)
-                elif isinstance(result, str):
-                    text = result.strip()
-                    confidence = 1.0
-                else:
-                    text = str(result) if result else ""
-                    confidence = 1.0
-                
-                # プロファイリング結果を出力
-                if self._enable_profiling:
-                    self._log_profiling_results(profile_times, total_start, audio_data)
-
-                return text, confidence
-            else:
-                return "", 1.0
-                
-        except RuntimeError as e:
-            if "cuDNN" in str(e) and self.device == 'cuda':
-                logger.warning(f"cuDNN error, retrying with CPU: {e}")
-
-                cpu_cache_key = f"whispers2t_{self.model_size}_cpu_float32"
-                cpu_model = ModelMemoryCache.get(cpu_cache_key)
-
-                if cpu_model is None:
-                    import whisper_s2t
-                    # モデル識別子を取得（HuggingFaceパスへの変換）
-                    model_identifier = self._get_model_identifier()
-                    n_mels = self._get_n_mels()
-                    cpu_model = whisper_s2t.load_model(
-                        model_identifier=model_identifier,
-                        backend='CTranslate2',
-                        device='cpu',
-                        compute_type='float32',
-                        n_mels=n_mels,
-                    )
-                    ModelMemoryCache.set(cpu_cache_key, cpu_model, strong=True)
-
-                original_model, original_device = self.model, self.device
-                self.model, self.device = cpu_model, 'cpu'
+    def _get_cpu_fallback_model(self, cancelled: Optional[threading.Event] = None) -> Any:
+        """cuDNNエラー時に使うCPUモデルを取得（未ロードならロードしてキャッシュ）
 
-                try:
-                    result = self.transcribe(audio_data, sample_rate)
-                finally:
-                    self.model, self.device = original_model, original_device
+        Args:
+            cancelled: 設定済みならロード後に使用を登録しない（cleanup 済みの事前ロード用）
+        """
+        cpu_cache_key = f"whispers2t_{self.model_size}_cpu_int8"
+        with WhisperS2TEngine._cpu_fallback_lock:
+            if self._cpu_fallback_model is not None:
+                return self._cpu_fallback_model
+            cpu_model = ModelMemoryCache.get(cpu_cache_key)
+            if cpu_model is None:
+                whisper_s2t = _import_whisper_s2t()
+                # モデル識別子を取得（HuggingFaceパスへの変換）
+                cpu_model = whisper_s2t.load_model(
+                    model_identifier=self._get_model_identifier(),
+                    backend='CTranslate2',
+                    device='cpu',
+                    compute_type='int8',
+                    n_mels=self._get_n_mels(),
+                )
+                ModelMemoryCache.set(cpu_cache_key, cpu_model, strong=True)
+            with self._cache_keys_lock:
+                if self._acquire_cached_model(cpu_cache_key, cancelled):
+                    self._cpu_fallback_model = cpu_model
+        return cpu_model
 
-                return result
-            else:
-                logger.error(f"Error during transcription: {e}")
-                raise
-                
+    def _acquire_cached_model(self, cache_key: str, cancelled: Optional[threading.Event] = None) -> bool:
+        """キャッシュ上のモデルの使用を登録する（cleanup で release する）
+
+        Returns:
+            登録した場合True（cancelled が設定済みの場合は登録せずFalse）
+        """
+        with self._cache_keys_lock:
+            if cancelled is not None and cancelled.is_set():
+                return False
+            ModelMemoryCache.acquire(cache_key)
+            self._cache_keys.append(cache_key)
+        return True
+
+    def _preload_cpu_fallback_model(self, cancelled: threading.Event) -> None:
+        """CPUフォールバックモデルを事前ロードする（バックグラウンドスレッド用）"""
+        try:
+            self._get_cpu_fallback_model(cancelled)
+            if cancelled.is_set():
+                logger.debug("WhisperS2T CPU fallback preload finished after cleanup, discarded")
+                return
+            logger.info(f"WhisperS2T {self.model_size} CPU fallback model preloaded")
         except Exception as e:
-            logger.error(f"Error during transcription: {e}")
-            raise
-            
+            logger.warning(f"Failed to preload WhisperS2T CPU fallback model: {e}")
+
+    def _transcribe_prepared(self, audio_chunks: List[np.ndarray], model: Optional[Any] = None) -> Any:
+        """変換済み（16kHz float32）の音声をWhisperS2Tで文字起こしする
+
+        Args:
+            audio_chunks: 変換済みの音声のリスト
+            model: 使用するモデル（None=self.model。cuDNNエラー時のCPUモデル用）
+        """
+        # WhisperS2T は ndarray を直接受け付けるため、WAVファイルの往復を省略する
+        if WhisperS2TEngine._supports_array_input is not False:
+            try:
+                outputs = self._run_model(audio_chunks, model)
+                WhisperS2TEngine._supports_array_input = True
+                return outputs
+            except (TypeError, AttributeError) as e:
+                # ファイルパス前提のローダー（wave.open / ffmpeg の引数）が ndarray を受け取った場合の例外のみ捕捉する
+                # （OOM 等のそれ以外の例外はフラグを変えずにそのまま送出する）
+                if WhisperS2TEngine._supports_array_input:
+                    raise
+                logger.info(f"ndarray input not supported, falling back to WAV file: {e}")
+                WhisperS2TEngine._supports_array_input = False
+
+        return self._transcribe_via_wav_file(audio_chunks, model)
+
+    def _transcribe_via_wav_file(self, audio_chunks: List[np.ndarray], model: Optional[Any] = None) -> Any:
+        """一時WAVファイル経由で文字起こしする（ndarray非対応のWhisperS2T用）"""
+        with ExitStack() as stack:
+            tmp_paths = [self._write_temp_wav(stack, audio_data) for audio_data in audio_chunks]
+            return self._run_model(tmp_paths, model)
+
+    def _write_temp_wav(self, stack: ExitStack, audio_data: np.ndarray) -> str:
+        """音声を一時WAVファイルに書き出し、stack の終了時に削除されるパスを返す"""
+        fd = self._open_anonymous_file()
+        if fd is not None:
+            # 名前のないファイルは /proc 経由で参照し、close 時に自動で削除される
+            # （子プロセスの ffmpeg からも開けるよう self ではなく PID で指定）
+            stack.callback(os.close, fd)
+            tmp_path = f"/proc/{os.getpid()}/fd/{fd}"
+            sf.write(tmp_path, audio_data, 16000, format='WAV')
+            return tmp_path
+
+        with tempfile.NamedTemporaryFile(dir=self._tmp_dir, suffix='.wav', delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+        stack.callback(self._remove_temp_file, tmp_path)
+        sf.write(tmp_path, audio_data, 16000)
+        return tmp_path
+
+    @staticmethod
+    def _remove_temp_file(tmp_path: str) -> None:
+        """一時ファイルを削除（存在確認の stat を省き unlink 1回で済ませる）"""
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+
+    def _open_anonymous_file(self) -> Optional[int]:
+        """O_TMPFILE で名前のない一時ファイルを開く（非対応の環境ではNone）
+
+        ディレクトリエントリの作成・削除を伴わないため、呼び出し毎のメタデータ更新を省ける。
+        """
+        o_tmpfile = getattr(os, "O_TMPFILE", None)
+        if o_tmpfile is None or self._supports_tmpfile is False:
+            return None
+
+        try:
+            fd = os.open(self._tmp_dir, o_tmpfile | os.O_RDWR, 0o600)
+        except OSError as e:
+            logger.debug(f"O_TMPFILE not supported in {self._tmp_dir}: {e}")
+            self._supports_tmpfile = False
+            return None
+
+        self._supports_tmpfile = True
+        return fd
+
+    def _run_model(self, audio_inputs: List[Any], model: Optional[Any] = None) -> Any:
+        """音声（ndarrayまたはファイルパス）のリストでWhisperS2Tを呼び出す（model=None は self.model）"""
+        count = len(audio_inputs)
+        if count == 1:
+            kwargs = self._single_transcribe_kwargs
+        else:
+            kwargs = self._build_transcribe_kwargs(count)
+        if model is None:
+            model = self.model
+        transcribe = model.transcribe_with_vad if self.use_vad else model.transcribe
+        return transcribe(audio_inputs, **kwargs)
+
+    def _build_transcribe_kwargs(self, count: int) -> Dict[str, Any]:
+        """count 件分の transcribe 引数を作成"""
+        # 言語コードは __init__ で変換済み（_asr_language を使用）
+        return dict(
+            lang_codes=[self._asr_language] * count,
+            tasks=["transcribe"] * count,
+            initial_prompts=[None] * count,
+            batch_size=self.batch_size,
+        )
+
     def _log_profiling_results(self, profile_times: Dict, start_time: float, audio_data: np.ndarray) -> None:
         """プロファイリング結果をログ出力"""
         total_time = (time.perf_counter() - start_time) * 1000
@@ -526,11 +979,22 @@ class WhisperS2TEngine(BaseEngine):
         
     def cleanup(self) -> None:
         """リソースのクリーンアップ"""
+        # 事前ロードが後から完了しても、このエンジンでモデルの使用を登録させない
+        self._preload_cancelled.set()
+        self._preload_thread = None
+
         if self.model is not None:
             del self.model
             self.model = None
 
-            if self.device == "cuda":
+            with self._cache_keys_lock:
+                self._cpu_fallback_model = None
+                cache_keys, self._cache_keys = self._cache_keys, []
+
+            # 同じモデルを共有する他のエンジンが残っている間はCUDAキャッシュを解放しない
+            last_release = all([ModelMemoryCache.release(key) for key in cache_keys])
+
+            if self.device == "cuda" and last_release:
                 try:
                     import torch
                     torch.cuda.empty_cache()
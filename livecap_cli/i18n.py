@@ -31,6 +31,16 @@ class I18nManager:
         self._translator: Optional[Callable[..., str]] = None
         self._fallbacks: Dict[str, str] = {}
         self._translator_details = TranslatorDetails(registered=False)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """翻訳状態の世代番号（登録内容が変わるたびに増加し、翻訳結果のキャッシュキーに使う）"""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """翻訳結果のキャッシュを無効化（translator 側で言語を切り替えた場合に呼び出す）"""
+        self._generation += 1
 
     @contextmanager
     def preserve_state(self):
@@ -44,6 +54,7 @@ class I18nManager:
             self._translator = translator
             self._fallbacks = fallbacks
             self._translator_details = details
+            self._generation += 1
 
     def register_translator(
         self,
@@ -73,11 +84,13 @@ class I18nManager:
             extras=extras_tuple,
             metadata=metadata_dict,
         )
+        self._generation += 1
 
     def clear_translator(self) -> None:
         """登録済み翻訳関数を解除"""
         self._translator = None
         self._translator_details = TranslatorDetails(registered=False)
+        self._generation += 1
 
     def register_fallbacks(self, mapping: Mapping[str, str], *, namespace: str | None = None) -> None:
         """フォールバック用メッセージを登録"""
@@ -87,9 +100,11 @@ class I18nManager:
                 self._fallbacks[qualified] = value
         else:
             self._fallbacks.update(mapping)
+        self._generation += 1
 
     def clear_fallbacks(self, *, prefix: str | None = None) -> None:
         """登録済みフォールバックを削除"""
+        self._generation += 1
         if prefix is None:
             self._fallbacks.clear()
             return
@@ -5,6 +5,9 @@ BCP-47 言語コードの正規化と各翻訳エンジン向けの変換を提
 Issue #168 で実装された EngineMetadata.to_iso639_1() と同じ langcodes ライブラリを使用。
 """
 
+import functools
+from typing import Dict, Tuple
+
 import langcodes
 
 # Riva-4B プロンプト用の言語名マッピング
@@ -23,11 +26,13 @@ LANGUAGE_NAMES = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def to_iso639_1(code: str) -> str:
     """
     BCP-47 言語コードを ISO 639-1 に変換
 
-    langcodes ライブラリを使用（EngineMetadata.to_iso639_1 と同じ実装）
+    langcodes ライブラリを使用（EngineMetadata.to_iso639_1 と同じ実装）。
+    翻訳毎に呼ばれるが入力の種類は少ないため、結果をキャッシュする。
 
     Args:
         code: 言語コード（"ja", "zh-CN", "ZH-TW" など）
@@ -67,6 +72,14 @@ def normalize_for_google(lang: str) -> str:
         >>> normalize_for_google("zh-TW")
         'zh-TW'
     """
+    entry = _NORMALIZE_TABLE.get(lang.lower())
+    if entry is not None:
+        return entry[0]
+    return _google_code(lang)
+
+
+def _google_code(lang: str) -> str:
+    """normalize_for_google の本体（_NORMALIZE_TABLE にないコード用）"""
     # 元の入力を保持（zh-TW の場合）
     if lang.lower() in ("zh-tw", "zh-hant"):
         return "zh-TW"
@@ -100,6 +113,14 @@ def get_language_name(lang: str) -> str:
     Returns:
         英語での言語名（例: "Japanese", "English"）
     """
+    entry = _NORMALIZE_TABLE.get(lang.lower())
+    if entry is not None:
+        return entry[1]
+    return _language_name(lang)
+
+
+def _language_name(lang: str) -> str:
+    """get_language_name の本体（_NORMALIZE_TABLE にないコード用）"""
     iso = to_iso639_1(lang)
     # zh-TW は特別扱い
     if lang.lower() in ("zh-tw", "zh-hant"):
@@ -111,6 +132,21 @@ def get_language_name(lang: str) -> str:
     return langcodes.Language.get(lang).display_name()
 
 
+def _build_normalize_table() -> Dict[str, Tuple[str, str]]:
+    """
+    既知の言語コード（小文字）→ (Google Translate 用コード, 言語名) の表を構築
+
+    normalize_for_google と get_language_name が毎回行う小文字化・zh-TW 判定・
+    ISO 639-1 変換を、よく使われるコードについてはモジュール読み込み時に1回で済ませる。
+    値は各関数の本体で計算するため、表の有無で結果は変わらない。
+    """
+    codes = (*LANGUAGE_NAMES, "zh-CN", "zh-Hant")
+    return {code.lower(): (_google_code(code), _language_name(code)) for code in codes}
+
+
+_NORMALIZE_TABLE = _build_normalize_table()
+
+
 def get_opus_mt_model_name(source: str, target: str) -> str:
     """
     OPUS-MT モデル名を生成
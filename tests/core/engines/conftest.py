@@ -0,0 +1,113 @@
+"""エンジンテスト共通のフィクスチャ
+
+ndarray 入力と WAV ファイル経由のフォールバックを持つエンジン（Canary / Parakeet /
+WhisperS2T）について、モデルをモックしたインスタンスを作成する。
+"""
+import importlib
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@dataclass(frozen=True)
+class MockedEngineSpec:
+    """モデルをモックしたエンジンの作成方法と、モデル呼び出しの読み取り方"""
+
+    module: str
+    class_name: str
+    # 推論に使うモデルのメソッド名
+    model_method: str
+    # テキスト1件分のモデル出力を作る
+    result_item: Callable[[str], Any]
+    # 音声を audio= キーワードで渡すか（False なら第1位置引数）
+    audio_as_kwarg: bool = True
+    init_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def engine_class(self) -> type:
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+    def model_call(self, engine: Any) -> Any:
+        """直近のモデル呼び出しを返す"""
+        return getattr(engine.model, self.model_method)
+
+    def passed_audio(self, engine: Any) -> List[Any]:
+        """直近のモデル呼び出しに渡された音声のリストを返す"""
+        call = self.model_call(engine).call_args
+        return call.kwargs["audio"] if self.audio_as_kwarg else call.args[0]
+
+
+ENGINE_SPECS = {
+    "canary": MockedEngineSpec(
+        module="livecap_cli.engines.canary_engine",
+        class_name="CanaryEngine",
+        model_method="transcribe",
+        result_item=lambda text: SimpleNamespace(text=text),
+    ),
+    "parakeet": MockedEngineSpec(
+        module="livecap_cli.engines.parakeet_engine",
+        class_name="ParakeetEngine",
+        model_method="transcribe",
+        result_item=lambda text: SimpleNamespace(text=f" {text} "),
+    ),
+    "whispers2t": MockedEngineSpec(
+        module="livecap_cli.engines.whispers2t_engine",
+        class_name="WhisperS2TEngine",
+        model_method="transcribe_with_vad",
+        result_item=lambda text: [{"text": f" {text} "}],
+        audio_as_kwarg=False,
+        init_kwargs={"model_size": "base"},
+    ),
+}
+
+
+def _mocked_engine(spec: MockedEngineSpec):
+    """NeMo / WhisperS2T なしで推論経路を検証できるよう、モデルをモックしたエンジンを作成
+
+    ndarray 対応の判定結果（クラス変数）はテスト毎に未確認へ戻し、終了後に復元する。
+    """
+    engine_class = spec.engine_class
+
+    with patch(f"{spec.module}.LibraryPreloader.start_preloading"):
+        engine = engine_class(device="cpu", **spec.init_kwargs)
+
+    engine.model = MagicMock()
+    spec.model_call(engine).side_effect = lambda audio, **kwargs: [
+        spec.result_item(f"chunk{i}") for i in range(len(audio))
+    ]
+    engine._initialized = True
+
+    original = engine_class._supports_array_input
+    engine_class._supports_array_input = None
+    yield engine
+    engine_class._supports_array_input = original
+    engine.cleanup()
+
+
+@pytest.fixture
+def canary_engine():
+    """モデルをモックした Canary エンジン"""
+    yield from _mocked_engine(ENGINE_SPECS["canary"])
+
+
+@pytest.fixture
+def parakeet_engine():
+    """モデルをモックした Parakeet エンジン"""
+    yield from _mocked_engine(ENGINE_SPECS["parakeet"])
+
+
+@pytest.fixture
+def whispers2t_engine():
+    """モデルをモックした WhisperS2T エンジン"""
+    yield from _mocked_engine(ENGINE_SPECS["whispers2t"])
+
+
+@pytest.fixture(params=list(ENGINE_SPECS))
+def mocked_engine(request):
+    """ENGINE_SPECS の各エンジンについて (エンジン, 仕様) を返す"""
+    spec = ENGINE_SPECS[request.param]
+    for engine in _mocked_engine(spec):
+        yield engine, spec
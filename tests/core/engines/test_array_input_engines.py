@@ -0,0 +1,76 @@
+"""ndarray 入力に対応したエンジン共通の文字起こし経路のテスト（モデルはモック）
+
+対象エンジンと各エンジンのモデル呼び出しの違いは conftest.py の ENGINE_SPECS で定義する。
+エンジン固有の検証は各エンジンのテストファイルに置く。
+"""
+import numpy as np
+import pytest
+
+
+class TestArrayInputTranscribe:
+    """ndarray 入力と WAV ファイル経由のフォールバックのテスト"""
+
+    def test_transcribe_passes_ndarray_directly(self, mocked_engine):
+        """ndarray をそのままモデルに渡すことを確認"""
+        engine, spec = mocked_engine
+        audio = np.zeros(16000, dtype=np.float32)
+
+        assert engine.transcribe(audio, 16000) == ("chunk0", 1.0)
+
+        assert isinstance(spec.passed_audio(engine)[0], np.ndarray)
+
+    def test_transcribe_normalizes_without_mutating_input(self, mocked_engine):
+        """ピークが 1.0 を超える場合に正規化し、入力配列は変更しないことを確認"""
+        engine, spec = mocked_engine
+        audio = np.full(16000, 2.0, dtype=np.float32)
+
+        engine.transcribe(audio, 16000)
+
+        passed = spec.passed_audio(engine)[0]
+        assert np.max(np.abs(passed)) == pytest.approx(1.0)
+        assert passed.dtype == np.float32
+        assert np.all(audio == 2.0)
+
+    @pytest.mark.parametrize("error", [TypeError, AttributeError])
+    def test_transcribe_falls_back_to_wav_file(self, mocked_engine, error):
+        """ndarray 非対応のモデルでは WAV ファイル経由にフォールバックすることを確認"""
+        engine, spec = mocked_engine
+
+        def transcribe(audio, **kwargs):
+            if not isinstance(audio[0], str):
+                raise error("expected file paths")
+            return [spec.result_item("from file")]
+
+        spec.model_call(engine).side_effect = transcribe
+
+        assert engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("from file", 1.0)
+        assert spec.engine_class._supports_array_input is False
+
+
+class TestArrayInputTranscribeBatch:
+    """バッチ文字起こしのテスト"""
+
+    def test_transcribe_batch_single_model_call(self, mocked_engine):
+        """複数チャンクを 1 回のモデル呼び出しで処理することを確認"""
+        engine, spec = mocked_engine
+        chunks = [np.zeros(16000, dtype=np.float32) for _ in range(3)]
+
+        results = engine.transcribe_batch(chunks, 16000)
+
+        assert results == [("chunk0", 1.0), ("chunk1", 1.0), ("chunk2", 1.0)]
+        assert spec.model_call(engine).call_count == 1
+        assert len(spec.passed_audio(engine)) == 3
+
+    def test_transcribe_batch_keeps_order_with_short_chunks(self, mocked_engine):
+        """短すぎるチャンクは空文字となり、他の結果の順序が保たれることを確認"""
+        engine, spec = mocked_engine
+        chunks = [
+            np.zeros(16000, dtype=np.float32),
+            np.zeros(100, dtype=np.float32),
+            np.zeros(16000, dtype=np.float32),
+        ]
+
+        results = engine.transcribe_batch(chunks, 16000)
+
+        assert results == [("chunk0", 1.0), ("", 1.0), ("chunk1", 1.0)]
+        assert len(spec.passed_audio(engine)) == 2
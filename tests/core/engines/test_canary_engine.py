@@ -0,0 +1,47 @@
+"""Canary エンジンのユニットテスト（モデルはモック）"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+
+class TestCanaryTranscribe:
+    """Canary の文字起こし経路のテスト"""
+
+    def test_transcribe_short_audio_skips_model(self, canary_engine):
+        """0.1 秒未満の音声はモデルを呼ばずに空文字を返すことを確認"""
+        audio = np.zeros(4000, dtype=np.float32)  # 48kHz で約 0.08 秒
+
+        assert canary_engine.transcribe(audio, 48000) == ("", 1.0)
+        canary_engine.model.transcribe.assert_not_called()
+
+    def test_transcription_debug_log_is_lazily_formatted(self):
+        """認識結果のデバッグログは DEBUG 無効時に文字列を組み立てないことを確認"""
+        from livecap_cli.engines.canary_engine import CanaryEngine
+
+        class Text:
+            formatted = 0
+
+            def __format__(self, spec):
+                Text.formatted += 1
+                return "text"
+
+            __str__ = __repr__ = lambda self: format(self)
+
+        text = Text()
+        with patch("livecap_cli.engines.canary_engine.logger.isEnabledFor", return_value=False):
+            assert CanaryEngine._extract_text(SimpleNamespace(text=text)) is text
+
+        assert Text.formatted == 0
+
+
+class TestCanaryTranscribeBatch:
+    """Canary のバッチ文字起こしのテスト"""
+
+    def test_transcribe_batch_passes_chunk_count_as_batch_size(self, canary_engine):
+        """batch_size にチャンク数を渡すことを確認"""
+        chunks = [np.zeros(16000, dtype=np.float32) for _ in range(3)]
+
+        canary_engine.transcribe_batch(chunks, 16000)
+
+        assert canary_engine.model.transcribe.call_args.kwargs["batch_size"] == 3
@@ -2,6 +2,7 @@ from typing import Any, Dict, Optional
 
 import pytest
 
+from livecap_cli.engines import engine_factory, metadata
 from livecap_cli.engines.engine_factory import EngineFactory
 from livecap_cli.engines.metadata import EngineInfo, EngineMetadata
 
@@ -31,6 +32,9 @@ def reset_engine_factory_and_metadata(monkeypatch):
     # Restore
     monkeypatch.setattr(EngineFactory, "_ENGINES", None, raising=False)
     EngineMetadata._ENGINES = original_engines
+    engine_factory._baseline_params.cache_clear()
+    engine_factory._cached_engine_info.cache_clear()
+    metadata._engine_ids_by_language.cache_clear()
 
 
 def _add_stub_engine_to_metadata():
@@ -64,6 +68,18 @@ def test_create_engine_uses_defaults(monkeypatch):
     assert engine.model_size == "base"
 
 
+def test_create_engine_adds_engine_name_for_parakeet(monkeypatch):
+    """Test that parakeet variants receive their engine_name parameter."""
+    monkeypatch.setattr(EngineFactory, "_get_engine_class", lambda *_: DummyEngine)
+
+    first = EngineFactory.create_engine(engine_type="parakeet_ja", device="cpu")
+    second = EngineFactory.create_engine(engine_type="parakeet_ja", device="cpu", language="en")
+
+    assert first.extra_kwargs["engine_name"] == "parakeet_ja"
+    assert second.extra_kwargs["engine_name"] == "parakeet_ja"
+    assert second.language == "en"
+
+
 def test_create_engine_allows_overriding_defaults(monkeypatch):
     """Test that engine_options can override default_params."""
     _add_stub_engine_to_metadata()
@@ -95,6 +111,31 @@ def test_create_engine_rejects_unknown_engine():
         EngineFactory.create_engine(engine_type="nonexistent", device="cpu")
 
 
+def test_get_engine_class_is_cached(monkeypatch):
+    """Test that resolved engine classes are cached across lookups."""
+    import importlib
+
+    from livecap_cli.engines import engine_factory
+
+    engine_factory._get_engine_class.cache_clear()
+    calls = []
+    real_import_module = importlib.import_module
+
+    def counting_import_module(name, package=None):
+        calls.append(name)
+        return real_import_module(name, package)
+
+    monkeypatch.setattr(engine_factory.importlib, "import_module", counting_import_module)
+    try:
+        first = EngineFactory._get_engine_class("whispers2t")
+        second = EngineFactory._get_engine_class("whispers2t")
+    finally:
+        engine_factory._get_engine_class.cache_clear()
+
+    assert first is second
+    assert calls == [".whispers2t_engine"]
+
+
 def test_get_engine_info_returns_metadata():
     """Test that get_engine_info returns correct metadata."""
     info = EngineFactory.get_engine_info("whispers2t")
@@ -118,6 +159,75 @@ def test_get_available_engines():
     assert engines["whispers2t"]["description"]
 
 
+def test_get_available_engines_translates_on_access(monkeypatch):
+    """Test that engine names are translated only when a field is read."""
+    from livecap_cli.engines import engine_factory
+
+    keys = []
+    monkeypatch.setattr(
+        engine_factory,
+        "translate",
+        lambda key, default=None: keys.append(key) or default,
+    )
+
+    engines = EngineFactory.get_available_engines()
+    assert keys == []
+
+    assert engines["canary"]["name"] == EngineMetadata.get("canary").display_name
+    assert keys == ["engines.canary.name"]
+    assert dict(engines["canary"]).keys() == {"name", "description"}
+
+
+def test_get_available_engines_returns_shared_readonly_view():
+    """Test that get_available_engines returns the same immutable mapping."""
+    engines = EngineFactory.get_available_engines()
+
+    assert EngineFactory.get_available_engines() is engines
+    with pytest.raises(TypeError):
+        engines["new_engine"] = {}
+
+
+def test_get_engine_info_cache_follows_translator_changes():
+    """Test that cached engine info is rebuilt when the translator changes."""
+    from livecap_cli.i18n import i18n
+
+    with i18n.preserve_state():
+        i18n.clear_translator()
+        default_name = EngineFactory.get_engine_info("whispers2t")["name"]
+
+        i18n.register_translator(lambda key, **kwargs: f"translated:{key}", name="fake")
+        info = EngineFactory.get_engine_info("whispers2t")
+
+        assert info["name"] == "translated:engines.whispers2t.name"
+        assert info["name"] != default_name
+
+        # Mutating the returned dict must not leak into the cache
+        info["name"] = "mutated"
+        assert EngineFactory.get_engine_info("whispers2t")["name"] == "translated:engines.whispers2t.name"
+
+
+def test_get_engines_for_language_matches_metadata():
+    """Test that the reverse index agrees with EngineMetadata for BCP-47 codes."""
+    for code in ("ja", "en", "zh-CN", "pt-BR", "xx"):
+        engines = EngineFactory.get_engines_for_language(code)
+        assert list(engines) == EngineMetadata.get_engines_for_language(code)
+
+    engines = EngineFactory.get_engines_for_language("ja")
+    engines["whispers2t"]["name"] = "mutated"
+    assert EngineFactory.get_engines_for_language("ja")["whispers2t"]["name"] != "mutated"
+
+
+def test_get_engines_for_language_shares_metadata_index():
+    """Test that EngineFactory shares EngineMetadata's reverse index."""
+    _add_stub_engine_to_metadata()
+    metadata._engine_ids_by_language.cache_clear()
+
+    engines = EngineFactory.get_engines_for_language("ja")
+
+    assert list(engines) == EngineMetadata.get_engines_for_language("ja")
+    assert engines["stub"]["name"] == "Stub Engine"
+
+
 def test_get_engines_for_language():
     """Test that get_engines_for_language filters correctly."""
     ja_engines = EngineFactory.get_engines_for_language("ja")
@@ -195,6 +305,36 @@ class TestWhisperS2TValidation:
         assert len(WHISPER_LANGUAGES) == 100
         assert "yue" in WHISPER_LANGUAGES  # Cantonese is the 100th language
 
+    def test_language_index_matches_token_order(self):
+        """Test that WHISPER_LANGUAGE_INDEX maps each code to its tokenizer position."""
+        from livecap_cli.engines.whisper_languages import (
+            WHISPER_LANGUAGE_INDEX,
+            WHISPER_LANGUAGES,
+            WHISPER_LANGUAGES_SET,
+        )
+
+        assert list(WHISPER_LANGUAGE_INDEX) == list(WHISPER_LANGUAGES)
+        assert WHISPER_LANGUAGE_INDEX["en"] == 0
+        assert WHISPER_LANGUAGE_INDEX["yue"] == 99
+        assert set(WHISPER_LANGUAGE_INDEX) == WHISPER_LANGUAGES_SET
+
+
+def test_get_engines_for_language_reflects_metadata_after_cache_clear():
+    """Test that the reverse index keeps definition order and reflects metadata changes after cache_clear()."""
+    ja_engines = EngineMetadata.get_engines_for_language("ja")
+    assert ja_engines == [
+        engine_id for engine_id, info in EngineMetadata._ENGINES.items()
+        if "ja" in info.supported_languages
+    ]
+
+    # Mutating the returned list must not affect the index
+    ja_engines.append("mutated")
+    assert "mutated" not in EngineMetadata.get_engines_for_language("ja")
+
+    _add_stub_engine_to_metadata()
+    metadata._engine_ids_by_language.cache_clear()
+    assert EngineMetadata.get_engines_for_language("ja")[-1] == "stub"
+
 
 class TestEngineMetadataAsrCodeSupport:
     """Test EngineMetadata.get_engines_for_language() with asr_code conversion."""
@@ -0,0 +1,318 @@
+"""LibraryPreloader のユニットテスト"""
+import sys
+import threading
+
+import pytest
+
+from livecap_cli.engines.library_preloader import _STATE, LibraryPreloader
+
+
+@pytest.fixture(autouse=True)
+def reset_preloader():
+    """各テストの前後で事前ロード状態をリセット"""
+    LibraryPreloader.reset()
+    yield
+    LibraryPreloader.wait_for_preload(timeout=5.0)
+    LibraryPreloader.reset()
+
+
+class TestPreloadTasks:
+    """事前ロードタスク構築のテスト"""
+
+    def test_nemo_is_chained_after_matplotlib(self, monkeypatch):
+        """NeMo は matplotlib の後に同じタスク内で実行されることを確認"""
+        order = []
+        monkeypatch.setattr(LibraryPreloader, "_preload_matplotlib", classmethod(lambda cls: order.append("matplotlib")))
+        monkeypatch.setattr(LibraryPreloader, "_preload_nemo", classmethod(lambda cls: order.append("nemo")))
+
+        tasks = LibraryPreloader._build_preload_tasks({"matplotlib", "nemo"})
+        assert list(tasks) == ["nemo"]
+
+        tasks["nemo"]()
+        assert order == ["matplotlib", "nemo"]
+
+    def test_independent_libraries_run_concurrently(self, monkeypatch):
+        """独立したライブラリは並列にロードされることを確認"""
+        barrier = threading.Barrier(2, timeout=5.0)
+
+        def fake_preload(cls):
+            # 2 つのタスクが同時に実行されていなければ BrokenBarrierError になる
+            barrier.wait()
+
+        monkeypatch.setattr(LibraryPreloader, "_preload_transformers", classmethod(fake_preload))
+        monkeypatch.setattr(LibraryPreloader, "_preload_sherpa_onnx", classmethod(fake_preload))
+
+        LibraryPreloader._preload_libraries("test", {"transformers", "sherpa_onnx"})
+
+        assert not barrier.broken
+
+    def test_already_preloaded_libraries_are_skipped(self):
+        """ロード済みのライブラリはタスクに含まれないことを確認"""
+        LibraryPreloader._mark_preloaded("sherpa_onnx")
+
+        assert LibraryPreloader._build_preload_tasks({"sherpa_onnx"}) == {}
+
+
+class TestPreloadClaims:
+    """ロード権（claim）のテスト"""
+
+    def test_second_claimer_waits_for_owner(self):
+        """2 番目のスレッドは担当スレッドの完了まで待機しロードしないことを確認"""
+        owner = LibraryPreloader._claim("sherpa_onnx")
+        assert owner is not None
+
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(LibraryPreloader._claim("sherpa_onnx")))
+        waiter.start()
+        waiter.join(timeout=0.1)
+        assert waiter.is_alive()
+
+        LibraryPreloader._mark_preloaded("sherpa_onnx")
+        LibraryPreloader._release("sherpa_onnx", owner)
+        waiter.join(timeout=5.0)
+
+        assert result == [None]
+
+    def test_failed_load_can_be_retried(self):
+        """ロードに失敗した場合はロード権が解放され再試行できることを確認"""
+        owner = LibraryPreloader._claim("sherpa_onnx")
+        LibraryPreloader._release("sherpa_onnx", owner)
+
+        assert LibraryPreloader._claim("sherpa_onnx") is not None
+
+
+class TestWarmPackageFiles:
+    """パッケージファイル先読みのテスト"""
+
+    def test_missing_package_is_ignored(self):
+        """存在しないパッケージでも例外を送出しないことを確認"""
+        from livecap_cli.engines.library_preloader import _warm_package_files
+
+        _warm_package_files("livecap_nonexistent_package")
+
+    def test_advises_binary_files_only(self, tmp_path, monkeypatch):
+        """拡張モジュール等のバイナリだけを先読み対象とすることを確認"""
+        import livecap_cli.engines.library_preloader as module
+
+        package = tmp_path / "fakepkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "_ext.so").write_bytes(b"\0" * 16)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        advised = []
+        monkeypatch.setattr(module.os, "posix_fadvise", lambda fd, *args: advised.append(fd), raising=False)
+        monkeypatch.setattr(module.os, "POSIX_FADV_WILLNEED", 3, raising=False)
+
+        module._warm_package_files("fakepkg")
+
+        assert len(advised) == 1
+
+
+class TestPreloadedMask:
+    """ロード済みビットマスクのテスト"""
+
+    def test_start_preloading_skips_when_all_loaded(self):
+        """必要なライブラリが全てロード済みならスレッドを起動しないことを確認"""
+        LibraryPreloader._mark_preloaded("sherpa_onnx")
+
+        LibraryPreloader.start_preloading("reazonspeech")
+
+        assert _STATE.thread is None
+
+    def test_is_preloaded_and_stats_reflect_mask(self):
+        """is_preloaded と get_stats がビットマスクを反映することを確認"""
+        LibraryPreloader._mark_preloaded("transformers")
+
+        assert LibraryPreloader.is_preloaded("transformers")
+        assert not LibraryPreloader.is_preloaded("nemo")
+        assert not LibraryPreloader.is_preloaded("unknown")
+        assert LibraryPreloader.get_stats()["preloaded"]["transformers"] is True
+
+
+class TestInstallLazyModule:
+    """LazyLoader によるモジュール登録のテスト"""
+
+    def test_module_body_runs_on_first_attribute_access(self, tmp_path, monkeypatch):
+        """モジュール本体は最初の属性アクセスまで実行されないことを確認"""
+        import sys
+
+        from livecap_cli.engines.library_preloader import _install_lazy_module
+
+        package = tmp_path / "lazypkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "heavy.py").write_text("import builtins\nbuiltins._lazypkg_executed = True\nVALUE = 42\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "lazypkg", raising=False)
+        monkeypatch.delitem(sys.modules, "lazypkg.heavy", raising=False)
+
+        import builtins
+        monkeypatch.setattr(builtins, "_lazypkg_executed", False, raising=False)
+
+        _install_lazy_module("lazypkg.heavy")
+
+        assert "lazypkg.heavy" in sys.modules
+        assert builtins._lazypkg_executed is False
+
+        import lazypkg.heavy
+        assert lazypkg.heavy.VALUE == 42
+        assert builtins._lazypkg_executed is True
+
+        monkeypatch.delitem(sys.modules, "lazypkg.heavy")
+        monkeypatch.delitem(sys.modules, "lazypkg")
+
+    def test_missing_module_raises_import_error(self):
+        """存在しないモジュールでは ImportError を送出することを確認"""
+        from livecap_cli.engines.library_preloader import _install_lazy_module
+
+        with pytest.raises(ImportError):
+            _install_lazy_module("livecap_nonexistent_package")
+
+    def test_import_eagerly_surfaces_original_import_error(self, tmp_path, monkeypatch):
+        """本体の実行に失敗するモジュールは元の ImportError を送出し sys.modules に残らないことを確認"""
+        from livecap_cli.engines.library_preloader import _install_lazy_module, import_eagerly
+
+        package = tmp_path / "brokenpkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("raise ImportError('broken dependency')\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "brokenpkg", raising=False)
+
+        _install_lazy_module("brokenpkg")
+
+        for _ in range(2):
+            with pytest.raises(ImportError, match="broken dependency"):
+                import_eagerly("brokenpkg")
+            assert "brokenpkg" not in sys.modules
+
+
+class TestPreloadImportMode:
+    """事前ロードのインポート方式のテスト"""
+
+    @pytest.fixture(autouse=True)
+    def restore_lazy_flag(self):
+        original = LibraryPreloader._lazy_import
+        yield
+        LibraryPreloader._lazy_import = original
+
+    def _make_package(self, tmp_path, monkeypatch, name):
+        package = tmp_path / name
+        package.mkdir()
+        (package / "__init__.py").write_text("import builtins\nbuiltins._preload_executed = True\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+        import builtins
+        monkeypatch.setattr(builtins, "_preload_executed", False, raising=False)
+        return builtins
+
+    def test_import_is_eager_by_default(self, tmp_path, monkeypatch):
+        """デフォルトでは事前ロードでモジュール本体まで実行することを確認"""
+        builtins = self._make_package(tmp_path, monkeypatch, "eagerpkg")
+
+        LibraryPreloader._import_library("eagerpkg")
+
+        assert builtins._preload_executed is True
+        monkeypatch.delitem(sys.modules, "eagerpkg")
+
+    def test_lazy_import_is_opt_in(self, tmp_path, monkeypatch):
+        """enable_lazy_import() 有効時は登録のみ行い、import_eagerly() で本体を実行することを確認"""
+        from livecap_cli.engines.library_preloader import import_eagerly
+
+        builtins = self._make_package(tmp_path, monkeypatch, "optinpkg")
+        LibraryPreloader.enable_lazy_import()
+
+        LibraryPreloader._import_library("optinpkg")
+        assert builtins._preload_executed is False
+
+        import_eagerly("optinpkg")
+        assert builtins._preload_executed is True
+        monkeypatch.delitem(sys.modules, "optinpkg")
+
+
+class TestStartPreloadingShortCircuit:
+    """スレッド生成を省略する経路のテスト"""
+
+    def test_already_imported_module_is_marked_without_thread(self, monkeypatch):
+        """他所でインポート済みのライブラリはスレッドを起動せずロード済みとすることを確認"""
+        import sys
+        import types
+
+        monkeypatch.setitem(sys.modules, "sherpa_onnx", types.ModuleType("sherpa_onnx"))
+
+        LibraryPreloader.start_preloading("reazonspeech")
+
+        assert _STATE.thread is None
+        assert LibraryPreloader.is_preloaded("sherpa_onnx")
+
+    def test_matplotlib_only_runs_inline(self, monkeypatch):
+        """残りが matplotlib だけの場合は同期実行しスレッドを起動しないことを確認"""
+        calls = []
+        monkeypatch.setattr(LibraryPreloader, "_preload_matplotlib", classmethod(lambda cls: calls.append("matplotlib")))
+        LibraryPreloader._mark_preloaded("nemo")
+
+        LibraryPreloader.start_preloading("canary")
+
+        assert calls == ["matplotlib"]
+        assert _STATE.thread is None
+
+
+class TestStartPreloadingConcurrency:
+    """start_preloading の同時呼び出しのテスト"""
+
+    def test_concurrent_calls_spawn_single_thread(self, monkeypatch):
+        """同時に呼び出されても事前ロードスレッドは 1 つだけ起動することを確認"""
+        release = threading.Event()
+        runs = []
+
+        def fake_preload_libraries(cls, engine_type, required_libs):
+            runs.append(engine_type)
+            release.wait(timeout=5.0)
+
+        monkeypatch.setattr(LibraryPreloader, "_preload_libraries", classmethod(fake_preload_libraries))
+        monkeypatch.delitem(sys.modules, "sherpa_onnx", raising=False)
+
+        start = threading.Barrier(4, timeout=5.0)
+
+        def call():
+            start.wait()
+            LibraryPreloader.start_preloading("reazonspeech")
+
+        callers = [threading.Thread(target=call) for _ in range(4)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join(timeout=5.0)
+        release.set()
+
+        assert len(runs) == 1
+
+
+class TestWarmModelFiles:
+    """モデルファイル先読みのテスト"""
+
+    def test_warms_onnx_files_in_background(self, tmp_path, monkeypatch):
+        """ONNX ファイルだけをバックグラウンドで先読みすることを確認"""
+        import livecap_cli.engines.library_preloader as module
+
+        (tmp_path / "encoder.onnx").write_bytes(b"\0" * 16)
+        (tmp_path / "tokens.txt").write_text("a")
+
+        advised = []
+        monkeypatch.setattr(module.os, "posix_fadvise", lambda fd, *args: advised.append(fd), raising=False)
+        monkeypatch.setattr(module.os, "POSIX_FADV_WILLNEED", 3, raising=False)
+
+        thread = LibraryPreloader.warm_model_files(tmp_path)
+        assert thread is not None
+        thread.join(timeout=5.0)
+
+        assert len(advised) == 1
+
+    def test_missing_directory_is_ignored(self, tmp_path, monkeypatch):
+        """存在しないディレクトリではスレッドを起動しないことを確認"""
+        import livecap_cli.engines.library_preloader as module
+
+        monkeypatch.setattr(module.os, "posix_fadvise", lambda fd, *args: None, raising=False)
+
+        assert LibraryPreloader.warm_model_files(tmp_path / "missing") is None
@@ -0,0 +1,343 @@
+"""Parakeet エンジンのユニットテスト（モデルはモック）"""
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+
+class TestParakeetTranscribe:
+    """Parakeet の文字起こし経路のテスト"""
+
+    def test_transcribe_scales_int16_input(self, parakeet_engine):
+        """int16 入力は 1/32768 倍した float32 としてモデルに渡すことを確認"""
+        audio = np.full(16000, -32768, dtype=np.int16)
+
+        parakeet_engine.transcribe(audio, 16000)
+
+        passed = parakeet_engine.model.transcribe.call_args.kwargs["audio"][0]
+        assert passed.dtype == np.float32
+        assert np.all(passed == -1.0)
+
+    def test_transcribe_short_audio_skips_preprocessing(self, parakeet_engine):
+        """0.1 秒未満の音声はリサンプル前に除外し、モデルも呼ばないことを確認"""
+        audio = np.zeros(4000, dtype=np.float32)  # 48kHz で約 0.08 秒
+
+        with patch("livecap_cli.engines.parakeet_engine.resample_poly") as resample:
+            assert parakeet_engine.transcribe(audio, 48000) == ("", 1.0)
+
+        resample.assert_not_called()
+        parakeet_engine.model.transcribe.assert_not_called()
+
+    def test_transcribe_resamples_to_16khz(self, parakeet_engine):
+        """48kHz の入力を 16kHz にリサンプリングして渡すことを確認"""
+        audio = np.zeros(48000, dtype=np.float32)
+
+        parakeet_engine.transcribe(audio, 48000)
+
+        passed = parakeet_engine.model.transcribe.call_args.kwargs["audio"][0]
+        assert len(passed) == 16000
+        assert passed.dtype == np.float32
+
+    def test_wav_fallback_reuses_scratch_file(self, parakeet_engine):
+        """WAV フォールバックでは同じ一時ファイルを使い回し、cleanup で削除することを確認"""
+        import os
+
+        from livecap_cli.engines.parakeet_engine import ParakeetEngine
+
+        ParakeetEngine._supports_array_input = False
+        paths = []
+
+        def transcribe(audio, **kwargs):
+            paths.extend(audio)
+            return [SimpleNamespace(text="ok")]
+
+        parakeet_engine.model.transcribe.side_effect = transcribe
+
+        parakeet_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+        parakeet_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert paths[0] == paths[1]
+        assert os.path.exists(paths[0])
+        assert sf.info(paths[0]).subtype == "PCM_16"
+
+        parakeet_engine.cleanup()
+        assert not os.path.exists(paths[0])
+
+
+    def test_transcribe_suppresses_progress_with_verbose_flag(self, parakeet_engine):
+        """verbose 対応の NeMo では環境変数を変更せず verbose=False を渡すことを確認"""
+        import os
+
+        seen = []
+
+        def transcribe(audio, batch_size, verbose=True):
+            seen.append((verbose, os.environ.get("TQDM_DISABLE")))
+            return [SimpleNamespace(text="ok")]
+
+        parakeet_engine.model.transcribe = transcribe
+        parakeet_engine._quiet_transcribe = None
+
+        parakeet_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert seen == [(False, os.environ.get("TQDM_DISABLE"))]
+
+    def test_transcribe_without_verbose_flag_uses_legacy_suppression(self, parakeet_engine):
+        """verbose 非対応の NeMo では従来通り環境変数でプログレスバーを抑制することを確認"""
+        seen = []
+
+        def transcribe(audio, batch_size):
+            import os
+            seen.append(os.environ.get("TQDM_DISABLE"))
+            return [SimpleNamespace(text="ok")]
+
+        parakeet_engine.model.transcribe = transcribe
+        parakeet_engine._quiet_transcribe = None
+
+        parakeet_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert seen == ["1"]
+
+
+    def test_transcribe_runs_under_inference_mode(self, parakeet_engine, monkeypatch):
+        """model.transcribe が推論モードのコンテキスト内で呼ばれることを確認"""
+        from contextlib import contextmanager
+
+        state = {"active": False}
+        seen = []
+
+        @contextmanager
+        def fake_inference_mode():
+            state["active"] = True
+            try:
+                yield
+            finally:
+                state["active"] = False
+
+        monkeypatch.setattr("livecap_cli.engines.parakeet_engine.inference_mode", fake_inference_mode)
+        parakeet_engine.model.transcribe.side_effect = lambda audio, **kwargs: seen.append(state["active"]) or ["ok"]
+
+        parakeet_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert seen == [True]
+
+class TestParakeetTranscribeBatch:
+    """Parakeet のバッチ文字起こしのテスト"""
+
+    def test_transcribe_batch_excludes_short_chunks_from_batch_size(self, parakeet_engine):
+        """短すぎるチャンクは batch_size に含めないことを確認"""
+        chunks = [
+            np.zeros(16000, dtype=np.float32),
+            np.zeros(100, dtype=np.float32),
+            np.zeros(16000, dtype=np.float32),
+        ]
+
+        parakeet_engine.transcribe_batch(chunks, 16000)
+
+        assert parakeet_engine.model.transcribe.call_args.kwargs["batch_size"] == 2
+
+class TestParakeetConfigureModel:
+    """Parakeet のモデル設定のテスト"""
+
+    def test_bf16_conversion_skipped_on_cpu(self, parakeet_engine):
+        """CPU では bfloat16 への変換を行わないことを確認"""
+        parakeet_engine._configure_model()
+
+        parakeet_engine.model.to.assert_not_called()
+
+    def test_configure_model_runs_warmup_inference(self, parakeet_engine):
+        """モデル設定の最後にダミー推論を 1 回行うことを確認"""
+        parakeet_engine._configure_model()
+
+        parakeet_engine.model.transcribe.assert_called_once()
+        passed = parakeet_engine.model.transcribe.call_args.kwargs["audio"][0]
+        assert len(passed) == 16000
+
+    def test_warmup_failure_is_ignored(self, parakeet_engine):
+        """ダミー推論が失敗してもモデル設定は完了することを確認"""
+        parakeet_engine.model.transcribe.side_effect = RuntimeError("boom")
+
+        parakeet_engine._configure_model()
+
+    def test_bf16_disabled_by_default(self, parakeet_engine):
+        """bf16 変換はデフォルトで無効であることを確認"""
+        assert parakeet_engine.use_bf16 is False
+
+    def test_bf16_uses_separate_cache_key(self):
+        """bf16 のモデルは float32 のモデルとキャッシュを共有しないことを確認"""
+        from livecap_cli.engines.parakeet_engine import ParakeetEngine
+
+        with patch("livecap_cli.engines.parakeet_engine.LibraryPreloader.start_preloading"), \
+                patch("livecap_cli.engines.parakeet_engine.detect_device", return_value="cuda"):
+            fp32 = ParakeetEngine(device="cuda", warmup=False)
+            bf16 = ParakeetEngine(device="cuda", warmup=False, use_bf16=True)
+
+        assert fp32._cache_key != bf16._cache_key
+
+    def test_bf16_keeps_preprocessor_fp32_and_autocasts(self, parakeet_engine, monkeypatch):
+        """bf16 変換時は前処理を float32 に保ち、推論を autocast で包むことを確認"""
+        import sys
+        import types
+        from contextlib import nullcontext
+
+        fake_torch = types.ModuleType("torch")
+        fake_torch.bfloat16 = "bfloat16"
+        fake_torch.cuda = MagicMock()
+        fake_torch.cuda.is_bf16_supported.return_value = True
+        fake_torch.autocast = MagicMock(return_value=nullcontext())
+        fake_torch.inference_mode = nullcontext
+        monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+        model = parakeet_engine.model
+        model.to.return_value = model
+        parakeet_engine.use_bf16 = True
+        parakeet_engine.torch_device = "cuda"
+
+        parakeet_engine._configure_model()
+
+        model.to.assert_called_once_with("bfloat16")
+        model.preprocessor.float.assert_called_once()
+        fake_torch.autocast.assert_called_with(device_type="cuda", dtype="bfloat16")
+        parakeet_engine.torch_device = "cpu"
+
+
+class TestParakeetModelCache:
+    """Parakeet のモデルキャッシュのテスト"""
+
+    def test_load_model_from_path_returns_cached_model(self, parakeet_engine):
+        """キャッシュ済みのモデルは NeMo を使わずにそのまま返すことを確認"""
+        from pathlib import Path
+
+        cached = object()
+        with patch("livecap_cli.engines.parakeet_engine.ModelMemoryCache.get", return_value=cached) as get:
+            assert parakeet_engine._load_model_from_path(Path("unused.nemo")) is cached
+
+        get.assert_called_once_with("parakeet_parakeet_nvidia_parakeet-tdt-0.6b-v2_cpu")
+
+
+class TestParakeetResultTexts:
+    """Parakeet の結果テキスト抽出のテスト"""
+
+    @pytest.mark.parametrize(
+        "transcriptions",
+        [
+            [SimpleNamespace(text=" a "), SimpleNamespace(text="b")],
+            ([SimpleNamespace(text=" a "), SimpleNamespace(text="b")], None),
+            [" a ", "b"],
+        ],
+    )
+    def test_extractor_is_selected_once(self, parakeet_engine, transcriptions):
+        """戻り値の形式に応じた抽出関数を一度だけ選択して使い回すことを確認"""
+        assert parakeet_engine._result_texts(transcriptions) == ["a", "b"]
+
+        extractor = parakeet_engine._text_extractor
+        assert extractor is not None
+        assert extractor != parakeet_engine._texts_generic
+        assert parakeet_engine._result_texts(transcriptions) == ["a", "b"]
+        assert parakeet_engine._text_extractor is extractor
+
+    def test_empty_result_is_not_recorded(self, parakeet_engine):
+        """空の結果では抽出関数を確定させないことを確認"""
+        assert parakeet_engine._result_texts([]) == []
+        assert parakeet_engine._text_extractor is None
+
+
+class TestParakeetPrefetch:
+    """Parakeet のモデル先行ダウンロードのテスト"""
+
+    def test_download_copies_prefetched_file(self, parakeet_engine, tmp_path, monkeypatch):
+        """先行ダウンロードした .nemo をコピーし、NeMo を使わずに配置することを確認"""
+        downloaded = tmp_path / "hf" / "model.nemo"
+        downloaded.parent.mkdir()
+        downloaded.write_bytes(b"nemo")
+        monkeypatch.setattr(parakeet_engine, "_prefetch_model", lambda model_manager=None: downloaded)
+
+        target = tmp_path / "models" / "model.nemo"
+        parakeet_engine._start_prefetch(target)
+        parakeet_engine._download_model(target)
+
+        assert target.read_bytes() == b"nemo"
+        assert parakeet_engine._prefetch_future is None
+
+    def test_prefetch_skipped_when_model_exists(self, parakeet_engine, tmp_path):
+        """ローカルにモデルがある場合は先行ダウンロードを開始しないことを確認"""
+        target = tmp_path / "model.nemo"
+        target.write_bytes(b"nemo")
+
+        parakeet_engine._start_prefetch(target)
+
+        assert parakeet_engine._prefetch_future is None
+
+    def test_prefetch_failure_returns_none(self, parakeet_engine, tmp_path, monkeypatch):
+        """先行ダウンロードが失敗した場合は None を返しフォールバックさせることを確認"""
+        def fail(model_manager=None):
+            raise OSError("offline")
+
+        monkeypatch.setattr(parakeet_engine, "_prefetch_model", fail)
+
+        assert parakeet_engine._wait_for_prefetch(tmp_path / "model.nemo") is None
+
+    def test_prefetch_dropped_when_nemo_unavailable(self, parakeet_engine, tmp_path, monkeypatch):
+        """NeMo のインポートに失敗した場合は先行ダウンロードを手放し、終了を妨げないことを確認"""
+        from livecap_cli.engines import parakeet_engine as module
+
+        started = threading.Event()
+        release = threading.Event()
+        threads = []
+
+        def slow_prefetch(model_manager=None):
+            threads.append(threading.current_thread())
+            started.set()
+            release.wait(5)
+            return None
+
+        monkeypatch.setattr(parakeet_engine, "_prefetch_model", slow_prefetch)
+        monkeypatch.setattr(module.importlib.util, "find_spec", lambda name: object())
+        monkeypatch.setattr(module, "get_models_dir", lambda: tmp_path)
+        monkeypatch.setattr(module, "check_nemo_availability", lambda: False)
+
+        try:
+            with pytest.raises(ImportError):
+                parakeet_engine._check_dependencies()
+
+            assert started.wait(5)
+            assert parakeet_engine._prefetch_future is None
+            assert threads[0].daemon
+        finally:
+            release.set()
+
+
+class TestParakeetCleanup:
+    """Parakeet のクリーンアップのテスト"""
+
+    def test_cuda_cache_released_only_for_last_model(self, monkeypatch):
+        """CUDA のキャッシュは最後のモデルを解放した時だけ返却することを確認"""
+        import sys
+        import types
+
+        from livecap_cli.engines.parakeet_engine import ParakeetEngine
+
+        released = []
+        fake_torch = types.SimpleNamespace(cuda=types.SimpleNamespace(empty_cache=lambda: released.append(True)))
+        monkeypatch.setitem(sys.modules, "torch", fake_torch)
+        from livecap_cli.engines.model_memory_cache import ModelMemoryCache
+
+        monkeypatch.setattr(ModelMemoryCache, "_ref_counts", {})
+
+        engines = []
+        for _ in range(2):
+            with patch("livecap_cli.engines.parakeet_engine.LibraryPreloader.start_preloading"):
+                engine = ParakeetEngine(device="cpu", warmup=False, use_bf16=False)
+            engine.torch_device = "cuda"
+            engine.model = MagicMock()
+            engine._configure_model()
+            engines.append(engine)
+
+        engines[0].cleanup()
+        assert released == []
+
+        engines[1].cleanup()
+        assert released == [True]
+        assert ModelMemoryCache.get_stats()["ref_counts"] == {}
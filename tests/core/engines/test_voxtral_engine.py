@@ -0,0 +1,522 @@
+"""Voxtral エンジンのユニットテスト（モデル・プロセッサはモック）"""
+import contextlib
+import importlib.machinery
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from livecap_cli.engines.voxtral_engine import _VoxtralBundle
+
+
+class _FakeInputs(dict):
+    """apply_transcription_request の戻り値（BatchFeature）の代用"""
+
+    def __init__(self, prompt_length: int = 2):
+        super().__init__(input_ids=np.zeros((1, prompt_length), dtype=np.int64))
+
+    @property
+    def input_ids(self):
+        return self["input_ids"]
+
+    def to(self, *args, **kwargs):
+        return self
+
+
+class _FakeBatch(_FakeInputs):
+    """複数チャンク分の入力（パディング済み）の代用"""
+
+    def __init__(self, batch_size: int, prompt_length: int = 2):
+        dict.__init__(self, input_ids=np.zeros((batch_size, prompt_length), dtype=np.int64))
+
+
+@pytest.fixture
+def fake_torch(monkeypatch):
+    """torch 未インストール環境でも推論経路を通せるよう最小限の torch を差し込む"""
+    module = types.ModuleType("torch")
+    module.__spec__ = importlib.machinery.ModuleSpec("torch", None)
+    module.Tensor = type("Tensor", (), {})
+    module.no_grad = contextlib.nullcontext
+    module.inference_mode = contextlib.nullcontext
+    module.cuda = types.SimpleNamespace(
+        empty_cache=MagicMock(),
+        Stream=MagicMock(),
+        stream=MagicMock(return_value=contextlib.nullcontext()),
+        current_stream=MagicMock(),
+        memory_reserved=MagicMock(return_value=0),
+        memory_allocated=MagicMock(return_value=0),
+    )
+    monkeypatch.setitem(sys.modules, "torch", module)
+    return module
+
+
+@pytest.fixture
+def voxtral_engine(fake_torch):
+    """transformers なしで推論経路を検証できるよう、モデルをモックしたエンジンを返す"""
+    from livecap_cli.engines.voxtral_engine import VoxtralEngine
+
+    with patch("livecap_cli.engines.voxtral_engine.LibraryPreloader.start_preloading"):
+        engine = VoxtralEngine(device="cpu")
+
+    engine.model = MagicMock()
+    engine.model.generate.side_effect = lambda **kwargs: np.array([[0, 0, 7, 8]])
+    engine.processor = MagicMock()
+    engine.processor.apply_transcription_request.side_effect = lambda **kwargs: _FakeInputs()
+    engine.processor.batch_decode.return_value = [" hello "]
+    engine._initialized = True
+
+    original = VoxtralEngine._supports_array_input
+    VoxtralEngine._supports_array_input = None
+    yield engine
+    VoxtralEngine._supports_array_input = original
+    engine.cleanup()
+
+
+class TestVoxtralTranscribe:
+    """Voxtral の文字起こし経路のテスト"""
+
+    def test_transcribe_passes_ndarray_directly(self, voxtral_engine):
+        """ndarray とサンプリングレートをそのままプロセッサに渡すことを確認"""
+        audio = np.zeros(16000, dtype=np.float32)
+
+        assert voxtral_engine.transcribe(audio, 16000) == ("hello", 1.0)
+
+        kwargs = voxtral_engine.processor.apply_transcription_request.call_args.kwargs
+        assert isinstance(kwargs["audio"], np.ndarray)
+        assert kwargs["sampling_rate"] == 16000
+        assert kwargs["format"] == "wav"
+
+    def test_transcribe_normalizes_without_mutating_input(self, voxtral_engine):
+        """ピークが 1.0 を超える場合に正規化し、入力配列は変更しないことを確認"""
+        audio = np.full(16000, 2.0, dtype=np.float32)
+
+        voxtral_engine.transcribe(audio, 16000)
+
+        passed = voxtral_engine.processor.apply_transcription_request.call_args.kwargs["audio"]
+        assert np.max(np.abs(passed)) == pytest.approx(1.0)
+        assert np.all(audio == 2.0)
+
+    def test_transcribe_reuses_scratch_buffer(self, voxtral_engine):
+        """float32 以外の入力は使い回しのスクラッチバッファに変換することを確認"""
+        audio = np.full(16000, 0.5, dtype=np.float64)
+
+        voxtral_engine.transcribe(audio, 16000)
+        scratch = voxtral_engine._scratch
+        voxtral_engine.transcribe(audio[:8000], 16000)
+
+        assert voxtral_engine._scratch is scratch
+        passed = voxtral_engine.processor.apply_transcription_request.call_args.kwargs["audio"]
+        assert passed.dtype == np.float32
+        assert np.shares_memory(passed, scratch)
+
+    def test_transcribe_decodes_generated_tokens_only(self, voxtral_engine):
+        """プロンプト部分を除いた生成トークンだけをデコードすることを確認"""
+        voxtral_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        decoded = voxtral_engine.processor.batch_decode.call_args.args[0]
+        assert decoded.tolist() == [[7, 8]]
+
+    def test_transcribe_removes_space_before_punctuation(self, voxtral_engine):
+        """句読点前の空白だけを除去し、トークナイザのクリーンアップは使わないことを確認"""
+        voxtral_engine.processor.batch_decode.return_value = [" Hello , world ! "]
+
+        text, _ = voxtral_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert text == "Hello, world!"
+        assert voxtral_engine.processor.batch_decode.call_args.kwargs["clean_up_tokenization_spaces"] is False
+
+    def test_generation_kwargs_built_once(self, voxtral_engine):
+        """生成設定は一度だけ構築され、呼び出し間で共有されることを確認"""
+        voxtral_engine.processor.tokenizer.pad_token_id = 11
+
+        voxtral_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+        first = voxtral_engine._gen_kwargs
+        voxtral_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert voxtral_engine._gen_kwargs is first
+        assert first["max_new_tokens"] == 448
+        assert first["pad_token_id"] == 11
+
+    def test_repetition_stop_disabled_by_default(self, voxtral_engine):
+        """反復による打ち切りはデフォルトで無効であることを確認"""
+        assert voxtral_engine.repetition_stop_tokens == 0
+        assert "stopping_criteria" not in voxtral_engine._build_generation_kwargs()
+
+    def test_repetition_stops_only_repeated_ngrams(self, voxtral_engine):
+        """n-gram の繰り返しだけ生成を打ち切り、単一トークンの連続では打ち切らないことを確認"""
+        from livecap_cli.engines.voxtral_engine import _RepetitionStoppingCriteria
+
+        voxtral_engine.repetition_stop_tokens = 8
+        criteria = voxtral_engine._build_generation_kwargs()["stopping_criteria"]
+        assert len(criteria) == 1 and isinstance(criteria[0], _RepetitionStoppingCriteria)
+
+        input_ids = np.array([
+            [1, 2, 3, 6, 7, 6, 7, 6, 7, 6, 7],  # 2-gram の繰り返し
+            [1, 2, 3, 5, 5, 5, 5, 5, 5, 5, 5],  # 同一トークンの連続（「ははは」等）
+            [1, 2, 3, 4, 6, 7, 6, 7, 6, 7, 6],  # 繰り返しが span に満たない
+            [0, 1, 2, 3, 1, 2, 3, 1, 2, 3, 1],  # 3-gram の繰り返し
+        ])
+        assert criteria[0](input_ids, None).tolist() == [True, False, False, True]
+
+    def test_generate_runs_under_inference_mode(self, voxtral_engine, fake_torch):
+        """generate は no_grad ではなく inference_mode の下で実行することを確認"""
+        fake_torch.no_grad = MagicMock(side_effect=AssertionError("no_grad should not be used"))
+        fake_torch.inference_mode = MagicMock(return_value=contextlib.nullcontext())
+
+        assert voxtral_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("hello", 1.0)
+        fake_torch.inference_mode.assert_called_once()
+
+    def test_transcribe_falls_back_to_wav_file(self, voxtral_engine, tmp_path):
+        """ndarray 非対応のプロセッサでは WAV ファイル経由にフォールバックすることを確認"""
+        from livecap_cli.engines.voxtral_engine import VoxtralEngine
+
+        def apply_transcription_request(**kwargs):
+            if not isinstance(kwargs["audio"], str):
+                raise TypeError("expected a file path")
+            return _FakeInputs()
+
+        voxtral_engine.processor.apply_transcription_request.side_effect = apply_transcription_request
+
+        with patch("livecap_cli.engines.voxtral_engine.get_temp_dir", return_value=tmp_path):
+            assert voxtral_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("hello", 1.0)
+
+        assert VoxtralEngine._supports_array_input is False
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestVoxtralTranscribeBatch:
+    """Voxtral のバッチ文字起こしのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def batched_outputs(self, voxtral_engine):
+        """入力されたチャンク数に応じた行数を生成・デコードするようにする"""
+        def apply_transcription_request(**kwargs):
+            audio = kwargs["audio"]
+            return _FakeInputs() if not isinstance(audio, list) else _FakeBatch(len(audio))
+
+        voxtral_engine.processor.apply_transcription_request.side_effect = apply_transcription_request
+        voxtral_engine.model.generate.side_effect = lambda **kwargs: np.tile(
+            [0, 0, 7, 8], (len(kwargs["input_ids"]), 1)
+        )
+        voxtral_engine.processor.batch_decode.side_effect = lambda ids, **kwargs: [
+            f" text{i} " for i in range(len(ids))
+        ]
+
+    def test_transcribe_batch_single_generate_call(self, voxtral_engine):
+        """複数チャンクを 1 回の generate 呼び出しで処理することを確認"""
+        chunks = [np.zeros(16000, dtype=np.float32) for _ in range(3)]
+
+        results = voxtral_engine.transcribe_batch(chunks, 16000)
+
+        assert results == [("text0", 1.0), ("text1", 1.0), ("text2", 1.0)]
+        assert voxtral_engine.model.generate.call_count == 1
+
+    def test_transcribe_batch_keeps_order_with_short_chunks(self, voxtral_engine):
+        """短すぎるチャンクは空文字となり、他の結果の順序が保たれることを確認"""
+        chunks = [
+            np.zeros(16000, dtype=np.float32),
+            np.zeros(100, dtype=np.float32),
+            np.zeros(16000, dtype=np.float32),
+        ]
+
+        results = voxtral_engine.transcribe_batch(chunks, 16000)
+
+        assert results == [("text0", 1.0), ("", 1.0), ("text1", 1.0)]
+
+    def test_transcribe_batch_does_not_alias_scratch_buffer(self, voxtral_engine):
+        """スクラッチバッファに変換したチャンク同士が上書きし合わないことを確認"""
+        chunks = [np.full(16000, v, dtype=np.float64) for v in (0.25, 0.5)]
+
+        voxtral_engine.transcribe_batch(chunks, 16000)
+
+        passed = voxtral_engine.processor.apply_transcription_request.call_args.kwargs["audio"]
+        assert [float(chunk[0]) for chunk in passed] == [0.25, 0.5]
+
+
+class TestVoxtralQuantization:
+    """Voxtral の重み量子化設定のテスト"""
+
+    def test_unknown_quantization_is_rejected(self):
+        """未対応の量子化指定は ValueError になることを確認"""
+        from livecap_cli.engines.voxtral_engine import VoxtralEngine
+
+        with patch("livecap_cli.engines.voxtral_engine.LibraryPreloader.start_preloading"):
+            with pytest.raises(ValueError):
+                VoxtralEngine(device="cpu", quantization="int4")
+
+    def test_quantization_disabled_on_cpu(self):
+        """CPU では量子化を無効化し、from_pretrained に追加引数を渡さないことを確認"""
+        from livecap_cli.engines.voxtral_engine import VoxtralEngine
+
+        with patch("livecap_cli.engines.voxtral_engine.LibraryPreloader.start_preloading"):
+            engine = VoxtralEngine(device="cpu", quantization="int8")
+
+        assert engine.quantization is None
+        assert engine._quantization_kwargs(None) == {}
+
+
+class TestVoxtralCompile:
+    """Voxtral の torch.compile 設定のテスト"""
+
+    def test_compile_skipped_by_default(self, voxtral_engine):
+        """既定では forward をコンパイルしないことを確認"""
+        voxtral_engine.torch_device = "cuda"
+        voxtral_engine.model = _VoxtralBundle(voxtral_engine.model, voxtral_engine.processor)
+
+        with patch.object(voxtral_engine, "_compile_model") as compile_model:
+            voxtral_engine._configure_model()
+
+        compile_model.assert_not_called()
+
+    def test_compile_wraps_forward_once_and_warms_up(self, voxtral_engine, fake_torch):
+        """forward を一度だけコンパイルし、ダミー推論を行うことを確認"""
+        fake_torch.compile = MagicMock(side_effect=lambda fn, **kwargs: fn)
+        voxtral_engine.torch_compile = True
+        voxtral_engine.torch_device = "cuda"
+
+        bundle = _VoxtralBundle(voxtral_engine.model, voxtral_engine.processor)
+
+        for _ in range(2):
+            voxtral_engine.model = bundle
+            voxtral_engine._configure_model()
+
+        assert fake_torch.compile.call_count == 1
+        assert voxtral_engine.model.generation_config.cache_implementation == "static"
+        assert voxtral_engine.model.generate.call_args.kwargs["max_new_tokens"] == 4
+
+
+class TestVoxtralResample:
+    """Voxtral のリサンプルのテスト"""
+
+    def test_resamples_on_cpu_with_polyphase_filter(self, voxtral_engine):
+        """48kHz 入力を resample_poly で 16kHz に変換することを確認"""
+        audio = np.zeros(48000, dtype=np.float32)
+
+        with patch(
+            "livecap_cli.engines.voxtral_engine.resample_poly",
+            return_value=np.zeros(16000, dtype=np.float32),
+        ) as resample:
+            voxtral_engine.transcribe(audio, 48000)
+
+        assert resample.call_args.args[1:] == (1, 3)
+        passed = voxtral_engine.processor.apply_transcription_request.call_args.kwargs["audio"]
+        assert len(passed) == 16000
+        assert passed.dtype == np.float32
+
+    def test_cuda_engine_does_not_resample_on_gpu(self, voxtral_engine, monkeypatch):
+        """CUDA デバイスでもリサンプルに torch を使わない（GPU との往復をしない）ことを確認"""
+        monkeypatch.setitem(sys.modules, "torchaudio", None)
+        voxtral_engine.torch_device = "cuda"
+
+        resampled = voxtral_engine._resample(np.zeros(44100, dtype=np.float32), 44100)
+
+        assert resampled.shape == (16000,)
+        assert resampled.dtype == np.float32
+
+    def test_matching_rate_skips_resample(self, voxtral_engine):
+        """入力が既に 16kHz の場合はリサンプルもサンプリングレートの問い合わせも行わないことを確認"""
+        voxtral_engine.get_required_sample_rate = MagicMock(side_effect=AssertionError("not cached"))
+
+        with patch("livecap_cli.engines.voxtral_engine.resample_poly") as resample:
+            assert voxtral_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("hello", 1.0)
+
+        resample.assert_not_called()
+
+class TestVoxtralDtype:
+    """Voxtral の推論 dtype 選択のテスト"""
+
+    def test_bf16_selected_when_supported(self, voxtral_engine, fake_torch):
+        """bf16 対応 GPU では bfloat16、非対応では float16 を選ぶことを確認"""
+        fake_torch.float16, fake_torch.bfloat16, fake_torch.float32 = "float16", "bfloat16", "float32"
+        voxtral_engine.torch_device = "cuda"
+
+        fake_torch.cuda.is_bf16_supported = lambda: True
+        assert voxtral_engine._select_dtype(fake_torch) == "bfloat16"
+
+        fake_torch.cuda.is_bf16_supported = lambda: False
+        assert voxtral_engine._select_dtype(fake_torch) == "float16"
+
+    def test_cpu_uses_float32(self, voxtral_engine, fake_torch):
+        """CPU では float32 を使うことを確認"""
+        fake_torch.float32 = "float32"
+
+        assert voxtral_engine._select_dtype(fake_torch) == "float32"
+
+    def test_inputs_cast_to_model_dtype_on_cuda(self, voxtral_engine):
+        """CUDA では特徴量をモデルの dtype に変換して転送することを確認"""
+        voxtral_engine.torch_device = "cuda"
+        voxtral_engine.model.dtype = "bfloat16"
+        voxtral_engine.model = _VoxtralBundle(voxtral_engine.model, voxtral_engine.processor)
+        voxtral_engine._configure_model()
+
+        inputs = MagicMock()
+        voxtral_engine._to_device(inputs)
+
+        inputs.to.assert_called_once_with("cuda", non_blocking=True, dtype="bfloat16")
+
+    def test_inputs_pinned_and_copied_on_side_stream(self, voxtral_engine, fake_torch):
+        """CUDA では入力をページロックし、転送用ストリームの完了を待ってから使うことを確認"""
+        voxtral_engine.torch_device = "cuda"
+        voxtral_engine.model = _VoxtralBundle(voxtral_engine.model, voxtral_engine.processor)
+        voxtral_engine._configure_model()
+
+        features = MagicMock(spec=fake_torch.Tensor)
+        features.is_cuda = False
+        features.pin_memory = MagicMock(return_value=features)
+        features.record_stream = MagicMock()
+        inputs = MagicMock()
+        inputs.items.return_value = [("input_features", features)]
+        inputs.to.return_value = inputs
+        inputs.values.return_value = [features]
+
+        assert voxtral_engine._to_device(inputs) is inputs
+
+        features.pin_memory.assert_called_once()
+        fake_torch.cuda.stream.assert_called_once_with(voxtral_engine._copy_stream)
+        current = fake_torch.cuda.current_stream.return_value
+        current.wait_stream.assert_called_once_with(voxtral_engine._copy_stream)
+        features.record_stream.assert_called_once_with(current)
+
+
+class TestVoxtralAttention:
+    """Voxtral のアテンション実装選択のテスト"""
+
+    def test_cpu_uses_sdpa(self, voxtral_engine, fake_torch):
+        """CPU では SDPA を使うことを確認"""
+        assert voxtral_engine._select_attn_implementation(fake_torch) == "sdpa"
+
+    def test_flash_attention_requires_ampere_and_package(self, voxtral_engine, fake_torch):
+        """FlashAttention-2 は Ampere 以降かつ flash-attn がある場合だけ選ぶことを確認"""
+        voxtral_engine.torch_device = "cuda"
+        spec = object()
+
+        with patch("livecap_cli.engines.voxtral_engine.importlib.util.find_spec", return_value=spec):
+            fake_torch.cuda.get_device_capability = lambda: (8, 6)
+            assert voxtral_engine._select_attn_implementation(fake_torch) == "flash_attention_2"
+
+            fake_torch.cuda.get_device_capability = lambda: (7, 5)
+            assert voxtral_engine._select_attn_implementation(fake_torch) == "sdpa"
+
+        with patch("livecap_cli.engines.voxtral_engine.importlib.util.find_spec", return_value=None):
+            fake_torch.cuda.get_device_capability = lambda: (9, 0)
+            assert voxtral_engine._select_attn_implementation(fake_torch) == "sdpa"
+
+
+class TestVoxtralTranscribeStream:
+    """Voxtral の逐次文字起こしのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def word_tokenizer(self, voxtral_engine):
+        """トークン ID を単語に対応させるトークナイザ"""
+        voxtral_engine.processor.tokenizer.decode.side_effect = lambda ids, **kwargs: "".join(
+            f"w{i} " for i in ids
+        )
+
+    def test_stream_yields_text_as_generated(self, voxtral_engine):
+        """生成されたトークンをプロンプトを除いて順に返すことを確認"""
+        def generate(streamer, **kwargs):
+            streamer.put(np.array([[1, 2]]))  # プロンプト
+            streamer.put(np.array([7]))
+            streamer.put(np.array([8]))
+            streamer.end()
+
+        voxtral_engine.model.generate.side_effect = generate
+
+        pieces = list(voxtral_engine.transcribe_stream(np.zeros(16000, dtype=np.float32), 16000))
+
+        assert "".join(pieces) == "w7 w8 "
+
+    def test_stream_propagates_generate_errors(self, voxtral_engine):
+        """generate の例外を呼び出し側に送出し、待ち続けないことを確認"""
+        voxtral_engine.model.generate.side_effect = RuntimeError("CUDA out of memory")
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            list(voxtral_engine.transcribe_stream(np.zeros(16000, dtype=np.float32), 16000))
+
+
+class TestVoxtralDependencies:
+    """Voxtral の依存関係チェックのテスト"""
+
+    def test_missing_voxtral_class_raises(self, voxtral_engine, monkeypatch):
+        """Voxtral クラスが解決できない transformers では ImportError になることを確認"""
+        import livecap_cli.engines.voxtral_engine as module
+
+        monkeypatch.setattr(module, "TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(module, "_VOXTRAL_CLS", None)
+
+        with pytest.raises(ImportError, match="transformers"):
+            voxtral_engine._check_dependencies()
+
+    def test_mistral_common_version_checked_once(self, monkeypatch):
+        """mistral-common のバージョン取得は初回だけ行うことを確認"""
+        import livecap_cli.engines.voxtral_engine as module
+
+        monkeypatch.setattr(module, "_MISTRAL_COMMON_VERSION", None)
+        monkeypatch.setitem(sys.modules, "mistral_common", types.SimpleNamespace(__version__="1.8.1"))
+
+        assert module.check_mistral_common_availability() is True
+        monkeypatch.delitem(sys.modules, "mistral_common")
+        assert module.check_mistral_common_availability() is True
+        assert module._MISTRAL_COMMON_VERSION == "1.8.1"
+
+
+class TestVoxtralBundle:
+    """モデルとプロセッサの組のキャッシュのテスト"""
+
+    def test_bundle_cached_weakly_while_engine_holds_it(self, voxtral_engine):
+        """バンドルは弱参照でキャッシュされ、エンジンが保持している間だけ取得できることを確認"""
+        from livecap_cli.engines.model_memory_cache import ModelMemoryCache
+
+        key = "voxtral_test_bundle"
+        voxtral_engine.model = _VoxtralBundle(voxtral_engine.model, voxtral_engine.processor)
+        ModelMemoryCache.set(key, voxtral_engine.model)
+        try:
+            assert key not in ModelMemoryCache._strong_refs
+            voxtral_engine._configure_model()
+            assert ModelMemoryCache.get(key) is voxtral_engine._bundle
+
+            voxtral_engine.cleanup()
+            assert ModelMemoryCache.get(key) is None
+        finally:
+            ModelMemoryCache.clear(key)
+
+
+class TestVoxtralCleanup:
+    """Voxtral のクリーンアップのテスト"""
+
+    def test_empty_cache_skipped_below_threshold(self, voxtral_engine, fake_torch):
+        """未使用の予約領域が閾値以下なら empty_cache を呼ばないことを確認"""
+        voxtral_engine.torch_device = "cuda"
+        fake_torch.cuda.memory_reserved.return_value = 64 * 1024 * 1024
+
+        voxtral_engine.cleanup()
+
+        fake_torch.cuda.empty_cache.assert_not_called()
+
+    def test_empty_cache_called_above_threshold(self, voxtral_engine, fake_torch, monkeypatch):
+        """未使用の予約領域が閾値を超えると empty_cache を呼ぶことを確認"""
+        monkeypatch.setenv("LIVECAP_CUDA_EMPTY_CACHE_THRESHOLD_MB", "32")
+        voxtral_engine.torch_device = "cuda"
+        fake_torch.cuda.memory_reserved.return_value = 64 * 1024 * 1024
+
+        voxtral_engine.cleanup()
+
+        fake_torch.cuda.empty_cache.assert_called_once()
+
+    def test_aggressive_always_empties_cache(self, voxtral_engine, fake_torch):
+        """aggressive=True では予約領域に関わらず empty_cache を呼ぶことを確認"""
+        voxtral_engine.torch_device = "cuda"
+
+        voxtral_engine.cleanup(aggressive=True)
+
+        fake_torch.cuda.empty_cache.assert_called_once()
+
+    def test_invalid_threshold_uses_default(self, monkeypatch):
+        """不正な環境変数値では既定の閾値を使うことを確認"""
+        from livecap_cli.engines.voxtral_engine import _get_empty_cache_threshold
+
+        monkeypatch.setenv("LIVECAP_CUDA_EMPTY_CACHE_THRESHOLD_MB", "abc")
+
+        assert _get_empty_cache_threshold() == 256 * 1024 * 1024
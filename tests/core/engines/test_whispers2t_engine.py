@@ -0,0 +1,560 @@
+"""WhisperS2T エンジンのユニットテスト（モデルはモック）"""
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+class TestWhisperS2TTranscribe:
+    """WhisperS2T の文字起こし経路のテスト"""
+
+    def test_transcribe_passes_language_code(self, whispers2t_engine):
+        """transcribe_with_vad に設定言語の lang_codes を渡すことを確認"""
+        whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert whispers2t_engine.model.transcribe_with_vad.call_args.kwargs["lang_codes"] == ["ja"]
+
+    def test_negative_peak_is_normalized(self, whispers2t_engine):
+        """負側のピークが 1.0 を超える場合も正規化することを確認"""
+        audio = np.zeros(16000, dtype=np.float32)
+        audio[0] = -4.0
+        audio[1] = 2.0
+
+        whispers2t_engine.transcribe(audio, 16000)
+
+        passed = whispers2t_engine.model.transcribe_with_vad.call_args.args[0][0]
+        assert passed[0] == pytest.approx(-1.0)
+        assert passed[1] == pytest.approx(0.5)
+
+    def test_trusted_input_skips_peak_scan(self, whispers2t_engine):
+        """trusted=True の 16kHz 入力はピーク値を走査せずそのまま渡すことを確認"""
+        class NoScanArray(np.ndarray):
+            def max(self, *args, **kwargs):
+                raise AssertionError("peak scanned")
+
+            min = max
+
+        audio = np.zeros(16000, dtype=np.float32).view(NoScanArray)
+
+        whispers2t_engine.transcribe(audio, 16000, trusted=True)
+
+        assert whispers2t_engine.model.transcribe_with_vad.call_args.args[0][0] is audio
+
+    def test_confidence_from_segment_logprobs(self, whispers2t_engine):
+        """信頼度はセグメントの avg_logprob の平均から計算することを確認"""
+        whispers2t_engine.model.transcribe_with_vad.side_effect = None
+        whispers2t_engine.model.transcribe_with_vad.return_value = [[{
+            "text": "hello",
+            "segments": [{"avg_logprob": -0.2}, {"avg_logprob": -0.4}, {"no_logprob": True}],
+        }]]
+
+        text, confidence = whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert text == "hello"
+        assert confidence == pytest.approx(np.exp(-0.3))
+
+    def test_single_chunk_kwargs_built_once(self, whispers2t_engine):
+        """単一チャンクの transcribe 引数は呼び出し間で使い回すことを確認"""
+        whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+        first = whispers2t_engine.model.transcribe_with_vad.call_args.kwargs["lang_codes"]
+        whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+        assert whispers2t_engine.model.transcribe_with_vad.call_args.kwargs["lang_codes"] is first
+
+    def test_transcribe_without_vad(self, whispers2t_engine):
+        """use_vad=False では transcribe を呼び出すことを確認"""
+        whispers2t_engine.use_vad = False
+        whispers2t_engine.model.transcribe.return_value = [[{"text": "no vad"}]]
+
+        assert whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("no vad", 1.0)
+        whispers2t_engine.model.transcribe_with_vad.assert_not_called()
+
+    def test_unrelated_error_does_not_disable_array_input(self, whispers2t_engine):
+        """ndarray 入力と無関係な例外は送出され、WAV 経由に切り替わらないことを確認"""
+        from livecap_cli.engines.whispers2t_engine import WhisperS2TEngine
+
+        whispers2t_engine.model.transcribe_with_vad.side_effect = RuntimeError("CUDA out of memory")
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+        assert WhisperS2TEngine._supports_array_input is None
+        assert whispers2t_engine.model.transcribe_with_vad.call_count == 1
+
+    @pytest.mark.skipif(not hasattr(os, "O_TMPFILE"), reason="O_TMPFILE is Linux only")
+    def test_wav_fallback_uses_anonymous_file(self, whispers2t_engine, tmp_path):
+        """WAV ファイル経由では名前のない一時ファイルを使い、ディレクトリに残さないことを確認"""
+        import soundfile as sf
+
+        whispers2t_engine._tmp_dir = tmp_path
+        seen = []
+
+        def transcribe_with_vad(audio, **kwargs):
+            if not isinstance(audio[0], str):
+                raise AttributeError("'numpy.ndarray' object has no attribute 'read'")
+            data, sample_rate = sf.read(audio[0])
+            seen.append((audio[0], len(data), sample_rate))
+            return [[{"text": "from file"}]]
+
+        whispers2t_engine.model.transcribe_with_vad.side_effect = transcribe_with_vad
+
+        assert whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("from file", 1.0)
+        assert seen[0][0].startswith("/proc/")
+        assert seen[0][1:] == (16000, 16000)
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions only")
+    def test_tmpfs_dir_is_private_per_process(self, tmp_path, monkeypatch):
+        """tmpfs 上の一時ディレクトリはプロセス専用で、所有者以外がアクセスできないことを確認"""
+        import stat
+
+        from livecap_cli.engines import whispers2t_engine as module
+
+        # 他のユーザーが先に作成した共有ディレクトリ名は使わない
+        (tmp_path / "livecap_whispers2t").mkdir()
+        monkeypatch.setattr(module, "_SHM_DIR", tmp_path)
+        monkeypatch.setattr(module.sys, "platform", "linux")
+        monkeypatch.setattr(module.atexit, "register", MagicMock())
+        module._select_tmp_dir.cache_clear()
+        try:
+            tmp_dir = module._select_tmp_dir()
+            assert module._select_tmp_dir() is tmp_dir
+        finally:
+            module._select_tmp_dir.cache_clear()
+
+        assert tmp_dir.parent == tmp_path
+        assert tmp_dir.name.startswith(f"livecap_whispers2t_{os.getpid()}_")
+        assert stat.S_IMODE(tmp_dir.stat().st_mode) == 0o700
+        assert tmp_dir.stat().st_uid == os.getuid()
+        module.atexit.register.assert_called_once()
+
+    def test_named_wav_fallback_removes_file(self, whispers2t_engine, tmp_path):
+        """O_TMPFILE が使えない場合は名前付き一時ファイルを使い、終了後に削除することを確認"""
+        whispers2t_engine._tmp_dir = tmp_path
+        whispers2t_engine._supports_tmpfile = False
+        seen = []
+
+        def transcribe_with_vad(audio, **kwargs):
+            if not isinstance(audio[0], str):
+                raise AttributeError("'numpy.ndarray' object has no attribute 'read'")
+            seen.append(audio[0])
+            return [[{"text": "from file"}]]
+
+        whispers2t_engine.model.transcribe_with_vad.side_effect = transcribe_with_vad
+
+        assert whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("from file", 1.0)
+        assert seen[0].startswith(str(tmp_path))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_transcribe_short_audio_skips_model(self, whispers2t_engine):
+        """0.1 秒未満の音声はモデルを呼ばずに空文字を返すことを確認"""
+        assert whispers2t_engine.transcribe(np.zeros(800, dtype=np.float32), 16000) == ("", 1.0)
+        whispers2t_engine.model.transcribe_with_vad.assert_not_called()
+
+    def test_transcribe_async_runs_off_event_loop(self, whispers2t_engine):
+        """transcribe_async はイベントループ外のスレッドで文字起こしすることを確認"""
+        import asyncio
+
+        threads = []
+        original = whispers2t_engine.model.transcribe_with_vad.side_effect
+
+        def transcribe_with_vad(audio, **kwargs):
+            threads.append(threading.current_thread())
+            return original(audio, **kwargs)
+
+        whispers2t_engine.model.transcribe_with_vad.side_effect = transcribe_with_vad
+
+        result = asyncio.run(whispers2t_engine.transcribe_async(np.zeros(16000, dtype=np.float32), 16000))
+
+        assert result == ("chunk0", 1.0)
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_int16_input_converted_into_reused_buffer(self, whispers2t_engine):
+        """float32 以外の入力は作業バッファに変換され、呼び出し間で再利用されることを確認"""
+        audio = np.full(16000, 1000, dtype=np.int16)
+
+        whispers2t_engine.transcribe(audio, 16000)
+        first = whispers2t_engine.model.transcribe_with_vad.call_args.args[0][0]
+        whispers2t_engine.transcribe(audio, 16000)
+        second = whispers2t_engine.model.transcribe_with_vad.call_args.args[0][0]
+
+        arena = whispers2t_engine._get_audio_arena()
+        assert first.dtype == np.float32
+        assert np.shares_memory(first, arena) and np.shares_memory(second, arena)
+        assert np.max(np.abs(second)) == pytest.approx(1.0)
+        assert np.all(audio == 1000)
+
+    def test_audio_longer_than_buffer_is_allocated(self, whispers2t_engine):
+        """作業バッファより長い音声は通常どおり新しい配列に正規化することを確認"""
+        from livecap_cli.engines.whispers2t_engine import AUDIO_ARENA_SAMPLES
+
+        audio = np.full(AUDIO_ARENA_SAMPLES + 1, 2.0, dtype=np.float32)
+
+        whispers2t_engine.transcribe(audio, 16000)
+
+        passed = whispers2t_engine.model.transcribe_with_vad.call_args.args[0][0]
+        assert not np.shares_memory(passed, whispers2t_engine._get_audio_arena())
+        assert np.max(np.abs(passed)) == pytest.approx(1.0)
+        assert np.all(audio == 2.0)
+
+    def test_profiling_selects_timed_path(self):
+        """profile=True の場合のみ計測付きの処理が選択され、結果は同じであることを確認"""
+        from livecap_cli.engines.whispers2t_engine import WhisperS2TEngine
+
+        with patch("livecap_cli.engines.whispers2t_engine.LibraryPreloader.start_preloading"):
+            plain = WhisperS2TEngine(device="cpu", model_size="base")
+            profiled = WhisperS2TEngine(device="cpu", model_size="base", profile=True)
+
+        assert plain._transcribe_single_chunk == plain._transcribe_single_chunk_plain
+        assert profiled._transcribe_single_chunk == profiled._transcribe_single_chunk_profiled
+
+        profiled.model = MagicMock()
+        profiled.model.transcribe_with_vad.return_value = [[{"text": " profiled "}]]
+        profiled._initialized = True
+        with patch.object(profiled, "_log_profiling_results") as log_results:
+            assert profiled.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("profiled", 1.0)
+        assert "inference" in log_results.call_args.args[0]
+
+
+class TestWhisperS2TResample:
+    """WhisperS2T のリサンプルのテスト"""
+
+    def test_resample_to_16k(self, whispers2t_engine):
+        """48kHz の入力を 16kHz の float32 に変換して渡すことを確認"""
+        audio = np.zeros(48000, dtype=np.float64)
+
+        whispers2t_engine.transcribe(audio, 48000)
+
+        passed = whispers2t_engine.model.transcribe_with_vad.call_args.args[0][0]
+        assert passed.dtype == np.float32
+        assert len(passed) == 16000
+
+    @pytest.mark.parametrize("dtype", [np.int16, np.int64, np.float16])
+    def test_resample_accepts_any_numeric_dtype(self, whispers2t_engine, dtype):
+        """soxr が受け付けない dtype の入力も 16kHz の float32 に変換して渡すことを確認"""
+        audio = np.zeros(48000, dtype=dtype)
+
+        whispers2t_engine.transcribe(audio, 48000)
+
+        passed = whispers2t_engine.model.transcribe_with_vad.call_args.args[0][0]
+        assert passed.dtype == np.float32
+        assert len(passed) == 16000
+
+    def test_resample_int16_is_not_requantized(self):
+        """int16 入力のリサンプル結果が整数に丸められないことを確認"""
+        from livecap_cli.engines.whispers2t_engine import _resample
+
+        rng = np.random.default_rng(0)
+        audio = rng.integers(-3, 4, 48000).astype(np.int16)
+
+        resampled, _ = _resample(audio, 48000, 16000)
+        expected, _ = _resample(audio.astype(np.float32), 48000, 16000)
+
+        assert resampled.dtype == np.float32
+        np.testing.assert_allclose(resampled, expected)
+        assert not np.array_equal(resampled, np.round(resampled))
+
+    def test_resample_falls_back_to_scipy(self, monkeypatch):
+        """soxr がない場合は resample_poly で変換することを確認"""
+        import sys
+
+        from livecap_cli.engines.whispers2t_engine import _load_resampler, _resample
+
+        monkeypatch.setitem(sys.modules, "soxr", None)
+        _load_resampler.cache_clear()
+        try:
+            resampled, normalized = _resample(np.zeros(44100, dtype=np.float32), 44100, 16000)
+            assert _load_resampler()[0] is None
+        finally:
+            _load_resampler.cache_clear()
+
+        assert resampled.dtype == np.float32
+        assert len(resampled) == 16000
+        assert normalized is True
+
+    def test_scipy_fallback_matches_resample_poly_and_normalizes(self, monkeypatch):
+        """scipy フォールバックは resample_poly と同じ結果を正規化済みで返すことを確認"""
+        import sys
+
+        from scipy.signal import resample_poly
+
+        from livecap_cli.engines.whispers2t_engine import _load_resampler, _resample
+
+        rng = np.random.default_rng(0)
+        audio = rng.uniform(-4.0, 4.0, 48000)
+        expected = resample_poly(audio, 1, 3) / np.abs(audio).max()
+
+        monkeypatch.setitem(sys.modules, "soxr", None)
+        _load_resampler.cache_clear()
+        try:
+            resampled, _ = _resample(audio, 48000, 16000)
+        finally:
+            _load_resampler.cache_clear()
+
+        np.testing.assert_allclose(resampled, expected, atol=1e-5)
+
+
+class TestWhisperS2TTranscribeBatch:
+    """WhisperS2T のバッチ文字起こしのテスト"""
+
+    def test_transcribe_batch_passes_language_code_per_chunk(self, whispers2t_engine):
+        """lang_codes をチャンク毎に渡すことを確認"""
+        chunks = [np.zeros(16000, dtype=np.float32) for _ in range(3)]
+
+        whispers2t_engine.transcribe_batch(chunks, 16000)
+
+        assert whispers2t_engine.model.transcribe_with_vad.call_args.kwargs["lang_codes"] == ["ja"] * 3
+
+class TestWhisperS2TImport:
+    """whisper_s2t モジュールのインポートのテスト"""
+
+    def test_module_imported_once(self, monkeypatch):
+        """whisper_s2t は一度だけ解決しモジュールグローバルに保持することを確認"""
+        import sys
+        import types
+
+        import livecap_cli.engines.whispers2t_engine as module
+
+        fake = types.ModuleType("whisper_s2t")
+        monkeypatch.setattr(module, "whisper_s2t", None)
+        monkeypatch.setitem(sys.modules, "whisper_s2t", fake)
+
+        assert module._import_whisper_s2t() is fake
+        monkeypatch.delitem(sys.modules, "whisper_s2t")
+        assert module._import_whisper_s2t() is fake
+
+
+class TestWhisperS2TCpuFallback:
+    """cuDNN エラー時の CPU フォールバックのテスト"""
+
+    def test_cudnn_error_retries_with_cached_cpu_model(self, whispers2t_engine, monkeypatch):
+        """cuDNN エラー時はキャッシュ済みの CPU モデルで再試行することを確認"""
+        from livecap_cli.engines.model_memory_cache import ModelMemoryCache
+
+        cpu_model = MagicMock()
+        cpu_model.transcribe_with_vad.return_value = [[{"text": "cpu"}]]
+        cache_key = "whispers2t_base_cpu_int8"
+        ModelMemoryCache.set(cache_key, cpu_model, strong=True)
+        try:
+            whispers2t_engine.device = "cuda"
+            whispers2t_engine.model.transcribe_with_vad.side_effect = RuntimeError("cuDNN failure")
+            gpu_model = whispers2t_engine.model
+
+            assert whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("cpu", 1.0)
+            assert whispers2t_engine.model is gpu_model
+            assert whispers2t_engine.device == "cuda"
+        finally:
+            ModelMemoryCache.clear(cache_key)
+            whispers2t_engine.device = "cpu"
+
+    def test_cpu_retry_does_not_swap_engine_model(self, whispers2t_engine):
+        """CPU での再試行中も self.model / self.device を差し替えないことを確認（並行呼び出し対策）"""
+        from livecap_cli.engines.model_memory_cache import ModelMemoryCache
+
+        gpu_model = whispers2t_engine.model
+        seen = []
+
+        def cpu_transcribe(audio, **kwargs):
+            seen.append((whispers2t_engine.model, whispers2t_engine.device))
+            return [[{"text": "cpu"}]]
+
+        cpu_model = MagicMock()
+        cpu_model.transcribe_with_vad.side_effect = cpu_transcribe
+        cache_key = "whispers2t_base_cpu_int8"
+        ModelMemoryCache.set(cache_key, cpu_model, strong=True)
+        try:
+            whispers2t_engine.device = "cuda"
+            gpu_model.transcribe_with_vad.side_effect = RuntimeError("cuDNN failure")
+
+            assert whispers2t_engine.transcribe(np.zeros(16000, dtype=np.float32), 16000) == ("cpu", 1.0)
+            assert seen == [(gpu_model, "cuda")]
+        finally:
+            ModelMemoryCache.clear(cache_key)
+            whispers2t_engine.device = "cpu"
+
+    def test_preload_starts_only_when_enabled_on_cuda(self, whispers2t_engine):
+        """preload_cpu_fallback 有効時かつ GPU 使用時のみ事前ロードすることを確認"""
+        with patch.object(whispers2t_engine, "_get_cpu_fallback_model") as get_model:
+            whispers2t_engine._configure_model()
+            get_model.assert_not_called()
+
+            whispers2t_engine._preload_cpu_fallback = True
+            whispers2t_engine.device = "cuda"
+            whispers2t_engine._configure_model()
+            whispers2t_engine.device = "cpu"
+
+            for thread in threading.enumerate():
+                if thread.name == "whispers2t-cpu-fallback":
+                    thread.join(timeout=5.0)
+
+            get_model.assert_called_once()
+
+
+    def test_cleanup_before_preload_finishes_does_not_pin_cpu_model(self, whispers2t_engine, monkeypatch):
+        """事前ロード完了前に cleanup した場合、CPU モデルの参照カウントを残さないことを確認"""
+        from livecap_cli.engines import whispers2t_engine as module
+        from livecap_cli.engines.model_memory_cache import ModelMemoryCache
+
+        loading = threading.Event()
+        release = threading.Event()
+        cpu_model = MagicMock()
+
+        def load_model(**kwargs):
+            loading.set()
+            release.wait(5.0)
+            return cpu_model
+
+        monkeypatch.setattr(module, "whisper_s2t", SimpleNamespace(load_model=load_model))
+        cache_key = f"whispers2t_{whispers2t_engine.model_size}_cpu_int8"
+        whispers2t_engine._preload_cpu_fallback = True
+        whispers2t_engine._warmup = False
+        whispers2t_engine.device = "cuda"
+        try:
+            whispers2t_engine._configure_model()
+            thread = whispers2t_engine._preload_thread
+            assert loading.wait(5.0)
+
+            whispers2t_engine.cleanup()
+            release.set()
+            thread.join(timeout=5.0)
+
+            assert not thread.is_alive()
+            assert ModelMemoryCache.ref_count(cache_key) == 0
+            assert whispers2t_engine._cache_keys == []
+            assert whispers2t_engine._cpu_fallback_model is None
+        finally:
+            release.set()
+            ModelMemoryCache.clear(cache_key)
+            whispers2t_engine.device = "cpu"
+
+class TestWhisperS2TComputeType:
+    """compute_type の自動選択のテスト"""
+
+    @pytest.fixture(autouse=True)
+    def reset_probe(self):
+        from livecap_cli.engines.whispers2t_engine import WhisperS2TEngine
+
+        original = WhisperS2TEngine._has_int8_tensor_cores
+        yield
+        WhisperS2TEngine._has_int8_tensor_cores = original
+
+    @pytest.mark.parametrize(
+        "model_size, has_int8, expected",
+        [
+            ("large-v3-turbo", True, "int8_float16"),
+            ("large-v3-turbo", False, "float16"),
+            ("base", True, "float16"),
+        ],
+    )
+    def test_gpu_auto_compute_type(self, whispers2t_engine, model_size, has_int8, expected):
+        """GPU では大型モデルかつ INT8 Tensor Core 搭載時のみ int8_float16 を選ぶことを確認"""
+        from livecap_cli.engines.whispers2t_engine import WhisperS2TEngine
+
+        WhisperS2TEngine._has_int8_tensor_cores = has_int8
+        whispers2t_engine.device = "cuda"
+        whispers2t_engine.model_size = model_size
+
+        assert whispers2t_engine._resolve_compute_type("auto") == expected
+        whispers2t_engine.device = "cpu"
+
+    def test_cpu_auto_and_explicit_compute_type(self, whispers2t_engine):
+        """CPU の auto は int8、明示指定はそのまま使うことを確認"""
+        assert whispers2t_engine._resolve_compute_type("auto") == "int8"
+        assert whispers2t_engine._resolve_compute_type("float32") == "float32"
+
+
+class TestWhisperS2TWarmup:
+    """ロード時のウォームアップのテスト"""
+
+    def test_warmup_runs_on_cuda_without_vad(self, whispers2t_engine):
+        """GPU 使用時は VAD なしの transcribe でダミー推論を 1 回行うことを確認"""
+        whispers2t_engine.device = "cuda"
+        whispers2t_engine._configure_model()
+        whispers2t_engine.device = "cpu"
+
+        whispers2t_engine.model.transcribe.assert_called_once()
+        dummy = whispers2t_engine.model.transcribe.call_args.args[0][0]
+        assert dummy.shape == (16000,)
+        whispers2t_engine.model.transcribe_with_vad.assert_not_called()
+
+    def test_warmup_skipped_on_cpu_or_when_disabled(self, whispers2t_engine):
+        """CPU 使用時や warmup=False ではダミー推論を行わないことを確認"""
+        whispers2t_engine._configure_model()
+
+        whispers2t_engine._warmup = False
+        whispers2t_engine.device = "cuda"
+        whispers2t_engine._configure_model()
+        whispers2t_engine.device = "cpu"
+
+        whispers2t_engine.model.transcribe.assert_not_called()
+
+    def test_warmup_failure_is_ignored(self, whispers2t_engine):
+        """ダミー推論の失敗でロードが失敗しないことを確認"""
+        whispers2t_engine.model.transcribe.side_effect = RuntimeError("boom")
+        whispers2t_engine.device = "cuda"
+
+        whispers2t_engine._configure_model()
+        whispers2t_engine.device = "cpu"
+
+
+class TestWhisperS2TCleanup:
+    """共有モデルの参照カウントとクリーンアップのテスト"""
+
+    def test_empty_cache_only_on_last_release(self, whispers2t_engine, monkeypatch):
+        """同じモデルを共有するエンジンが残る間は CUDA キャッシュを解放しないことを確認"""
+        import sys
+        import types
+
+        from livecap_cli.engines.model_memory_cache import ModelMemoryCache
+
+        fake_torch = types.ModuleType("torch")
+        fake_torch.cuda = MagicMock()
+        monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+        cache_key = "whispers2t_test_shared"
+        model = whispers2t_engine.model
+        ModelMemoryCache.set(cache_key, model, strong=True)
+        assert ModelMemoryCache.get(cache_key) is model
+        # get/set だけでは参照カウントは増えない
+        assert ModelMemoryCache.ref_count(cache_key) == 0
+        ModelMemoryCache.acquire(cache_key)
+        ModelMemoryCache.acquire(cache_key)
+
+        try:
+            whispers2t_engine.device = "cuda"
+            whispers2t_engine._cache_keys = [cache_key]
+            whispers2t_engine.cleanup()
+            fake_torch.cuda.empty_cache.assert_not_called()
+
+            whispers2t_engine.model = model
+            whispers2t_engine._cache_keys = [cache_key]
+            whispers2t_engine.cleanup()
+            fake_torch.cuda.empty_cache.assert_called_once()
+
+            # 参照カウントが 0 になってもキャッシュ自体は保持される
+            assert ModelMemoryCache.exists(cache_key)
+        finally:
+            whispers2t_engine.device = "cpu"
+            ModelMemoryCache.clear(cache_key)
+
+
+class TestWhisperS2TCudnnConfig:
+    """プロセス全体の cuDNN 設定のテスト"""
+
+    def test_env_configured_once(self, monkeypatch):
+        """cuDNN 環境変数はプロセス内で最初のエンジン生成時にだけ設定することを確認"""
+        from livecap_cli.engines.whispers2t_engine import WhisperS2TEngine
+
+        monkeypatch.setattr(WhisperS2TEngine, "_cudnn_env_configured", False)
+        monkeypatch.delenv("CUDNN_BENCHMARK", raising=False)
+
+        with patch("livecap_cli.engines.whispers2t_engine.LibraryPreloader.start_preloading"):
+            WhisperS2TEngine(device="cpu", model_size="base")
+            assert os.environ["CUDNN_BENCHMARK"] == "0"
+
+            monkeypatch.setenv("CUDNN_BENCHMARK", "1")
+            WhisperS2TEngine(device="cpu", model_size="base")
+
+        assert os.environ["CUDNN_BENCHMARK"] == "1"
@@ -48,3 +48,15 @@ def test_diagnostics_exposes_registration(reset_i18n):
     assert diagnostics.translator.metadata.get("provider") == "test"
     assert diagnostics.fallback_count == 1
     assert diagnostics.fallback_keys_sample == ("sample",)
+
+
+def test_generation_advances_on_registration_changes(reset_i18n):
+    start = reset_i18n.generation
+
+    i18n.register_fallbacks({"sample": "value"})
+    after_fallbacks = reset_i18n.generation
+    i18n.register_translator(lambda key, **kwargs: key, name="identity")
+    after_translator = reset_i18n.generation
+    reset_i18n.invalidate()
+
+    assert start < after_fallbacks < after_translator < reset_i18n.generation
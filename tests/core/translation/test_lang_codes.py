@@ -31,6 +31,19 @@ class TestToISO639_1:
         assert to_iso639_1("ZH-TW") == "zh"
         assert to_iso639_1("JA") == "ja"
 
+    def test_repeated_codes_are_cached(self):
+        to_iso639_1("ko-KR")
+        hits = to_iso639_1.cache_info().hits
+        assert to_iso639_1("ko-KR") == "ko"
+        assert to_iso639_1.cache_info().hits == hits + 1
+
+    def test_invalid_code_is_not_cached(self):
+        import langcodes
+
+        for _ in range(2):
+            with pytest.raises(langcodes.LanguageTagError):
+                to_iso639_1("not a code!")
+
 
 class TestNormalizeForGoogle:
     """normalize_for_google のテスト"""
@@ -82,3 +95,14 @@ class TestGetOpusMTModelName:
     def test_with_region_codes(self):
         # Region codes should be normalized
         assert get_opus_mt_model_name("ja-JP", "en-US") == "Helsinki-NLP/opus-mt-ja-en"
+
+
+class TestNormalizeTable:
+    """既知コードの事前計算表のテスト"""
+
+    @pytest.mark.parametrize("code", ["ja", "JA", "zh", "zh-CN", "zh-tw", "ZH-HANT", "pt", "ja-JP"])
+    def test_table_matches_uncached_path(self, code):
+        from livecap_cli.translation.lang_codes import _google_code, _language_name
+
+        assert normalize_for_google(code) == _google_code(code)
+        assert get_language_name(code) == _language_name(code)